@@ -21,6 +21,7 @@ from Util_IO import _save_json
 from PIL import Image
 
 class Card:   
+    thumb_levels = [1/30, 1/15, 1/10, 1/8, 1/4, 1/2, 1]  # Thumbnail scales of the full image, smallest first
 
     def __init__(self, name, slug, hotscore, img_url, rarity, type_,
                  subTypes, elements, elements_count, cost, thresholds,
@@ -29,10 +30,7 @@ class Card:
         self.slug = slug
         self.hotscore = hotscore
         self.image_url = self.check_img_url(name, img_url)
-        self.image_thumbs: Optional[List[pygame.Surface]] = []
-        self.thumb_levels = [1/30, 1/15, 1/10, 1/8, 1/4, 1/2, 1] 
         self.position: Tuple[int, int] = (-1, -1)
-        self.scaled_surfaces = {} 
 
         self.rareity = rarity
         self.type = type_
@@ -251,20 +249,6 @@ class Card:
             return f"https://card.cards.army/cards/{missing_cards[name]}.webp"
         return img_url
     	
-    def set_scaled_surfaces(self, img: Image.Image):
-        if self.image_thumbs is None:
-            self.image_thumbs = []
-            
-        if len(self.image_thumbs) != 0:
-            self.image_thumbs = []
-            
-        for scale in self.thumb_levels:
-            w, h = int(img.width * scale), int(img.height * scale)
-            resized = img.resize((w, h), Image.Resampling.LANCZOS)
-            raw = resized.tobytes("raw", "RGBA")
-            surf = pygame.image.frombytes(raw, (w, h), "RGBA").convert_alpha()
-            self.image_thumbs.append(surf)
-
     @staticmethod
     def print_group(grouped):
         print(f"[DEBUG] grouped (elements): {len(grouped)}")
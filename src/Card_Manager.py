@@ -1,40 +1,81 @@
 import json
 import os
 from Curiosa_API import CuriosaAPI
-from typing import Dict, Any, Optional, Generator, List, Tuple
-from Util_IO import _save_json, CARD_ASSETS_PATH
+from typing import Dict, Any, Optional, Generator, Iterable, List, Set, Tuple, Mapping
+from Util_IO import _save_json, _content_hash, CARD_ASSETS_PATH
 import time
 from Card import Card
 from Sorcery_API import SorceryAPI
-from Util_IO import BASE_DATA_PATH, ALL_CARD_DATA_PATH
+from Util_IO import BASE_DATA_PATH, ALL_CARD_DATA_PATH, CARD_SNAPSHOT_PATH, CARD_PAYLOAD_PATH, MIP_PACK_PATH, MIP_INDEX_PATH
+from Util_Card_Snapshot import load_snapshot, write_snapshot
+from Image_Pipeline import Image_Pipeline
+from Util_Mip_Pack import Mip_Pack
+from Texture_Manager import Texture_Manager, surfaces_from_levels
 import queue
 import threading
 import requests
+from Util_HTTP import http_get
 from PIL import Image
 from io import BytesIO
 import pygame
 import Layout_Manager as LM
+from Util_Spatial_Index import Spatial_Index
 from collections import defaultdict
 import math
+import Util_Config as config
+
+
+def _image_source(curiosa_data: Dict[str, Any]) -> Optional[str]:
+    # The image url is built from the slug alone, see build_card_data
+    return curiosa_data.get("slug")
 
 
 class Card_Manager:
     def __init__(self):
         self.loading = True
         self.cards: Dict[str, Card] = {}
-        self.card_data_lookup: Dict[str, Dict[str, Any]] = {}
+        self.card_data_lookup: Mapping[str, Mapping[str, Any]] = {}  # Card_Data_Lookup when loaded from the snapshot
+        self.card_hashes: Dict[str, str] = {}  # Card name -> content hash of its sorcery and curiosa payloads
         self.cards_loaded = 0
+        self.spatial_index = Spatial_Index()
+        self.catalog_updates = queue.Queue()  # (cards, card_data_lookup) rebuilt in the background, applied on the main thread
+        self.mip_pack = Mip_Pack(MIP_PACK_PATH, MIP_INDEX_PATH, Card.thumb_levels, config.MIP_PACK_MAX_SCALE)
+        self.textures = Texture_Manager(self.mip_pack.packed_levels, config.TEXTURE_BUDGET_MB * 1024 * 1024,
+                                        config.ATLAS_MAX_SCALE)
+        self.textures.loader = self.request_image_levels
+        self.loading_images = False  # Images submitted to the pipeline and not yet all handed off
+        self.image_pipeline = Image_Pipeline(CARD_ASSETS_PATH, config.IMAGE_FETCH_WORKERS, config.IMAGE_DECODE_WORKERS,
+                                             config.IMAGE_FETCH_QUEUE_SIZE, config.IMAGE_READY_QUEUE_SIZE)
 
-        # Wait until API data is loaded
-        while not SorceryAPI.have_loaded_cards:
-            time.sleep(1)
-        while not CuriosaAPI.have_loaded_cards:
-            time.sleep(1)
+        # --- Load card data files from the last run ---
+        Base_CardData = self.load_card_data_files()
+        self.cards = {cd["name"]: Card.from_card_data(cd) for cd in Base_CardData}
+        self.initialize_card_positions()  # Final layout up front so images can load in view order
+
+        if config.LAZY_STARTUP:
+            # --- Open with the local card data now, check the APIs in the background ---
+            print(f"📁 Loaded {len(self.cards)} cards from local card data, checking for updates in the background...")
+            self.catalog_thread = threading.Thread(target=self.catalog_update_worker, args=(Base_CardData,), daemon=True)
+            self.catalog_thread.start()
+        else:
+            update = self.check_catalog(Base_CardData)
+            if update:
+                cards, self.card_data_lookup, self.card_hashes, changed = update
+                self.remove_stale_images(changed)
+                self.cards = cards
+                self.initialize_card_positions()
+            
+        # --- With cards loaded, start downloading images ---
+        self.start_image_download(list(self.cards.values()))
+
+    def load_card_data_files(self) -> List[Dict[str, Any]]:
+        if self.snapshot_is_current():
+            snapshot = load_snapshot(CARD_SNAPSHOT_PATH, CARD_PAYLOAD_PATH)
+            if snapshot:
+                Base_CardData, self.card_data_lookup, self.card_hashes = snapshot
+                print(f"📁 Loaded {len(Base_CardData)} cards from card snapshot.")
+                return Base_CardData
 
-        sorcery_cards = SorceryAPI.all_cards
-        curiosa_cards = CuriosaAPI.all_cards
-        
-        # --- Load or build card data file ---
         if os.path.exists(BASE_DATA_PATH):
             with open(BASE_DATA_PATH, "r", encoding="utf-8") as f:
                 Base_CardData = json.load(f)
@@ -46,34 +87,132 @@ class Card_Manager:
                 self.card_data_lookup = json.load(f)
         else:
             self.card_data_lookup = {}
+        self.card_hashes = {name: _content_hash(entry.get("sorcery_data"), entry.get("curiosa_data"))
+                            for name, entry in self.card_data_lookup.items()}
+
+        # --- Snapshot the JSON so the next launch skips parsing it ---
+        if Base_CardData:
+            Base_CardData, self.card_data_lookup = self.save_snapshot(Base_CardData, self.card_data_lookup, self.card_hashes)
+        return Base_CardData
+
+    def snapshot_is_current(self) -> bool:
+        # A snapshot older than the JSON files was written before they were last rebuilt or edited
+        if not os.path.exists(CARD_SNAPSHOT_PATH):
+            return False
+        snapshot_time = os.path.getmtime(CARD_SNAPSHOT_PATH)
+        return all(os.path.getmtime(path) <= snapshot_time
+                   for path in (BASE_DATA_PATH, ALL_CARD_DATA_PATH) if os.path.exists(path))
+
+    def save_snapshot(self, Base_CardData: List[Dict[str, Any]], card_data_lookup: Mapping, card_hashes: Dict[str, str]) -> Tuple[List[Dict[str, Any]], Mapping]:
+        """Write the card snapshot and swap to its lazy lookup, keeps the given data if that fails"""
+        if write_snapshot(Base_CardData, card_data_lookup, card_hashes, CARD_SNAPSHOT_PATH, CARD_PAYLOAD_PATH):
+            snapshot = load_snapshot(CARD_SNAPSHOT_PATH, CARD_PAYLOAD_PATH)
+            if snapshot:
+                return snapshot[0], snapshot[1]
+        return Base_CardData, card_data_lookup
+
+    def check_catalog(self, Base_CardData: List[Dict[str, Any]]) -> Optional[Tuple[Dict[str, Card], Mapping[str, Mapping[str, Any]], Dict[str, str], Dict[str, bool]]]:
+        """Check the APIs against the local card data, returns (cards, card_data_lookup, card_hashes, changed) if anything changed"""
+        SorceryAPI.check_card_list()
+        CuriosaAPI.check_card_list()
+        SorceryAPI.loaded.wait()
+        CuriosaAPI.loaded.wait()
+        if not (SorceryAPI.have_loaded_cards and CuriosaAPI.have_loaded_cards):
+            print("⚠️ Card APIs unavailable, keeping local card data")
+            return None
+
+        sorcery_cards = SorceryAPI.all_cards
+        curiosa_cards = CuriosaAPI.all_cards
 
         print(f"SorceryAPI cards: {len(sorcery_cards)}")
         print(f"CuriosaAPI cards: {len(curiosa_cards)}")
         print(f"CardData cards:   {len(Base_CardData)}")
         print(f"All cards:        {len(self.card_data_lookup)}")
 
-        # --- If all datasets align in length, use file ---
-        if (len(sorcery_cards) == len(curiosa_cards) == len(Base_CardData) == len(self.card_data_lookup)):
+        # --- Compare per-card content hashes, only changed cards get rebuilt ---
+        Base_CardData, card_data_lookup, card_hashes, changed = self.build_card_data(
+            sorcery_cards, curiosa_cards, self.card_data_lookup, self.card_hashes)
+        if not changed and card_hashes.keys() == self.card_hashes.keys():
             print("✅ Card data files are up to date, reticulating cards...")
-            self.cards = {cd["name"]: Card.from_card_data(cd) for cd in Base_CardData}
-        else:
-            print("🛠️ Data mismatch or missing files, rebuilding card data with latest API data...")
-            Base_CardData = self.build_card_data(sorcery_cards, curiosa_cards)
-            _save_json(self.card_data_lookup, ALL_CARD_DATA_PATH)
-            _save_json(Base_CardData, BASE_DATA_PATH)
-            print("✅ Card data files are up to date")
-            
-        # --- With cards loaded, start downloading images ---
-        self.download_queue = queue.Queue()
-        for card in self.cards.values():
-            self.download_queue.put((card))
-        self.download_thread = threading.Thread(target=self.image_download_worker, daemon=True)
-        self.download_thread.start()
+            return None
+
+        removed = len(self.card_hashes.keys() - card_hashes.keys())
+        print(f"🛠️ {len(changed)} new or changed cards, {removed} removed, updating card data files...")
+        _save_json(card_data_lookup, ALL_CARD_DATA_PATH)
+        _save_json(Base_CardData, BASE_DATA_PATH)
+        Base_CardData, card_data_lookup = self.save_snapshot(Base_CardData, card_data_lookup, card_hashes)
+        print("✅ Card data files are up to date")
+
+        # Unchanged cards keep their Card object along with its images and position
+        current_cards = self.cards
+        cards = {}
+        for cd in Base_CardData:
+            name = cd["name"]
+            cards[name] = current_cards[name] if name not in changed and name in current_cards else Card.from_card_data(cd)
+        return cards, card_data_lookup, card_hashes, changed
+
+    def catalog_update_worker(self, Base_CardData: List[Dict[str, Any]]):
+        try:
+            update = self.check_catalog(Base_CardData)
+        except Exception as e:
+            print(f"❌ Background card data check failed: {e}")
+            return
+        if update:
+            self.catalog_updates.put(update)
+
+    def apply_catalog_update(self) -> List[Card]:
+        """Hot-swap a card catalog rebuilt in the background, called from the main loop.
+        Returns the Card objects that were replaced or removed so their render caches can be dropped"""
+        try:
+            cards, card_data_lookup, card_hashes, changed = self.catalog_updates.get_nowait()
+        except queue.Empty:
+            return []
 
-    def build_card_data(self, sorcery_data: List[Dict[str, Any]], curiosa_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        replaced = [card for name, card in self.cards.items() if name in changed or name not in cards]
+        # Only new cards and cards whose image changed need their image (re)loaded
+        to_load = [cards[name] for name, image_changed in changed.items() if image_changed or name not in self.cards]
+        for name in self.cards.keys() - cards.keys():
+            self.spatial_index.remove((name, None, None, None))
+        self.remove_stale_images(changed)
+        for card in replaced:
+            if changed.get(card.name) or card.name not in cards:
+                self.textures.invalidate(card)
+
+        self.cards = cards
+        self.card_data_lookup = card_data_lookup
+        self.card_hashes = card_hashes
+        print(f"🔄 Swapped in updated card data ({len(changed)} new or changed cards)")
+
+        self.initialize_card_positions()
+        if to_load:
+            self.start_image_download(to_load)
+        return replaced
+
+    def remove_stale_images(self, changed: Dict[str, bool]):
+        # Cached image files are named after the image url, so an updated image would otherwise never be downloaded
+        for name, image_changed in changed.items():
+            card = self.cards.get(name)
+            if not image_changed or card is None:
+                continue
+            filename = os.path.join(CARD_ASSETS_PATH, os.path.basename(card.image_url))
+            if os.path.exists(filename):
+                os.remove(filename)
+
+    def build_card_data(self, sorcery_data: List[Dict[str, Any]], curiosa_data: List[Dict[str, Any]],
+                        previous_lookup: Optional[Mapping] = None, previous_hashes: Optional[Dict[str, str]] = None
+                        ) -> Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]], Dict[str, str], Dict[str, bool]]:
+        """Merge the API data into card data, reusing previous card data whose content hash is unchanged.
+        Returns (card_data_list, card_data_lookup, card_hashes, changed) where changed maps each new or
+        updated card name to whether its image changed. The content hash also covers volatile fields
+        such as hotscore, those only rebuild the card data and never touch the cached image"""
+        previous_lookup = previous_lookup or {}
+        previous_hashes = previous_hashes or {}
         # Build lookup from curiosa_data by name
         curiosa_lookup = {card["name"]: card for card in curiosa_data}
         card_data_list = []
+        card_data_lookup = {}
+        card_hashes = {}
+        changed = {}
 
         for s_card in sorcery_data:
             name = s_card.get("name")
@@ -84,6 +223,16 @@ class Card_Manager:
                 print(f"❌ Missing curiosa data for {name}")
                 continue
 
+            card_hash = _content_hash(s_card, c_card)
+            card_hashes[name] = card_hash
+            if previous_hashes.get(name) == card_hash and name in previous_lookup:
+                card_data = previous_lookup[name]["card_data"]
+                card_data_list.append(card_data)
+                card_data_lookup[name] = {"sorcery_data": s_card, "curiosa_data": c_card, "card_data": card_data}
+                continue
+            previous = previous_lookup.get(name)
+            changed[name] = previous is not None and _image_source(previous["curiosa_data"]) != _image_source(c_card)
+
             guardian = s_card.get("guardian", {})
             thresholds = guardian.get("thresholds", {})
 
@@ -128,42 +277,118 @@ class Card_Manager:
             }
 
             card_data_list.append(card_data)
-            self.card_data_lookup[name] = {
+            card_data_lookup[name] = {
                 "sorcery_data": s_card,
                 "curiosa_data": c_card,
                 "card_data": card_data
             }
-
-            card = Card.from_card_data(card_data)
-            self.cards[card.name] = card
             
-        return card_data_list
-
-    def image_download_worker(self):
-        while not self.download_queue.empty():
-            card: Card = self.download_queue.get()
-            try:
-                filename = os.path.join(CARD_ASSETS_PATH, os.path.basename(card.image_url))
-                if os.path.exists(filename):
-                    with open(filename, "rb") as f:
-                        img_data = f.read()
-                else:
-                    response = requests.get(card.image_url, timeout=5)
-                    img_data = response.content
-                    with open(filename, "wb") as f:
-                        f.write(img_data)
-                
-                img = Image.open(BytesIO(img_data)).convert("RGBA")
-                card.set_scaled_surfaces(img)
-                card.position = ((self.cards_loaded % 25) * LM.GRID_SPACING * LM.LONG_EDGE_SNAP_RATIO,
-                                 (self.cards_loaded // 25) * LM.GRID_SPACING * LM.LONG_EDGE_SNAP_RATIO)
-                self.cards_loaded += 1
-            except Exception as e:
-                print(f"Error loading card {getattr(card, 'name', 'unknown')}: {e}")
-            self.download_queue.task_done()
-
-        self.loading = False
-        self.initialize_card_positions()
+        return card_data_list, card_data_lookup, card_hashes, changed
+
+    def start_image_download(self, cards: List[Card]):
+        """Make the small thumb levels of cards resident, larger levels are loaded when drawn"""
+        self.loading = True
+        self.loading_images = True
+        # --- Small levels come straight from the mapped mip pack, the rest is decoded ---
+        to_decode = []
+        for card in cards:
+            filename = os.path.join(CARD_ASSETS_PATH, os.path.basename(card.image_url))
+            content_hash = self.mip_pack.lookup(filename)
+            if content_hash is None:
+                to_decode.append((card, self.mip_pack.packed_levels))
+                continue
+            had_texture = self.textures.has(card)
+            self.textures.set_small(card, self.mip_pack.surfaces(content_hash))
+            if not had_texture:
+                self.place_loaded_card(card)
+        self.image_pipeline.submit(to_decode)
+
+    def request_image_levels(self, card: Card, scales: List[float]):
+        # Texture_Manager asks for a large level the first time a card is drawn big enough to need it
+        self.image_pipeline.submit([(card, scales)])
+
+    def prefetch_image_levels(self, names: Iterable[str], target_width: int):
+        """Ask for the large level cards will need at target_width before they scroll into view,
+        the view priority puts these cull margin loads after the on-screen ones."""
+        if not self.textures.needs_large(target_width):
+            return
+        for name in names:
+            card = self.cards.get(name)
+            if card is not None:
+                self.textures.prefetch(card, target_width)
+
+    def place_loaded_card(self, card: Card):
+        # Cards are already laid out, this only drives the loading progress
+        self.cards_loaded += 1
+
+    def update_view_priority(self, visible: Set[str], viewport_rect: List[float], cull_rect: List[float]):
+        """Re-rank image loads for the current view, called by the GUI when the view moves.
+        On-screen cards load first, then cards in the cull margin, then the rest in rings around
+        the middle of the screen. Within a ring the most popular card goes first.
+        Installed even while the pipeline is idle, so loads queued later follow the same order."""
+        min_x, max_x, min_y, max_y = cull_rect
+        center_x = (viewport_rect[0] + viewport_rect[1]) / 2
+        center_y = (viewport_rect[2] + viewport_rect[3]) / 2
+        # One ring per half cull rect, so hotscore orders the cards at a similar distance
+        ring_size = max(max_x - min_x, max_y - min_y, 1.0) / 2
+
+        def priority(card: Card, scales: List[float]) -> Tuple:
+            x, y = card.position
+            if card.name in visible:
+                tier = 0
+            elif min_x <= x <= max_x and min_y <= y <= max_y:
+                tier = 1
+            else:
+                tier = 2
+            distance = math.hypot(x - center_x, y - center_y)
+            return (tier, int(distance // ring_size), -(card.hotscore or 0), distance)
+
+        self.image_pipeline.set_priority(priority)
+
+    def process_loaded_images(self, budget_ms: float = config.IMAGE_HANDOFF_BUDGET_MS) -> int:
+        """Turn decoded images into surfaces, called from the main loop.
+        Stops once budget_ms is spent (after at least one image) so streaming never drops a frame,
+        the rest waits in the pipeline's ready queue for the next frame. Returns the images handed off"""
+        deadline = time.perf_counter() + budget_ms / 1000
+        handed_off = 0
+        while True:
+            ready = self.image_pipeline.poll(1)
+            if not ready:
+                break
+            self.hand_off_image(*ready[0])
+            handed_off += 1
+            if time.perf_counter() >= deadline:
+                break
+
+        if self.loading_images and self.image_pipeline.idle():
+            self.loading_images = False
+            self.loading = False
+            self.mip_pack.flush()
+            stats = self.image_pipeline.stats()
+            print("🖼️ Loaded {delivered} card images ({downloaded} downloaded, {download_mb:.1f} MB, {retried} retries, {failed} failed) "
+                  "in {elapsed:.1f}s, {deliver_per_s:.0f} cards/s".format(**stats))
+        return handed_off
+
+    def hand_off_image(self, card: Card, scales: List[float], levels, image_key):
+        # All levels of a card are swapped in together, the renderer never sees half a card
+        if levels is None:
+            self.textures.request_failed(card, scales)
+            return
+        surfaces = surfaces_from_levels(levels)
+        if scales != self.mip_pack.packed_levels:
+            for scale, surface in zip(scales, surfaces):
+                self.textures.add_large(card, scale, surface)
+            return
+        had_texture = self.textures.has(card)
+        self.textures.set_small(card, surfaces)
+        if not had_texture:
+            self.place_loaded_card(card)
+        self.mip_pack.add(image_key, levels)
+
+    def set_card_position(self, card: Card, position: Tuple[int, int]):
+        # Base cards are keyed like base selections: (card_name, None, None, None)
+        card.position = position
+        self.spatial_index.insert((card.name, None, None, None), position)
 
     def initialize_card_positions(self):
         # --- Automatically group and layout all base cards when loaded ---
@@ -269,7 +494,7 @@ class Card_Manager:
                         x = type_start_x + col * card_width + top_left[0]
                         y = rarity_y_offset + row * card_height + top_left[1]
                         
-                        card.position = (x, y)
+                        self.set_card_position(card, (x, y))
                     
                     # Move down by the max height of this rarity band
                     max_rows = max_rows_per_rarity[rarity_key]
@@ -358,7 +583,7 @@ class Card_Manager:
                     x = type_start_x + col * card_width + top_left[0]
                     y = rarity_y_offset + row * card_height + top_left[1]
                     
-                    card.position = (x, y)
+                    self.set_card_position(card, (x, y))
                 
                 # Move down by the max height of this rarity band
                 max_rows = max_rows_per_rarity[rarity_key]
@@ -8,6 +8,7 @@ from Levenshtein import distance as levenshtein_distance
 class Collection:
     def __init__(self):
         self.cards: Dict[str, Dict[str, Any]] = {}
+        self.version = 0  # Bumped on every add, so views of the collection know to refresh
 
     def add_card(self, name: str, count: int = 1, set_name="Unknown", finish="Unknown", product="Unknown"):
         if name not in self.cards:
@@ -15,6 +16,7 @@ class Collection:
                 "total_quantity": 0,
                 "entries": []
             }
+        self.version += 1
 
         self.cards[name]["total_quantity"] += count
 
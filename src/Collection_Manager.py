@@ -9,10 +9,25 @@ from Deck_Manager import Deck_Manager
 
 class Collection_Manager:
     def __init__(self, card_manager: Card_Manager, deck_manager: Deck_Manager):
-        self.collection = None
+        self._collection = None
+        self._loads = 0  # Bumped whenever a collection is loaded, see version
         self.deck_manager = deck_manager
         self.card_manager = card_manager
         self.gui_manager = None  # Will be set by GUI_Manager
+
+    @property
+    def collection(self):
+        return self._collection
+
+    @collection.setter
+    def collection(self, collection):
+        self._collection = collection
+        self._loads += 1
+
+    @property
+    def version(self):
+        """Changes whenever the collection is replaced or a card is added to it."""
+        return (self._loads, self._collection.version if self._collection is not None else -1)
         
     def set_gui_manager(self, gui_manager):
         """Set reference to GUI manager for notifications"""
@@ -4,13 +4,15 @@ import re
 import time
 import json
 import requests
+from Util_HTTP import http_get
 from typing import Dict, Any, Optional, Generator, List, Tuple
 from urllib.parse import urlencode, quote
 from playwright.sync_api import sync_playwright
 import random
 from queue import Queue, Empty
 import threading
-from Util_IO import CURIOSA_API, CURIOSA_DATA_PATH, DATA_PATH, _save_json
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from Util_IO import CURIOSA_API, CURIOSA_DATA_PATH, CURIOSA_FETCH_PROGRESS_PATH, DATA_PATH, TMP_PATH, _save_json, _content_hash
 from bs4 import BeautifulSoup
 from Util_Debug import DebugDisplay
 import csv
@@ -18,19 +20,27 @@ import Levenshtein
 import pygame
 from tqdm import tqdm
 
+# Card list fetch tuning
+FETCH_START_CONCURRENCY = 4
+FETCH_MAX_CONCURRENCY = 8
+FETCH_MIN_PAGE_SIZE = 30
+FETCH_MAX_PAGE_SIZE = 100
+FETCH_MAX_RETRIES = 5
+FETCH_MAX_RETRY_DELAY = 30.0
+
 
 class CuriosaAPI:
     buildID: Optional[str] = None  # Static class variable
-    card_queue = Queue()
     all_cards: List[Dict[str, Any]] = []
     thread = None
     online_card_count = -1 
     have_loaded_cards = False
+    loaded = threading.Event()  # Set once check_card_list has finished, whether or not it succeeded
         
     @staticmethod
     def fetch_build_id() -> str | None:
         try:
-            response = requests.get("https://curiosa.io", headers={"User-Agent": "Mozilla/5.0"})
+            response = http_get("https://curiosa.io", headers={"User-Agent": "Mozilla/5.0"})
             response.raise_for_status()
 
             # Look for a line like: /_next/static/<build_id>/_buildManifest.js
@@ -73,7 +83,7 @@ class CuriosaAPI:
         deck_id = CuriosaAPI._extract_deck_id(deck_id)
         
         web_url = f"https://curiosa.io/decks/{deck_id}"
-        web_response = requests.get(web_url)
+        web_response = http_get(web_url)
         if web_response.ok:
             soup = BeautifulSoup(web_response.text, "html.parser")
             deck_name = soup.title.string.strip() if soup.title and soup.title.string else "Unknown Deck"
@@ -93,7 +103,7 @@ class CuriosaAPI:
             f"?batch=1&input={quote(json.dumps(query))}"
         )
 
-        response = requests.get(url, headers=CuriosaAPI._headerInfo(f"/decks/{deck_id}"))
+        response = http_get(url, headers=CuriosaAPI._headerInfo(f"/decks/{deck_id}"))
         
         if response.ok:
             try:
@@ -135,7 +145,7 @@ class CuriosaAPI:
             f"?batch=1&input={quote(json.dumps(query))}"
         )
         
-        response = requests.get(url, headers=CuriosaAPI._headerInfo("/cards"))
+        response = http_get(url, headers=CuriosaAPI._headerInfo("/cards"))
         if response.ok:
             try:
                 data = response.json()
@@ -153,11 +163,12 @@ class CuriosaAPI:
         return -1
 
     @staticmethod
-    def fetch_nth_of_i_cards(n: int, i: int) -> Tuple[Optional[List[Dict[str, Any]]], Optional[str], Optional[str]]:
+    def fetch_card_page(cursor: int, limit: int) -> Tuple[Optional[List[Dict[str, Any]]], requests.Response | None]:
+        """Fetch up to limit cards starting at cursor, returns (cards or None on failure, response)"""
         query = {
             "0": {"json": {"query": "", "sort": "relevance", "set": "*",
-                           "filters": [], "limit": i, "variantLimit": False,
-                           "cursor": n * i, "direction": "forward"}
+                           "filters": [], "limit": limit, "variantLimit": False,
+                           "cursor": cursor, "direction": "forward"}
                   }
         }
         url = (
@@ -165,86 +176,226 @@ class CuriosaAPI:
             "card.search"
             f"?batch=1&input={quote(json.dumps(query))}"
         )
-        
-        response = requests.get(url, headers=CuriosaAPI._headerInfo("/cards"))
+
+        try:
+            response = http_get(url, headers=CuriosaAPI._headerInfo("/cards"), timeout=15)
+        except requests.RequestException as e:
+            print(f"❌ card search request failed at cursor {cursor}: {e}")
+            return None, None
         if response.ok:
             try:
                 data = response.json()
-                print()
                 if not isinstance(data, list):
                     print("❌ Unexpected card search format")
-                    return None, None, None
-                
-                cards = data[0]["result"]["data"]["json"]["cards"]
-                rate_limit = response.headers.get("x-ratelimit-limit")
-                rate_remaining = response.headers.get("x-ratelimit-remaining")
-                return cards, rate_limit, rate_remaining
+                    return None, response
+                return data[0]["result"]["data"]["json"]["cards"], response
 
             except Exception as e:
                 print(f"❌ Failed to parse card search JSON: {e}")
         else:
-            print(f"❌ card search fetch failed: {response.status_code}")
-            print(response.text)
-            
-        return None, None, None
-    
+            print(f"❌ card search fetch failed at cursor {cursor}: {response.status_code}")
+        return None, response
+
     @staticmethod
-    def fetch_all_cards() -> Generator[Dict[str, Any], None, None]:
-        card_fetch_limit = 30
+    def fetch_nth_of_i_cards(n: int, i: int) -> Tuple[Optional[List[Dict[str, Any]]], Optional[str], Optional[str]]:
+        cards, response = CuriosaAPI.fetch_card_page(cursor=n * i, limit=i)
+        if response is None:
+            return cards, None, None
+        return cards, response.headers.get("x-ratelimit-limit"), response.headers.get("x-ratelimit-remaining")
+
+    @staticmethod
+    def _retry_delay(response: requests.Response | None, attempt: int) -> float:
+        # Prefer the server's own hint, otherwise back off exponentially with jitter
+        if response is not None:
+            for header in ("retry-after", "x-ratelimit-reset"):
+                value = response.headers.get(header)
+                try:
+                    delay = float(value)
+                except (TypeError, ValueError):
+                    continue
+                if delay > 1e9:  # Epoch timestamp rather than seconds
+                    delay -= time.time()
+                return min(max(delay, 0.5), FETCH_MAX_RETRY_DELAY)
+        return min(2 ** attempt + random.random(), FETCH_MAX_RETRY_DELAY)
+
+    @staticmethod
+    def _load_fetch_progress(total: int) -> Dict[int, List[Dict[str, Any]]]:
+        if not os.path.exists(CURIOSA_FETCH_PROGRESS_PATH):
+            return {}
+        try:
+            with open(CURIOSA_FETCH_PROGRESS_PATH, "r", encoding="utf-8") as f:
+                progress = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Ignoring unreadable Curiosa fetch progress: {e}")
+            return {}
+        if progress.get("total") != total:
+            print("⚠️ Online card count changed since the last fetch, starting over.")
+            return {}
+        pages = {int(cursor): cards for cursor, cards in progress.get("pages", {}).items()}
+        print(f"⏯️ Resuming Curiosa fetch with {sum(len(c) for c in pages.values())}/{total} cards already fetched.")
+        return pages
+
+    @staticmethod
+    def _save_fetch_progress(total: int, pages: Dict[int, List[Dict[str, Any]]]):
+        os.makedirs(TMP_PATH, exist_ok=True)
+        tmp_path = CURIOSA_FETCH_PROGRESS_PATH + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"total": total, "pages": pages}, f, ensure_ascii=False)
+        os.replace(tmp_path, CURIOSA_FETCH_PROGRESS_PATH)
+
+    @staticmethod
+    def fetch_all_cards() -> Optional[List[Dict[str, Any]]]:
+        """
+        Fetch the full card list with several page requests in flight.
+        Concurrency and page size follow the x-ratelimit headers: plenty of budget adds a worker,
+        a low budget drops workers and asks for bigger pages. Completed pages are saved to tmp
+        so a failed run resumes where it stopped. Returns None if the list could not be completed.
+        """
         total = CuriosaAPI.fetch_total_card_count()
         print(f"🔢 Total cards: {total}")
+        if total < 0:
+            return None
 
-        for batch_num in range((total + card_fetch_limit - 1) // card_fetch_limit):
-            try:
-                cards, rate_limit, rate_remaining = CuriosaAPI.fetch_nth_of_i_cards(n=batch_num, i=card_fetch_limit)
-                if cards is None:
-                    print(f"❌ No cards fetched for batch {batch_num}")
+        pages = CuriosaAPI._load_fetch_progress(total)
+
+        # Cursor ranges still to fetch, as [start, end) plus the time a retry may go out
+        pending: List[Tuple[int, int, float]] = []
+        cursor = 0
+        for start in sorted(pages):
+            if start > cursor:
+                pending.append((cursor, start, 0.0))
+            cursor = max(cursor, start + len(pages[start]))
+        if cursor < total:
+            pending.append((cursor, total, 0.0))
+
+        concurrency = FETCH_START_CONCURRENCY
+        page_size = FETCH_MIN_PAGE_SIZE
+        server_page_limit = FETCH_MAX_PAGE_SIZE  # Lowered if the server returns short pages
+        failures = 0
+        started = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=FETCH_MAX_CONCURRENCY) as pool:
+            in_flight: Dict[Any, Tuple[int, int]] = {}
+            while pending or in_flight:
+                now = time.perf_counter()
+                while len(in_flight) < concurrency:
+                    # Next range whose retry time has come, delayed ones wait without blocking the rest
+                    ready = next((i for i, item in enumerate(pending) if item[2] <= now), None)
+                    if ready is None:
+                        break
+                    start, end, _ = pending.pop(ready)
+                    size = min(page_size, end - start)
+                    if start + size < end:
+                        pending.insert(ready, (start + size, end, 0.0))
+                    in_flight[pool.submit(CuriosaAPI.fetch_card_page, start, size)] = (start, start + size)
+
+                if not in_flight:
+                    # Only delayed retries left
+                    time.sleep(max(0.0, min(item[2] for item in pending) - now))
                     continue
-                
-                print(f"📦 Batch {batch_num} → Fetched {len(cards)} cards")
-
-                for card in cards:
-                    yield card  # live yield to caller
+                waiting = [item[2] for item in pending if item[2] > now]
+                timeout = max(0.0, min(waiting) - now) if waiting and len(in_flight) < concurrency else None
+                done, _ = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    start, end = in_flight.pop(future)
+                    cards, response = future.result()
+
+                    if cards is not None and not cards:
+                        # An empty page inside [0, total) means the total shrank or the page failed
+                        latest = CuriosaAPI.fetch_total_card_count()
+                        if 0 <= latest <= start:
+                            print(f"🔢 Total cards changed to {latest}")
+                            total = latest
+                            pending = [item for item in pending if item[0] < total]
+                            continue
+                        cards = None
 
-                # optional: also yield intermediate stats
-                print(f"  ⏳ Rate remaining: {rate_limit}/{rate_remaining}")
-            except Exception as e:
-                print(f"❌ Failed batch {batch_num}: {e}")
-                break
+                    if cards is None:
+                        failures += 1
+                        if failures > FETCH_MAX_RETRIES:
+                            pending.insert(0, (start, end, 0.0))
+                            continue
+                        concurrency = max(1, concurrency // 2)
+                        delay = CuriosaAPI._retry_delay(response, failures)
+                        pending.insert(0, (start, end, time.perf_counter() + delay))
+                        print(f"  ⏳ Retrying cursor {start} in {delay:.1f}s with {concurrency} workers")
+                        continue
+
+                    failures = 0
+                    pages[start] = cards
+                    CuriosaAPI._save_fetch_progress(total, pages)
+                    if len(cards) < end - start:
+                        # Short page, the server caps the page size below what we asked for
+                        server_page_limit = min(server_page_limit, len(cards))
+                        pending.insert(0, (start + len(cards), end, 0.0))
+                    print(f"📦 Cursor {start} → Fetched {len(cards)} cards")
+
+                    # --- Adapt to the remaining rate-limit budget ---
+                    try:
+                        limit = int(response.headers.get("x-ratelimit-limit"))
+                        remaining = int(response.headers.get("x-ratelimit-remaining"))
+                    except (TypeError, ValueError):
+                        continue
+                    if remaining <= len(in_flight) + 1:
+                        concurrency = 1
+                        page_size = server_page_limit
+                    elif remaining < limit * 0.25:
+                        concurrency = max(1, concurrency // 2)
+                        page_size = min(server_page_limit, int(page_size * 1.5))
+                    elif remaining > limit * 0.5:
+                        concurrency = min(FETCH_MAX_CONCURRENCY, concurrency + 1)
+                    page_size = min(page_size, server_page_limit)
+
+                if failures > FETCH_MAX_RETRIES:
+                    for future in in_flight:
+                        future.cancel()
+                    print(f"❌ Giving up after {failures} failed requests, progress is saved for the next run.")
+                    return None
 
-            time.sleep(1 + random.random())
+        all_cards = [card for start in sorted(pages) if start < total for card in pages[start]]
+        if len(all_cards) < total:
+            print(f"❌ Only {len(all_cards)} of {total} cards fetched, progress is saved for the next run.")
+            return None
+        print(f"✅ Fetched {len(all_cards)} cards in {time.perf_counter() - started:.1f}s")
+        if os.path.exists(CURIOSA_FETCH_PROGRESS_PATH):
+            os.remove(CURIOSA_FETCH_PROGRESS_PATH)
+        return all_cards
 
     @classmethod
     def background_card_fetch(cls):
         try:
-            for card in cls.fetch_all_cards():
-                cls.card_queue.put(card)
-
-            while True:
-                try:
-                    card = cls.card_queue.get(timeout=2)
-                    cls.all_cards.append(card)
-                    if len(cls.all_cards) == cls.online_card_count:
-                        print("✅ Card list complete. Saving to file.")
-                        _save_json(cls.all_cards, CURIOSA_DATA_PATH)
-                        break
-                    
-                except Empty:
-                    if not cls.thread or not cls.thread.is_alive():
-                        print("🛑 Done: thread finished and queue empty.")
-                        break
-                    else:
-                        print(f"⏳ Waiting for more cards... got {len(cls.all_cards)}/{cls.online_card_count} cards.")
-
+            cards = cls.fetch_all_cards()
         except Exception as e:
             print(f"❌ Unexpected top-level error in background fetch: {type(e).__name__}: {e}")
-        
-        print("✅ Local Curiosa card list is up to date.")
-        CuriosaAPI.have_loaded_cards = True
+            cards = None
+
+        if cards is None:
+            if cls.all_cards and len(cls.all_cards) == cls.online_card_count:
+                # Only the edit check failed, the local list is still complete
+                print("⚠️ Could not re-check the Curiosa cards, keeping local card list.")
+                CuriosaAPI.have_loaded_cards = True
+            else:
+                print("❌ Curiosa card list incomplete, keeping local card list.")
+        else:
+            local_hashes = cls.card_hashes(cls.all_cards)
+            online_hashes = cls.card_hashes(cards)
+            if local_hashes != online_hashes:
+                changed = sum(1 for name, h in online_hashes.items() if local_hashes.get(name) != h)
+                removed = len(local_hashes.keys() - online_hashes.keys())
+                print(f"🔄 Curiosa card list changed: {changed} new or updated, {removed} removed. Saving to file.")
+                cls.all_cards.clear()
+                cls.all_cards.extend(cards)
+                _save_json(cls.all_cards, CURIOSA_DATA_PATH)
+            print("✅ Local Curiosa card list is up to date.")
+            CuriosaAPI.have_loaded_cards = True
+        CuriosaAPI.loaded.set()
+
+    @staticmethod
+    def card_hashes(cards: List[Dict[str, Any]]) -> Dict[str, str]:
+        return {card.get("name"): _content_hash(card) for card in cards}
         
     @staticmethod
     def rebuild_card_list():
-        CuriosaAPI.all_cards.clear()
         CuriosaAPI.thread = threading.Thread(target=CuriosaAPI.background_card_fetch)
         CuriosaAPI.thread.daemon = True
         CuriosaAPI.thread.start()
@@ -265,14 +416,21 @@ class CuriosaAPI:
             print(f"🌐 Online card count: {CuriosaAPI.online_card_count}")
         except Exception as e:
             print(f"❌ Failed to fetch online card count: {e}")
+            CuriosaAPI.loaded.set()
             return
 
+        if CuriosaAPI.online_card_count < 0:
+            print("❌ Could not get the online card count, keeping local Curiosa card list.")
+            CuriosaAPI.loaded.set()
+            return
+
+        # Cards can be edited without the count changing, so the list is always fetched and compared
+        # per card hash like SorceryAPI (the paged fetch runs in the background and resumes on failure)
         if len(CuriosaAPI.all_cards) != CuriosaAPI.online_card_count:
             print("🔄 Card count mismatch. Rebuilding Curiosa card list...")
-            CuriosaAPI.rebuild_card_list()
         else:
-            print("✅ Local Curiosa card list is up to date.")
-            CuriosaAPI.have_loaded_cards = True
+            print("🔍 Card count matches, checking the Curiosa cards for edits...")
+        CuriosaAPI.rebuild_card_list()
     
     @staticmethod  # NOT USED
     def fetch_csv_collection_NOTUSED(path: str, card_data_lookup: Dict[str, Dict[str, Any]], force_update: bool = False):
@@ -519,7 +677,7 @@ class CuriosaAPI:
             f"?batch=1&input={quote(json.dumps(query))}"
         )
 
-        response = requests.get(url, headers=self._loggedIn_headers("/collection"))
+        response = http_get(url, headers=self._loggedIn_headers("/collection"))
         if response.ok:
             try:
                 return response.json()
@@ -541,7 +699,7 @@ class CuriosaAPI:
             f"?batch=1&input={quote(json.dumps(query))}"
         )
 
-        response = requests.get(url, headers=self._loggedIn_headers("/collection"))
+        response = http_get(url, headers=self._loggedIn_headers("/collection"))
         if response.ok:
             try:
                 data = response.json()
@@ -568,7 +726,7 @@ class CuriosaAPI:
             f"?batch=1&input={quote(json.dumps(query))}"
         )
 
-        response = requests.get(url, headers=self._loggedIn_headers("/users"))
+        response = http_get(url, headers=self._loggedIn_headers("/users"))
         if response.ok:
             try:
                 data = response.json()
@@ -614,7 +772,3 @@ class CuriosaAPI:
 
 if __name__ == "__main__":
     user = CuriosaAPI()
-
-
-# Automatically check and fetch cards in background at import time
-CuriosaAPI.check_card_list()
\ No newline at end of file
@@ -1,5 +1,7 @@
-from typing import List, Dict, Any, TypedDict, Tuple
+from typing import List, Dict, Any, TypedDict, Tuple, Optional
 from Card import Card
+from Util_Spatial_Index import Spatial_Index
+from Deck_Entries import Deck_Entries
 
 
 class Deck:
@@ -13,6 +15,11 @@ class Deck:
             "maybeboard": {},
             "avatar": {},
         }
+        # board -> name -> copies, each copy a dict of its variant info and "id", its stable instance id in
+        # self.entries, which is also the last part of its spatial / selection key (name, deck id, board, id)
+        self.entries = Deck_Entries()  # Positions of every copy, by instance id
+        self.spatial_index: Optional[Spatial_Index] = None  # Set while the deck is placed on the grid
+        self.version = 0  # Bumped on every entry change, derived geometry is cached against it
 
     @classmethod
     def from_json(cls, name: str, author: str, id: str, json_data: Dict[str, Any]) -> "Deck":
@@ -55,13 +62,16 @@ class Deck:
     def add_card(self, board: str, name: str, position: Tuple[int, int],
                 set_name="Unknown", finish="Unknown", product="Unknown", category="Unknown"):
         entry = {
-            "position": position,
+            "id": self.entries.add(position),
             "kind": category,
             "set_name": set_name,
             "finish": finish,
             "product": product
         }
         self.deck.setdefault(board, {}).setdefault(name, []).append(entry)
+        self.version += 1
+        if self.spatial_index is not None:
+            self.spatial_index.insert((name, self.id, board, entry["id"]), position)
         
     def remove_card(self, board: str, name: str, position: Tuple[int, int]):
         entries = self.deck.get(board, {}).get(name)
@@ -70,10 +80,85 @@ class Deck:
             return
 
         for i, entry in enumerate(entries):
-            if entry["position"] == position:
-                del entries[i]
+            if self.position(entry) == position:
+                self.remove_entry(board, name, i)
                 break
 
+    def remove_entry(self, board: str, name: str, index: int):
+        entries = self.deck[board][name]
+        entry_id = entries[index]["id"]
+        self.entries.remove(entry_id)
+        del entries[index]
+        self.version += 1
+        if self.spatial_index is not None:
+            self.spatial_index.remove((name, self.id, board, entry_id))
+        if not entries:
+            del self.deck[board][name]
+
+    def touch(self):
+        """Mark the entries changed after editing self.deck directly."""
+        self.version += 1
+
+    def replace_entries(self, other: "Deck"):
+        """Take over another deck's copies and positions, e.g. when reloading a saved deck.
+        The copies get fresh instance ids from this deck, so no key of a replaced copy can match one of them."""
+        if self.spatial_index is not None:
+            self.spatial_index.remove_where(lambda key: key[1] == self.id)
+        for entry_id in list(self.entries.rows):
+            self.entries.remove(entry_id)
+        for board_data in other.deck.values():
+            for entries in board_data.values():
+                for entry in entries:
+                    entry["id"] = self.entries.add(other.position(entry))
+        self.deck = other.deck
+        self.touch()
+        self._sync_index()
+
+    def position(self, entry: Dict[str, Any]) -> Tuple[int, int]:
+        return self.entries.position(entry["id"])
+
+    # --- Whole-deck operations, one array operation each ---
+    def place_entries(self, entries: List[Dict[str, Any]], positions: List[Tuple[int, int]]):
+        """Write the positions of many copies at once, e.g. a freshly laid out board."""
+        self.entries.set_positions([entry["id"] for entry in entries], positions)
+        self.touch()
+        self._sync_index()
+
+    def translate(self, dx: float, dy: float):
+        self.entries.translate(dx, dy)
+        self.touch()
+        self._sync_index()
+
+    def move_entries(self, entry_ids: List[int], dx: float, dy: float, grid: float):
+        """Move some copies by the same offset and snap them to the grid, e.g. a dropped selection."""
+        self.entries.translate(dx, dy, entry_ids)
+        self.entries.snap(grid, entry_ids)
+        self.touch()
+        self._sync_index()
+
+    def bounding_box(self) -> Optional[Tuple[int, int, int, int]]:
+        return self.entries.bbox()
+
+    def attach_index(self, spatial_index: Spatial_Index):
+        """Register every entry in the spatial index and keep it updated as positions change."""
+        self.detach_index()
+        self.spatial_index = spatial_index
+        self._sync_index()
+
+    def _sync_index(self):
+        if self.spatial_index is None:
+            return
+        for board, board_data in self.deck.items():
+            for name, entries in board_data.items():
+                for entry in entries:
+                    self.spatial_index.insert((name, self.id, board, entry["id"]), self.position(entry))
+
+    def detach_index(self):
+        if self.spatial_index is None:
+            return
+        self.spatial_index.remove_where(lambda key: key[1] == self.id)
+        self.spatial_index = None
+
     def move_card(self, from_board: str, to_board: str, name: str, position: Tuple[int, int]):
         if from_board not in self.deck or to_board not in self.deck:
             print(f"One or both boards '{from_board}' and '{to_board}' not found")
@@ -83,14 +168,23 @@ class Deck:
 
     def update_position(self, board: str, name: str, position: Tuple[int, int], pos_index: int):
         try:
-            self.deck[board][name][pos_index]["position"] = position
+            entry_id = self.deck[board][name][pos_index]["id"]
+            self.entries.set_position(entry_id, position)
+            self.version += 1
+            if self.spatial_index is not None:
+                self.spatial_index.insert((name, self.id, board, entry_id), position)
         except (KeyError, IndexError):
             print(f"Failed to update position: {name} on {board} at index {pos_index}")
 
+    def get_entry_index(self, board: str, name: str, entry_id: int) -> int:
+        """Index of the copy with instance id entry_id, -1 if it is not in the deck."""
+        entries = self.deck.get(board, {}).get(name, [])
+        return next((i for i, entry in enumerate(entries) if entry["id"] == entry_id), -1)
+
     def get_pos_index(self, board: str, name: str, position: Tuple[int, int]) -> int:
         try:
             entries = self.deck[board][name]
-            return next((i for i, entry in enumerate(entries) if entry["position"] == position), -1)
+            return next((i for i, entry in enumerate(entries) if self.position(entry) == position), -1)
         except KeyError:
             print(f"Board '{board}' or card '{name}' not found")
             return -1
@@ -106,7 +200,7 @@ class Deck:
 
             return min(
                 enumerate(entries),
-                key=lambda pair: dist_sq(pair[1]["position"])
+                key=lambda pair: dist_sq(self.position(pair[1]))
             )[0]
         except KeyError:
             print(f"Board '{board}' or card '{name}' not found")
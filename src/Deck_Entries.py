@@ -0,0 +1,85 @@
+'''
+Array-backed position table for the card copies of one deck.
+Every copy gets a stable instance id when it is added (never reused within the deck) and one row
+in NumPy columns, so moving, snapping, placing and measuring a whole deck are single array
+operations instead of a walk over board -> name -> entry dicts.
+Rows are packed: removing a copy swaps the last row into its place, ids stay put.
+'''
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+import numpy as np
+
+
+def as_position(x: float, y: float) -> Tuple[float, float]:
+    # Whole numbers come back as ints, the way positions were stored before the table (and in saved JSON)
+    return (int(x) if x.is_integer() else x, int(y) if y.is_integer() else y)
+
+
+class Deck_Entries:
+    def __init__(self, capacity: int = 64):
+        self.ids = np.zeros(capacity, dtype=np.int64)
+        self.positions = np.zeros((capacity, 2), dtype=np.float64)
+        self.rows: Dict[int, int] = {}  # Instance id -> row
+        self.next_id = 0
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __contains__(self, entry_id: int):
+        return entry_id in self.rows
+
+    def add(self, position: Tuple[float, float]) -> int:
+        row = len(self.rows)
+        if row == len(self.ids):
+            self.ids = np.resize(self.ids, row * 2)
+            self.positions = np.resize(self.positions, (row * 2, 2))
+        entry_id = self.next_id
+        self.next_id += 1
+        self.rows[entry_id] = row
+        self.ids[row] = entry_id
+        self.positions[row] = position
+        return entry_id
+
+    def remove(self, entry_id: int):
+        row = self.rows.pop(entry_id, None)
+        if row is None:
+            return
+        last = len(self.rows)
+        if row != last:
+            moved = int(self.ids[last])
+            self.ids[row] = moved
+            self.positions[row] = self.positions[last]
+            self.rows[moved] = row
+
+    def position(self, entry_id: int) -> Tuple[float, float]:
+        x, y = self.positions[self.rows[entry_id]].tolist()
+        return as_position(x, y)
+
+    def set_position(self, entry_id: int, position: Tuple[float, float]):
+        self.positions[self.rows[entry_id]] = position
+
+    def set_positions(self, entry_ids: Sequence[int], positions) -> None:
+        """Bulk write, positions is anything shaped (len(entry_ids), 2)."""
+        if len(entry_ids):
+            self.positions[self._rows(entry_ids)] = positions
+
+    def translate(self, dx: float, dy: float, entry_ids: Optional[Iterable[int]] = None):
+        """Move every copy (or just entry_ids) by the same offset."""
+        rows = slice(0, len(self.rows)) if entry_ids is None else self._rows(entry_ids)
+        self.positions[rows] += (dx, dy)
+
+    def snap(self, grid: float, entry_ids: Iterable[int]):
+        """Round the entry_ids copies to the nearest grid point."""
+        rows = self._rows(entry_ids)
+        self.positions[rows] = np.round(self.positions[rows] / grid) * grid
+
+    def bbox(self) -> Optional[Tuple[float, float, float, float]]:
+        """(min_x, min_y, max_x, max_y) of the copies' top-left corners, None when empty."""
+        n = len(self.rows)
+        if not n:
+            return None
+        low = self.positions[:n].min(axis=0).tolist()
+        high = self.positions[:n].max(axis=0).tolist()
+        return as_position(*low) + as_position(*high)
+
+    def _rows(self, entry_ids: Iterable[int]) -> np.ndarray:
+        return np.fromiter((self.rows[entry_id] for entry_id in entry_ids), dtype=np.int64)
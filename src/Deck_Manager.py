@@ -5,6 +5,7 @@ from Curiosa_API import CuriosaAPI
 import os
 from Util_IO import _save_json, DECK_PATH
 from Deck import Deck
+from Deck_Registry import Deck_Registry
 from typing import Tuple
 from Card_Manager import Card_Manager
 import Layout_Manager as LM
@@ -23,7 +24,7 @@ class Deck_Manager:
     GRID_WIDTH = 45  # supports 15 site cards or 22 portrait cards wide (45 grid units)
     
     def __init__(self):
-        self.decks: List[Deck] = []
+        self.decks = Deck_Registry(self.get_board_regions())
         self.gui_manager = None  # Will be set by GUI_Manager
     
     @classmethod
@@ -250,6 +251,8 @@ class Deck_Manager:
         # Adjust grid width to fit within available space
         max_cards_per_row = available_width // grid_unit
         
+        # Positions are collected and written to the deck in one go at the end
+        placed, positions = [], []
         for card_name, card_data in sorted_cards:
             try:
                 entries = card_data["entries"]
@@ -287,9 +290,9 @@ class Deck_Manager:
                         print(f"Warning: Cards in {board_name} exceed region height")
                         break
                     
-                    # Place the card
-                    deck.update_position(board_name, card_name, (current_x, current_y), 
-                                       deck.get_pos_index(board_name, card_name, entry["position"]))
+                    # Place the card (written with the rest of the board below)
+                    placed.append(entry)
+                    positions.append((current_x, current_y))
                     
                     # Debug output for card placement
                     if card_type == "site":
@@ -306,6 +309,7 @@ class Deck_Manager:
             except Exception as e:
                 print(f"Warning: Error placing card '{card_name}' in grid: {e}")
                 continue
+        deck.place_entries(placed, positions)
     
     def _get_deck_elements(self, deck: Deck, card_lookup: Dict[str, Any]) -> set:
         """Get unique elements in the deck (excluding avatar)"""
@@ -379,7 +383,7 @@ class Deck_Manager:
         for board_name, board_data in deck.deck.items():
             for card_name, entries in board_data.items():
                 for entry in entries:
-                    lowest_y = max(lowest_y, entry["position"][1])
+                    lowest_y = max(lowest_y, deck.position(entry)[1])
         
         # Place sideboard (10 columns wide)
         sideboard_y = lowest_y + card_spacing_y + group_padding
@@ -396,6 +400,7 @@ class Deck_Manager:
         current_x, current_y = start_x, start_y
         cards_in_current_row = 0
         
+        placed, positions = [], []
         for card_name, entries in deck.deck.get(board_name, {}).items():
             # Check if card matches the element and type criteria
             if not self._card_matches_criteria(card_name, elements, card_types):
@@ -407,11 +412,12 @@ class Deck_Manager:
                     current_y += spacing_y
                     cards_in_current_row = 0
                 
-                deck.update_position(board_name, card_name, (current_x, current_y), 
-                                   deck.get_pos_index(board_name, card_name, entry["position"]))
+                placed.append(entry)
+                positions.append((current_x, current_y))
                 
                 current_x += spacing_x
                 cards_in_current_row += 1
+        deck.place_entries(placed, positions)
     
     def _card_matches_criteria(self, card_name: str, elements: list, card_types: list) -> bool:
         """Check if a card matches the element and type criteria"""
@@ -429,6 +435,7 @@ class Deck_Manager:
         if board_name not in deck.deck:
             return
             
+        placed, positions = [], []
         for card_name, entries in deck.deck[board_name].items():
             for entry in entries:
                 if cards_in_current_row >= columns:
@@ -436,11 +443,12 @@ class Deck_Manager:
                     current_y += spacing_y
                     cards_in_current_row = 0
                 
-                deck.update_position(board_name, card_name, (current_x, current_y), 
-                                   deck.get_pos_index(board_name, card_name, entry["position"]))
+                placed.append(entry)
+                positions.append((current_x, current_y))
                 
                 current_x += spacing_x
                 cards_in_current_row += 1
+        deck.place_entries(placed, positions)
     
     def _place_deck_standard(self, deck: Deck, position: Tuple[int, int], card_manager: Card_Manager):
         """Original standard deck placement logic"""
@@ -472,6 +480,7 @@ class Deck_Manager:
         # Place cards by type groups in order: minions, magic, aura/artifact, sites
         type_order = ["minion", "magic", "aura", "site"]
         
+        placed, positions = [], []
         for card_type in type_order:
             if card_type not in grouped_cards:
                 continue
@@ -496,8 +505,8 @@ class Deck_Manager:
                             cards_in_current_row = 0
                         
                         # Update card position
-                        deck.update_position("mainboard", card_name, (current_x, current_y), 
-                                           deck.get_pos_index("mainboard", card_name, entry["position"]))
+                        placed.append(entry)
+                        positions.append((current_x, current_y))
                         
                         current_x += spacing_x
                         cards_in_current_row += 1
@@ -508,6 +517,7 @@ class Deck_Manager:
             # Move to next type group
             current_x = start_x + card_spacing_x + group_padding
             current_y += spacing_y + group_padding
+        deck.place_entries(placed, positions)
         
         # Calculate the total width used by mainboard for sideboard/maybeboard positioning
         mainboard_width = current_x - start_x
@@ -563,6 +573,7 @@ class Deck_Manager:
         cards_per_row = mainboard_width // spacing_x
         
         cards_in_current_row = 0
+        placed, positions = [], []
         for card_name, entries in deck.deck[board_name].items():
             for entry in entries:
                 if cards_in_current_row >= cards_per_row:
@@ -570,11 +581,12 @@ class Deck_Manager:
                     current_y += spacing_y
                     cards_in_current_row = 0
                 
-                deck.update_position(board_name, card_name, (current_x, current_y), 
-                                   deck.get_pos_index(board_name, card_name, entry["position"]))
+                placed.append(entry)
+                positions.append((current_x, current_y))
                 
                 current_x += spacing_x
                 cards_in_current_row += 1
+        deck.place_entries(placed, positions)
     
     def move_deck(self, deck: Deck, position: Tuple[int, int]):
         """
@@ -584,14 +596,8 @@ class Deck_Manager:
         new_x, new_y = position
         
         # Find current avatar position as reference
-        avatar_pos = None
-        if "avatar" in deck.deck and deck.deck["avatar"]:
-            avatar_cards = list(deck.deck["avatar"].keys())
-            if avatar_cards:
-                avatar_name = avatar_cards[0]
-                avatar_entries = deck.deck["avatar"][avatar_name]
-                if avatar_entries:
-                    avatar_pos = avatar_entries[0]["position"]
+        geometry = self.decks.geometry(deck)
+        avatar_pos = geometry["avatar"] if geometry else None
         
         if not avatar_pos:
             print("No avatar found to use as reference position")
@@ -602,20 +608,16 @@ class Deck_Manager:
         offset_y = new_y - avatar_pos[1]
         
         # Move all cards by the calculated offset
-        for board_name, board_data in deck.deck.items():
-            for card_name, entries in board_data.items():
-                for i, entry in enumerate(entries):
-                    current_pos = entry["position"]
-                    new_pos = (current_pos[0] + offset_x, current_pos[1] + offset_y)
-                    deck.update_position(board_name, card_name, new_pos, i)
+        deck.translate(offset_x, offset_y)
     
-    def group_type(self, card_type: str, card_name: str, entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def group_type(self, deck: Deck, card_type: str, card_name: str, entries: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Group cards by type and element"""
         grouped = {}
         
         for entry in entries:
-            if entry["position"] not in grouped:
-                grouped[entry["position"]] = []
-            grouped[entry["position"]].append(entry)
+            position = deck.position(entry)
+            if position not in grouped:
+                grouped[position] = []
+            grouped[position].append(entry)
         
         return grouped
\ No newline at end of file
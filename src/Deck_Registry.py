@@ -0,0 +1,89 @@
+'''
+Registry of the loaded decks.
+Decks are kept in load order and indexed by id (and name), so finding a deck is a dict lookup
+rather than a scan of every deck. Each deck's derived geometry - its anchor (the avatar, else the
+first card), the stacked board region rects and the bounding box of its cards - is cached against
+the deck's version and only recomputed after that deck's entries change.
+'''
+from typing import Any, Dict, Iterator, Optional, Tuple
+from Deck import Deck
+import Layout_Manager as LM
+
+BOARD_ORDER = ("mainboard", "sideboard", "maybeboard")  # Stacked top to bottom below the anchor
+
+
+class Deck_Registry:
+    def __init__(self, board_regions: Dict[str, Dict[str, int]]):
+        self.board_regions = board_regions
+        self._decks: Dict[str, Deck] = {}        # id -> deck, in load order
+        self._names: Dict[str, Deck] = {}        # name -> first deck loaded with that name
+        self._geometry: Dict[str, Tuple[int, Optional[Dict[str, Any]]]] = {}  # id -> (deck version, geometry)
+
+    def __iter__(self) -> Iterator[Deck]:
+        return iter(list(self._decks.values()))
+
+    def __len__(self):
+        return len(self._decks)
+
+    def __contains__(self, deck_id: str):
+        return deck_id in self._decks
+
+    def get(self, deck_id: Optional[str]) -> Optional[Deck]:
+        return self._decks.get(deck_id)
+
+    def get_by_name(self, name: str) -> Optional[Deck]:
+        return self._names.get(name)
+
+    def append(self, deck: Deck):
+        """Add a deck, replacing any deck already loaded with the same id."""
+        old = self._decks.get(deck.id)
+        if old is not None and self._names.get(old.name) is old:
+            del self._names[old.name]
+        self._decks[deck.id] = deck
+        self._names.setdefault(deck.name, deck)
+        self._geometry.pop(deck.id, None)
+
+    def remove(self, deck: Deck):
+        if self._decks.get(deck.id) is not deck:
+            return
+        del self._decks[deck.id]
+        self._geometry.pop(deck.id, None)
+        if self._names.get(deck.name) is deck:
+            del self._names[deck.name]
+            for other in self._decks.values():
+                self._names.setdefault(other.name, other)
+
+    def geometry(self, deck: Deck) -> Optional[Dict[str, Any]]:
+        """Cached {"avatar", "anchor", "regions": {board: (min_x, min_y, max_x, max_y)}, "bbox"},
+        None for a deck without any cards."""
+        cached = self._geometry.get(deck.id)
+        if cached is None or cached[0] != deck.version:
+            cached = self._geometry[deck.id] = (deck.version, self._compute_geometry(deck))
+        return cached[1]
+
+    def _compute_geometry(self, deck: Deck) -> Optional[Dict[str, Any]]:
+        bbox = deck.bounding_box()
+        if bbox is None:
+            return None
+        avatar = None
+        for entries in deck.deck.get("avatar", {}).values():
+            if entries:
+                avatar = deck.position(entries[0])
+            break
+
+        # Without an avatar the first card anchors the deck
+        anchor = avatar
+        for board_data in deck.deck.values():
+            for entries in board_data.values():
+                if anchor is None and entries:
+                    anchor = deck.position(entries[0])
+
+        # Regions start at the anchor minus the region padding (cards are inset from the region edge)
+        start_x = anchor[0] - LM.REGION_PADDING
+        board_y = anchor[1] - LM.REGION_PADDING
+        regions = {}
+        for board in BOARD_ORDER:
+            width, height = self.board_regions[board]["width"], self.board_regions[board]["height"]
+            regions[board] = (start_x, board_y, start_x + width, board_y + height)
+            board_y += height
+        return {"avatar": avatar, "anchor": anchor, "regions": regions, "bbox": bbox}
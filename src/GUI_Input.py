@@ -0,0 +1,46 @@
+'''
+Per-frame input coalescing.
+A fast mouse or trackpad can queue dozens of MOUSEMOTION and MOUSEWHEEL events between two
+frames, each of which would run the full pan / drag / zoom logic. Every unbroken run of them is
+folded into one motion event (final position, summed rel) and one wheel event (summed scroll,
+plus the zoom in / out tick counts), while buttons, keys and everything else keep their order.
+'''
+from typing import List
+import pygame
+
+COALESCED_TYPES = (pygame.MOUSEMOTION, pygame.MOUSEWHEEL)
+
+
+def coalesce_events(events: List[pygame.event.Event]) -> List[pygame.event.Event]:
+    result: List[pygame.event.Event] = []
+    run: List[pygame.event.Event] = []
+    for event in events:
+        if event.type in COALESCED_TYPES:
+            run.append(event)
+            continue
+        result += _fold(run)
+        run = []
+        result.append(event)
+    result += _fold(run)
+    return result
+
+
+def _fold(run: List[pygame.event.Event]) -> List[pygame.event.Event]:
+    """One motion and one wheel event for a run, in the order each type first appeared."""
+    motions = [event for event in run if event.type == pygame.MOUSEMOTION]
+    wheels = [event for event in run if event.type == pygame.MOUSEWHEEL]
+    folded = []
+    if motions:
+        rel = (sum(event.rel[0] for event in motions), sum(event.rel[1] for event in motions))
+        folded.append((run.index(motions[0]), pygame.event.Event(pygame.MOUSEMOTION, {**motions[-1].dict, "rel": rel})))
+    if wheels:
+        # Each raw wheel event is one zoom tick, whatever its size (as before coalescing)
+        zoom_in = sum(1 for event in wheels if event.y > 0)
+        folded.append((run.index(wheels[0]), pygame.event.Event(pygame.MOUSEWHEEL, {
+            **wheels[-1].dict,
+            "x": sum(event.x for event in wheels),
+            "y": sum(event.y for event in wheels),
+            "zoom_in": zoom_in,
+            "zoom_out": len(wheels) - zoom_in,
+        })))
+    return [event for _, event in sorted(folded, key=lambda item: item[0])]
@@ -9,6 +9,14 @@ from Deck_Manager import Deck_Manager
 from Collection_Manager import Collection_Manager
 import Layout_Manager as LM
 from GUI_Sidebar import Sidebar
+from GUI_Surface_Cache import Surface_Cache
+from GUI_Selection import Selection
+from GUI_Input import coalesce_events
+from GUI_Render_List import Render_List, FLAG_SELECTED, FLAG_OWNED, FLAG_MISSING
+from GUI_Tile_Cache import Tile_Cache
+from GUI_Overlay import Region_Overlay
+from Util_Text_Cache import text_cache
+from Texture_Manager import Texture_Manager
 from GUI_Themes import Modern_theme
 from Util_IO import _save_json
 from Deck import Deck
@@ -16,6 +24,9 @@ from Card import Card
 import time
 import threading
 import queue
+import Util_Config as config
+import Util_HTTP
+import numpy as np
 
 
 class GUI_Manager:
@@ -38,6 +49,7 @@ class GUI_Manager:
         self.draw_ui()
         self.clock = pygame.time.Clock()
         self.font = pygame.font.SysFont("Arial", 24)
+        self.surface_cache = Surface_Cache(self.card_manager.textures, config.SURFACE_CACHE_MAX_MB * 1024 * 1024)
 
         self.zoom = 1.0
         self.offset_x = 0
@@ -47,24 +59,40 @@ class GUI_Manager:
         self.spinner_angle = 0
         self.viewport_rect = [-1, 1, -1, 1]
         self.cull_rect = [-1, 1, -1, 1]
+        self.prioritized_viewport = None  # Viewport the image load order was last ranked for
 
         self.grid_offset = (0, 0)  # offset in world units (not pixels)
 
-        self.visible_cards = {}
+        self.render_list = Render_List()  # Every card instance on the canvas, follows the spatial index
+        self.visible_rows = np.zeros(0, dtype=np.intp)  # Render list rows in view, in draw order
+        self.debug_lines: List[str] = []  # Debug overlay text, refreshed every DEBUG_REFRESH_S
+        self.debug_lines_time = 0.0
+        self.lod_swatches: Dict[Tuple, pygame.Surface] = {}  # (colour, size) -> flat card for the far zoom tier
+        self.region_overlay = Region_Overlay()  # Clipped region fills and cached labels
+        self.tile_cache = Tile_Cache(config.TILE_CACHE_MAX_MB * 1024 * 1024)  # Grid and base cards, pre-rendered
+        self.static_tiles_drawn = False  # This frame's grid and base cards came from the tile cache
+        self.tiles_pending = False       # Tiles in or around the view still to be built
+        self.last_change = time.perf_counter()  # Last input or content change, for frame pacing
+        self.event_counts = (0, 0)  # Events queued / handled after coalescing, last frame
+        self.texture_cursor = 0          # Position in the Texture_Manager change log already applied to the tiles
+        self.slug_names: Dict[str, str] = {}
+        self.slug_names_source = None    # Card dict slug_names was built from
         self.selected_card_index = None
         self.selected_deck = None
         self.selected_board = None
-        self.selected_entry_index = None
+        self.selected_entry_id = None
         self.dragging_card = False
         self.drag_offset = (0, 0)
         
         self.selection_box = None  # (start_x, start_y, end_x, end_y)
-        # Updated selection structure: List of (card_name, deck_id, board_name, entry_index, position) tuples
+        # Selected card instances keyed by spatial key, iterates as (card_name, deck_id, board_name, entry_id, position)
         # For base cards: (card_name, None, None, None, position)
-        # For deck cards: (card_name, deck_id, board_name, entry_index, position)
-        self.selected_cards: List[Tuple[str, Optional[str], Optional[str], Optional[int], Tuple[int, int]]] = []
+        # For deck cards: (card_name, deck_id, board_name, entry_id, position), entry_id the copy's stable instance id
+        self.selected_cards = Selection()
+        self.selection_version = -1  # Selection version last pushed to the render list
         self.original_positions = {}  # Track original positions when dragging starts
         self.drag_anchor_card = None  # Track which card was clicked for dragging
+        self.drag_delta = None  # World translation of the selection mid-drag, written back on drop
         self.shift_held = False
         self.alt_held = False
         self.ctrl_held = False
@@ -92,9 +120,19 @@ class GUI_Manager:
         self.background_operation_message = ""
         self.background_operation_progress = 0.0  # 0.0 to 1.0
       
+    def grid_step(self) -> int:
+        """Grid line spacing in world units, only the major lines once zoomed out"""
+        return LM.GRID_SPACING * (config.GRID_MAJOR_EVERY if self.zoom < config.LOD_MID_ZOOM else 1)
+
+    def lod_tier(self) -> str:
+        """'far': flat colour cards, 'mid': unsmoothed atlas thumbnails, 'near': smoothscaled images"""
+        if self.zoom < config.LOD_FAR_ZOOM:
+            return "far"
+        return "mid" if self.zoom < config.LOD_MID_ZOOM else "near"
+
     def draw_grid(self):
-        spacing_h = LM.GRID_SPACING  # world units
-        spacing_v = LM.GRID_SPACING  # world units
+        spacing_h = self.grid_step()  # world units
+        spacing_v = self.grid_step()  # world units
         color = self.grid_color
 
         # Grid offset in world space
@@ -122,164 +160,64 @@ class GUI_Manager:
 
     def draw_bounding_boxes(self, surface: pygame.Surface):
         # Draw base bounding box (300 units larger)
+        overlay = self.region_overlay
         if self.base_bounding_box:
-            min_x, min_y, max_x, max_y = self.base_bounding_box
-            rect = pygame.Rect(
-                min_x * self.zoom + self.offset_x,
-                min_y * self.zoom + self.offset_y,
-                (max_x - min_x) * self.zoom,
-                (max_y - min_y) * self.zoom,
-            )
-            s = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-            s.fill((100, 100, 100, 40))  # semi-transparent
-            surface.blit(s, rect.topleft)
-            pygame.draw.rect(surface, (100, 100, 255), rect, 3)
-            self.window.blit(self.font.render("Base", True, (100, 100, 255)), (rect.left + 8, rect.top + 4))
+            rect = self.world_rect_to_screen(self.base_bounding_box)
+            overlay.region(surface, rect, (100, 100, 100, 40), (100, 100, 255), 3)  # semi-transparent
+            if rect.colliderect(surface.get_clip()):
+                surface.blit(overlay.label("Base", (100, 100, 255), 24), (rect.left + 8, rect.top + 4))
         # Draw element boxes for base cards
-        element_colors = {
-            "Air": (120, 200, 255),
-            "Fire": (255, 100, 60),
-            "Earth": (180, 140, 80),
-            "Water": (80, 180, 255),
-            "None": (180, 180, 180),
-            "Multiple": (200, 100, 200),
-        }
+        element_colors = LM.ELEMENT_COLORS
         if hasattr(self, 'base_element_bounding_boxes'):
             for element, bbox in self.base_element_bounding_boxes.items():
                 if bbox is None:
                     continue
-                min_x, min_y, max_x, max_y = bbox
                 color = element_colors.get(element, (200, 200, 200))
-                rect = pygame.Rect(
-                    min_x * self.zoom + self.offset_x,
-                    min_y * self.zoom + self.offset_y,
-                    (max_x - min_x) * self.zoom,
-                    (max_y - min_y) * self.zoom,
-                )
-                s = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-                s.fill((*color, 30))
-                surface.blit(s, rect.topleft)
-                pygame.draw.rect(surface, color, rect, 2)
+                rect = self.world_rect_to_screen(bbox)
+                if not rect.colliderect(surface.get_clip()):
+                    continue
+                overlay.region(surface, rect, (*color, 30), color, 2)
                 # Draw label at bottom right
-                label_surface = self.font.render(element, True, color)
+                label_surface = overlay.label(element, color, 24)
                 label_rect = label_surface.get_rect()
                 label_rect.bottomright = (rect.right - 8, rect.bottom - 4)
-                self.window.blit(label_surface, label_rect)
+                surface.blit(label_surface, label_rect)
+
+    def world_rect_to_screen(self, bbox: Tuple[float, float, float, float]) -> pygame.Rect:
+        """(min_x, min_y, max_x, max_y) in world units -> screen rect"""
+        min_x, min_y, max_x, max_y = bbox
+        return pygame.Rect(min_x * self.zoom + self.offset_x, min_y * self.zoom + self.offset_y,
+                           (max_x - min_x) * self.zoom, (max_y - min_y) * self.zoom)
     
     def draw_deck_regions(self, surface):
         """Draw the specific deck regions (mainboard, sideboard, maybeboard) for placed decks"""
-        
-        # Get board region dimensions from Deck_Manager
-        board_regions = self.deck_manager.get_board_regions()
-        
-        for deck in self.deck_manager.decks:
-            if deck.id not in self.placed_decks:
+        overlay = self.region_overlay
+        # Labels scale with zoom to stay 100 units tall, the text cache keeps one render per size
+        label_size = int(100 * self.zoom)
+        label_y_offset = 4
+
+        for deck_id in self.placed_decks:
+            deck = self.deck_manager.decks.get(deck_id)
+            # Anchor and region rects are cached per deck until its entries change
+            geometry = self.deck_manager.decks.geometry(deck) if deck else None
+            if not geometry:
                 continue
-            
-            # Get deck position from the avatar (which should be at the top-left of the deck)
-            deck_position = None
-            if "avatar" in deck.deck and deck.deck["avatar"]:
-                avatar_cards = list(deck.deck["avatar"].keys())
-                if avatar_cards:
-                    avatar_name = avatar_cards[0]
-                    avatar_entries = deck.deck["avatar"][avatar_name]
-                    if avatar_entries:
-                        deck_position = avatar_entries[0]["position"]
-            
-            # Fallback: if no avatar, use the first card position
-            if not deck_position:
-                for board_name, board_data in deck.deck.items():
-                    for card_name, entries in board_data.items():
-                        if entries:
-                            deck_position = entries[0]["position"]
-                            break
-                    if deck_position:
-                        break
-            
-            if not deck_position:
-                continue
-            
-            # The avatar position is the deck position, so the region starts at the avatar position
-            # minus the region padding (since cards are placed with offset from region edge)
-            start_x = deck_position[0] - LM.REGION_PADDING
-            start_y = deck_position[1] - LM.REGION_PADDING
-            
-            # Region dimensions from Deck_Manager
-            mainboard_width = board_regions["mainboard"]["width"]
-            mainboard_height = board_regions["mainboard"]["height"]
-            sideboard_width = board_regions["sideboard"]["width"]
-            sideboard_height = board_regions["sideboard"]["height"]
-            maybeboard_width = board_regions["maybeboard"]["width"]
-            maybeboard_height = board_regions["maybeboard"]["height"]
-            
-            # Draw mainboard region
-            mainboard_rect = pygame.Rect(
-                start_x * self.zoom + self.offset_x,
-                start_y * self.zoom + self.offset_y,
-                mainboard_width * self.zoom,
-                mainboard_height * self.zoom
-            )
-            s = pygame.Surface((mainboard_rect.width, mainboard_rect.height), pygame.SRCALPHA)
-            s.fill((255, 255, 100, 20))  # Light yellow, very transparent
-            surface.blit(s, mainboard_rect.topleft)
-            pygame.draw.rect(surface, (255, 255, 100), mainboard_rect, 2)
-            
-            # Draw sideboard region
-            sideboard_y = start_y + mainboard_height
-            sideboard_rect = pygame.Rect(
-                start_x * self.zoom + self.offset_x,
-                sideboard_y * self.zoom + self.offset_y,
-                sideboard_width * self.zoom,
-                sideboard_height * self.zoom
-            )
-            s = pygame.Surface((sideboard_rect.width, sideboard_rect.height), pygame.SRCALPHA)
-            s.fill((100, 255, 255, 20))  # Light cyan, very transparent
-            surface.blit(s, sideboard_rect.topleft)
-            pygame.draw.rect(surface, (100, 255, 255), sideboard_rect, 2)
-            
-            # Draw maybeboard region
-            maybeboard_y = sideboard_y + sideboard_height
-            maybeboard_rect = pygame.Rect(
-                start_x * self.zoom + self.offset_x,
-                maybeboard_y * self.zoom + self.offset_y,
-                maybeboard_width * self.zoom,
-                maybeboard_height * self.zoom
-            )
-            s = pygame.Surface((maybeboard_rect.width, maybeboard_rect.height), pygame.SRCALPHA)
-            s.fill((255, 100, 255, 20))  # Light magenta, very transparent
-            surface.blit(s, maybeboard_rect.topleft)
-            pygame.draw.rect(surface, (255, 100, 255), maybeboard_rect, 2)
-            
-            # Draw region labels with center justification and fixed size
-            label_y_offset = 4
-            
-            # Create a fixed-size font for region labels (100 units tall)
-            fixed_font_size = int(100 * self.zoom)  # Scale font size with zoom to maintain 100 unit height
-            fixed_font = pygame.font.SysFont("Arial", fixed_font_size)
-            
-            # Mainboard label
-            mainboard_text = f"{deck.name} - Mainboard"
-            mainboard_text_surface = fixed_font.render(mainboard_text, True, (255, 255, 100))
-            mainboard_text_rect = mainboard_text_surface.get_rect()
-            mainboard_text_rect.centerx = mainboard_rect.centerx
-            mainboard_text_rect.top = mainboard_rect.top + label_y_offset
-            self.window.blit(mainboard_text_surface, mainboard_text_rect)
-            
-            # Sideboard label
-            sideboard_text = f"{deck.name} - Sideboard"
-            sideboard_text_surface = fixed_font.render(sideboard_text, True, (100, 255, 255))
-            sideboard_text_rect = sideboard_text_surface.get_rect()
-            sideboard_text_rect.centerx = sideboard_rect.centerx
-            sideboard_text_rect.top = sideboard_rect.top + label_y_offset
-            self.window.blit(sideboard_text_surface, sideboard_text_rect)
-            
-            # Maybeboard label
-            maybeboard_text = f"{deck.name} - Maybeboard"
-            maybeboard_text_surface = fixed_font.render(maybeboard_text, True, (255, 100, 255))
-            maybeboard_text_rect = maybeboard_text_surface.get_rect()
-            maybeboard_text_rect.centerx = maybeboard_rect.centerx
-            maybeboard_text_rect.top = maybeboard_rect.top + label_y_offset
-            self.window.blit(maybeboard_text_surface, maybeboard_text_rect)
+
+            # Board regions stacked below each other: mainboard, sideboard, maybeboard
+            for board, title, color, alpha in (("mainboard", "Mainboard", (255, 255, 100), 20),   # Light yellow, very transparent
+                                               ("sideboard", "Sideboard", (100, 255, 255), 20),   # Light cyan, very transparent
+                                               ("maybeboard", "Maybeboard", (255, 100, 255), 20)):  # Light magenta, very transparent
+                rect = self.world_rect_to_screen(geometry["regions"][board])
+                if not rect.colliderect(surface.get_clip()):
+                    continue
+                overlay.region(surface, rect, (*color, alpha), color, 2)
+
+                # Region label, centred at the top
+                text_surface = overlay.label(f"{deck.name} - {title}", color, label_size)
+                text_rect = text_surface.get_rect()
+                text_rect.centerx = rect.centerx
+                text_rect.top = rect.top + label_y_offset
+                surface.blit(text_surface, text_rect)
     
     def update_culling(self):
         # Calculate visible world area
@@ -290,48 +228,58 @@ class GUI_Manager:
         self.cull_rect = [self.viewport_rect[0] - padding, self.viewport_rect[1] + padding, 
                           self.viewport_rect[2] - padding, self.viewport_rect[3] + padding]
 
-        # Prepare output
-        self.visible_cards = []  # Use list for fast iteration
-
-        in_view = self.check_in_viewport  # Local ref for speed
+        # Everything overlapping the viewport, from the render list
+        extent = self.card_manager.spatial_index.max_extent
+        for x, y in self.render_list.sync(self.card_manager.spatial_index, self.card_manager.cards):
+            self.tile_cache.invalidate_world_rect(x, y, x + extent, y + extent)
+        # Selection and ownership flags, only rows whose state changed are updated
+        if self.selection_version != self.selected_cards.version:
+            self.selection_version = self.selected_cards.version
+            self.render_list.set_selection(set(self.selected_cards.keys()))
+        if (self.drag_delta is None) != (self.render_list.drag_offset is None):
+            # Dragged base cards are lifted off the tiles at the start and put back on drop
+            for key in self.selected_cards.keys():
+                position = self.render_list.position(key) if key[1] is None else None
+                if position is not None:
+                    self.tile_cache.invalidate_world_rect(position[0], position[1], position[0] + extent, position[1] + extent)
+        self.render_list.drag_offset = self.drag_delta
+        collection = self.collection_manager.collection
+        if self.render_list.set_owned(collection.cards if collection else None, self.collection_manager.version):
+            self.tile_cache.clear()  # Ownership outlines are part of the tiles
+        self.visible_rows = self.render_list.visible(self.viewport_rect[0], self.viewport_rect[2],
+                                                     self.viewport_rect[1], self.viewport_rect[3],
+                                                     extent, self.placed_decks)
+
+        # Images still loading go in view order, re-ranked only when the view actually moved
+        if self.viewport_rect != self.prioritized_viewport:
+            self.prioritized_viewport = self.viewport_rect
+            self.card_manager.update_view_priority(self.render_list.names(self.visible_rows), self.viewport_rect, self.cull_rect)
+            # Zoomed in past the small levels: cards in the cull margin get their large level queued too
+            card_width = self.card_pixel_size()[0]
+            if self.card_manager.textures.needs_large(card_width):
+                margin_rows = self.render_list.visible(self.cull_rect[0], self.cull_rect[2], self.cull_rect[1], self.cull_rect[3],
+                                                       extent, self.placed_decks)
+                margin_rows = np.setdiff1d(margin_rows, self.visible_rows, assume_unique=True)
+                self.card_manager.prefetch_image_levels(self.render_list.names(margin_rows), card_width)
+
+    def query_world_rect(self, min_x: float, min_y: float, max_x: float, max_y: float) -> List[Dict]:
+        """Return base and placed deck cards that may overlap a world rect, base cards first (draw order)"""
         cards = self.card_manager.cards
-
-        # --- Base layer cards (single position) ---
-        for card in cards.values():
-            if in_view(card.position):
-                self.visible_cards.append({
-                    "card": card,
-                    "Position": card.position,
-                    "group": "base",
-                    "idx": -1,
-                    "deck_id": None
-                })
-
-        # --- Deck cards (multi-position entries) ---
-        for deck in self.deck_manager.decks:
-            if deck.id not in self.placed_decks:
+        base_cards, deck_cards = [], []
+        for (card_name, deck_id, board_name, entry_id), pos in self.card_manager.spatial_index.query_rect(min_x, min_y, max_x, max_y):
+            card = cards.get(card_name)
+            if card is None:
                 continue
+            if deck_id is None:
+                base_cards.append({"card": card, "Position": pos, "group": "base", "entry_id": None, "deck_id": None})
+            elif deck_id in self.placed_decks:
+                deck_cards.append({"card": card, "Position": pos, "group": board_name, "entry_id": entry_id, "deck_id": deck_id})
+        return base_cards + deck_cards
 
-            for board_name, board_data in deck.deck.items():
-                for card_name, entries in board_data.items():
-                    card = cards.get(card_name)
-                    if card is None:
-                        continue
-
-                    for entry_index, entry in enumerate(entries):
-                        pos = entry["position"]
-                        if in_view(pos):
-                            self.visible_cards.append({
-                                "card": card,
-                                "Position": pos,
-                                "group": board_name,
-                                "idx": entry_index,
-                                "deck_id": deck.id
-                            })
-                                               
-    def check_in_viewport(self, position: Tuple[float, float]):
-        return (position[0] > self.cull_rect[0] and position[0] < self.cull_rect[1] and
-                position[1] > self.cull_rect[2] and position[1] < self.cull_rect[3])
+    def query_screen_rect(self, rect: pygame.Rect) -> List[Dict]:
+        """Same as query_world_rect for a rect in screen pixels"""
+        return self.query_world_rect((rect.left - self.offset_x) / self.zoom, (rect.top - self.offset_y) / self.zoom,
+                                     (rect.right - self.offset_x) / self.zoom, (rect.bottom - self.offset_y) / self.zoom)
         
     def draw_cards(self):
         timings = {}
@@ -344,101 +292,180 @@ class GUI_Manager:
         self.draw_deck_regions(self.window)
         timings['regions'] = (time.perf_counter() - t0) * 1000
 
-        # --- 2. Draw all visible cards (base and deck cards) ---
+        # --- 2. Draw all visible cards, only deck cards when the base cards came from the tiles ---
+        t_cards = time.perf_counter()
+        rows = self.visible_rows
+        if self.static_tiles_drawn:
+            base = (self.render_list.deck[rows] < 0) & ~self.render_list.dragged(rows)
+            live = rows[~base]
+            # Base selection outlines still go on top of the tiles
+            selected = rows[base & self.render_list.selected[rows]]
+            self.draw_card_outlines(self.window, selected, self.render_list.screen_positions(
+                selected, self.zoom, (int(self.offset_x), int(self.offset_y))))
+        else:
+            live = rows
+        drawn, positions = self.blit_card_rows(self.window, live, (self.offset_x, self.offset_y), timings)
+
+        # --- 3. Outlines: selection (yellow), then ownership (white owned / red missing) ---
         t0 = time.perf_counter()
-        for visible_card in self.visible_cards:
-            card = visible_card["card"]
-            position = visible_card["Position"]
-            group = visible_card["group"]
-            idx = visible_card["idx"]
-            deck_id = visible_card["deck_id"]
-            
-            if card.image_thumbs is None or len(card.image_thumbs) != len(card.thumb_levels):
-                continue
+        self.draw_card_outlines(self.window, drawn, positions)
+        timings['outlines'] = (time.perf_counter() - t0) * 1000
 
-            rect = self.draw_card_image(card, position)
-            if rect is None:
-                continue
-            
-            # --- 2.2 Selection Outline (yellow) ---
-            t_sel = time.perf_counter()
-            
-            # Check if this card is selected - use deck_id from visible_cards
-            # For base cards, board_name should be None, not "base"
-            board_name_for_selection = None if group == "base" else group
-            is_selected = self._is_card_selected(card.name, deck_id, board_name_for_selection, idx)
-            
-            if is_selected:
-                pygame.draw.rect(self.window, (255, 255, 0), rect, 3)
-            timings.setdefault('outline_selection', 0)
-            timings['outline_selection'] += (time.perf_counter() - t_sel) * 1000
-
-            # --- 2.3 Ownership Outline (white/red) ---
-            t_own = time.perf_counter()
-            if hasattr(card, "name") and self.collection_manager.collection:
-                if card.name in self.collection_manager.collection.cards:
-                    pygame.draw.rect(self.window, (255, 255, 255), rect, 2)
-                else:
-                    pygame.draw.rect(self.window, (255, 0, 0), rect, 2)
-            timings.setdefault('outline_ownership', 0)
-            timings['outline_ownership'] += (time.perf_counter() - t_own) * 1000
-
-            # --- 2.4 Over-committed Outline (orange/red/white) ---
-            t_commit = time.perf_counter()
-            '''if pos_group != "base":
-                if hasattr(card, "name"):
-                    over = self.is_card_over_committed(card.name, pos_group)
-                    if over == 0:
-                        pygame.draw.rect(self.window, (255, 165, 0), rect, 4)
-                    elif over < 0:
-                        pygame.draw.rect(self.window, (255, 0, 0), rect, 4)
-                    elif over > 0:
-                        pygame.draw.rect(self.window, (255, 255, 255), rect, 4)'''
-            timings.setdefault('outline_commit', 0)
-            timings['outline_commit'] += (time.perf_counter() - t_commit) * 1000
-
-        timings['total'] = (time.perf_counter() - t0) * 1000
+        timings['total'] = (time.perf_counter() - t_cards) * 1000
         timings['full'] = (time.perf_counter() - t_start) * 1000
         return timings
 
-    def draw_card_image(self, card: Card, position: Tuple[float, float] | None = None):
-        # Early culling: check if card is completely outside viewport
-        if position is None:
-            world_x, world_y = card.position
+    def card_pixel_size(self) -> Tuple[int, int]:
+        return int(LM.CARD_DIMENSIONS[0] * self.zoom), int(LM.CARD_DIMENSIONS[1] * self.zoom)
+
+    def blit_card_rows(self, target: pygame.Surface, rows: np.ndarray, offset: Tuple[float, float],
+                       timings: Optional[Dict[str, float]] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Draw render list rows at the current zoom with one blits call.
+        Returns the rows that had an image and their top-left corners on target"""
+        t0 = time.perf_counter()
+        render_list = self.render_list
+        # World -> target pixels for every row in one step
+        screen = render_list.screen_positions(rows, self.zoom, offset)
+        # Texture and orientation as one id, each distinct one is looked up once
+        texture_ids = render_list.texture[rows] * 2 + render_list.site[rows]
+        t1 = time.perf_counter()
+
+        target_size = self.card_pixel_size()
+        surfaces = {}
+        tier = self.lod_tier()
+        if tier == "far":
+            # Too small to read anyway: a flat rect per element and rarity, images are not touched
+            texture_ids = render_list.color[rows] * 2 + render_list.site[rows]
+            for texture_id in np.unique(texture_ids).tolist():
+                surfaces[texture_id] = self.lod_swatch(render_list.palette[texture_id >> 1], target_size, bool(texture_id & 1))
         else:
-            world_x, world_y = position
-        if (world_x < self.cull_rect[0] or world_x > self.cull_rect[1] or 
-            world_y < self.cull_rect[2] or world_y > self.cull_rect[3]):
-            return
+            cards = self.card_manager.cards
+            for texture_id in np.unique(texture_ids).tolist():
+                card = cards.get(render_list.texture_names[texture_id >> 1])
+                surfaces[texture_id] = self.surface_cache.get(card, target_size, bool(texture_id & 1), smooth=tier == "near") \
+                    if card is not None and self.card_manager.textures.has(card) else None
+        t2 = time.perf_counter()
+
+        drawn = np.array([surfaces[texture_id] is not None for texture_id in texture_ids.tolist()], dtype=bool)
+        target.blits([(surfaces[texture_id], (x, y)) for texture_id, (x, y)
+                      in zip(texture_ids[drawn].tolist(), screen[drawn].tolist())], doreturn=False)
+        if timings is not None:
+            timings['transform'] = (t1 - t0) * 1000
+            timings['surfaces'] = (t2 - t1) * 1000
+            timings['blit'] = (time.perf_counter() - t2) * 1000
+        return rows[drawn], screen[drawn]
+
+    def lod_swatch(self, color: Tuple[int, int, int], size: Tuple[int, int], rotated: bool) -> pygame.Surface:
+        size = (max(1, size[1]), max(1, size[0])) if rotated else (max(1, size[0]), max(1, size[1]))
+        key = (color, size)
+        swatch = self.lod_swatches.get(key)
+        if swatch is None:
+            if len(self.lod_swatches) > 256:
+                self.lod_swatches.clear()  # Swatches of old zoom levels
+            swatch = self.lod_swatches[key] = pygame.Surface(size)
+            swatch.fill(color)
+        return swatch
+
+    def draw_card_outlines(self, target: pygame.Surface, rows: np.ndarray, positions: np.ndarray,
+                           flag_mask: int = FLAG_SELECTED | FLAG_OWNED | FLAG_MISSING):
+        flags = self.render_list.flags(rows) & flag_mask
+        outlined = flags != 0
+        sites = self.render_list.site[rows][outlined].tolist()
+        width, height = self.card_pixel_size()
+        for (x, y), flag, site in zip(positions[outlined].tolist(), flags[outlined].tolist(), sites):
+            rect = pygame.Rect(x, y, height, width) if site else pygame.Rect(x, y, width, height)
+            if flag & FLAG_SELECTED:
+                pygame.draw.rect(target, (255, 255, 0), rect, 3)
+            if flag & FLAG_OWNED:
+                pygame.draw.rect(target, (255, 255, 255), rect, 2)
+            elif flag & FLAG_MISSING:
+                pygame.draw.rect(target, (255, 0, 0), rect, 2)
+
+    def draw_static_tiles(self) -> bool:
+        """Background, grid and base cards from the tile cache.
+        Returns False when the tile layer is off this frame and they have to be drawn live"""
+        self.tiles_pending = False
+        self.invalidate_loaded_tiles()  # Even while the tiles are off, so the texture change log keeps draining
+        if self.show_regions:
+            return False  # Region fills sit between the grid and the cards
+        tiles = self.tile_cache
+        tiles.configure(self.zoom, (tuple(self.background_color), tuple(self.grid_color), self.grid_offset))
+
+        size = tiles.tile_size
+        ox, oy = int(self.offset_x), int(self.offset_y)
+        deadline = time.perf_counter() + config.TILE_BUILD_BUDGET_MS / 1000
+        for tx, ty in tiles.tile_range((ox, oy), (self.WIDTH, self.HEIGHT)):
+            left, top = tx * size, ty * size
+            surface = tiles.get(tx, ty)
+            if surface is None and time.perf_counter() < deadline:
+                surface = self.build_tile(left, top)
+                tiles.put(tx, ty, surface)
+            if surface is not None:
+                self.window.blit(surface, (left + ox, top + oy))
+                continue
+            # Out of build time this frame, draw the tile's content straight to the screen
+            self.tiles_pending = True
+            clip = pygame.Rect(left + ox, top + oy, size, size).clip(self.window.get_rect())
+            if clip.width and clip.height:
+                self.render_static(self.window.subsurface(clip), clip.x - ox, clip.y - oy)
+
+        # Spare build time goes to the ring of tiles just off screen, ready for panning
+        for tx, ty in tiles.tile_range((ox, oy), (self.WIDTH, self.HEIGHT), margin=1):
+            if (tx, ty) in tiles:
+                continue
+            if time.perf_counter() >= deadline:
+                self.tiles_pending = True
+                break
+            tiles.put(tx, ty, self.build_tile(tx * size, ty * size))
+        return True
 
-        # Check if card has valid image data
-        if card.image_thumbs is None or len(card.image_thumbs) == 0:
-            return None
+    def build_tile(self, left: int, top: int) -> pygame.Surface:
+        size = self.tile_cache.tile_size
+        surface = pygame.Surface((size, size)).convert()
+        self.render_static(surface, left, top)
+        return surface
+
+    def render_static(self, target: pygame.Surface, left: int, top: int):
+        """Background, grid and base cards for the zoomed world pixels starting at (left, top)."""
+        width, height = target.get_size()
+        zoom = self.zoom
+        target.fill(self.background_color)
+
+        # --- Grid ---
+        spacing = self.grid_step()
+        offset_x_units, offset_y_units = self.grid_offset
+        start_x = int((left / zoom - offset_x_units) // spacing) * spacing + offset_x_units
+        end_x = int(((left + width) / zoom - offset_x_units) // spacing + 1) * spacing + offset_x_units
+        start_y = int((top / zoom - offset_y_units) // spacing) * spacing + offset_y_units
+        end_y = int(((top + height) / zoom - offset_y_units) // spacing + 1) * spacing + offset_y_units
+        for x in range(start_x, end_x, spacing):
+            sx = x * zoom - left
+            pygame.draw.line(target, self.grid_color, (sx, 0), (sx, height))
+        for y in range(start_y, end_y, spacing):
+            sy = y * zoom - top
+            pygame.draw.line(target, self.grid_color, (0, sy), (width, sy))
+
+        # --- Base cards and their ownership outlines ---
+        rows = self.render_list.visible(left / zoom, top / zoom, (left + width) / zoom, (top + height) / zoom,
+                                        self.card_manager.spatial_index.max_extent, (), static=True)
+        drawn, positions = self.blit_card_rows(target, rows, (-left, -top))
+        self.draw_card_outlines(target, drawn, positions, FLAG_OWNED | FLAG_MISSING)
+
+    def invalidate_loaded_tiles(self):
+        """Drop the tiles of base cards whose image levels changed since the last frame."""
+        textures = self.card_manager.textures
+        slugs, self.texture_cursor = textures.changes_since(self.texture_cursor)
+        if not slugs:
+            return
+        if self.slug_names_source is not self.card_manager.cards:
+            self.slug_names_source = self.card_manager.cards
+            self.slug_names = {Texture_Manager.key(card): name for name, card in self.card_manager.cards.items()}
+        extent = self.card_manager.spatial_index.max_extent
+        for slug in set(slugs):
+            position = self.render_list.position((self.slug_names.get(slug), None, None, None))
+            if position is not None:
+                self.tile_cache.invalidate_world_rect(position[0], position[1], position[0] + extent, position[1] + extent)
 
-        screen_x = world_x * self.zoom + self.offset_x
-        screen_y = world_y * self.zoom + self.offset_y
-        is_site = getattr(card, "type", "").lower() == "site"
-        
-        # --- 1. Select best thumbnail level (not too small)
-        best_index = 0
-        scale_factor = LM.CARD_PIXEL_DIMENSIONS[0] / LM.CARD_DIMENSIONS[0]
-        for i, thumb_scale in enumerate(card.thumb_levels):
-            if thumb_scale <= self.zoom * scale_factor:
-                best_index = i
-        base_surface = card.image_thumbs[best_index]
-        
-        target_width = int(LM.CARD_DIMENSIONS[0] * self.zoom)
-        target_height = int(LM.CARD_DIMENSIONS[1] * self.zoom)
-        card_surface = pygame.transform.smoothscale(base_surface, (target_width, target_height))
-        
-        if is_site:
-            card_surface = pygame.transform.rotate(card_surface, -90)
-        
-        rect = card_surface.get_rect(topleft=(screen_x, screen_y))
-        self.window.blit(card_surface, rect.topleft)
-        
-        return rect
-    
     def draw_selection_box(self):
         if self.selection_box:
             x0, y0, x1, y1 = self.selection_box
@@ -457,8 +484,9 @@ class GUI_Manager:
         pygame.draw.arc(self.window, (120, 200, 255), rect, start_angle, end_angle, thickness)
         self.spinner_angle = (self.spinner_angle + 5) % 360
 
-        pct = int((self.card_manager.cards_loaded / len(self.card_manager.cards)) * 100)
-        text_surface = self.font.render(f"{pct}%", True, (230, 230, 230))
+        total = len(self.card_manager.cards)
+        pct = min(100, int((self.card_manager.cards_loaded / total) * 100)) if total else 0
+        text_surface = text_cache.render(f"{pct}%", (230, 230, 230))
         text_rect = text_surface.get_rect(center=center)
         self.window.blit(text_surface, text_rect)
     
@@ -498,7 +526,7 @@ class GUI_Manager:
         
         # Status message
         if self.background_operation_message:
-            text_surface = self.font.render(self.background_operation_message, True, (230, 230, 230))
+            text_surface = text_cache.render(self.background_operation_message, (230, 230, 230))
             text_rect = text_surface.get_rect(center=(box_x + box_width // 2, box_y + 80))
             self.window.blit(text_surface, text_rect)
         
@@ -521,7 +549,7 @@ class GUI_Manager:
             
             # Progress text
             progress_text = f"{int(self.background_operation_progress * 100)}%"
-            progress_surface = self.font.render(progress_text, True, (230, 230, 230))
+            progress_surface = text_cache.render(progress_text, (230, 230, 230))
             progress_rect = progress_surface.get_rect(center=(box_x + box_width // 2, progress_y + progress_height // 2))
             self.window.blit(progress_surface, progress_rect)
     
@@ -737,7 +765,24 @@ class GUI_Manager:
             self.background_operation_queue.put(("deck_url_cancelled",))
     
     def draw_debug_info(self, frame_times=None, fps=None):
-        """Draw debug info including timings and FPS."""
+        """Draw debug info including timings and FPS.
+        The lines are rebuilt a few times a second, in between the cached renders are blitted again"""
+        now = time.perf_counter()
+        if now - self.debug_lines_time >= config.DEBUG_REFRESH_S:
+            self.debug_lines = self.build_debug_lines(frame_times, fps)
+            self.debug_lines_time = now
+
+        # Draw debug info in bottom-right, right justified
+        line_height = 25
+        total_height = len(self.debug_lines) * line_height
+        start_y = self.HEIGHT - total_height - 10
+        for i, line in enumerate(self.debug_lines):
+            text_surface = text_cache.render(line, (255, 255, 255))
+            x_pos = self.WIDTH - text_surface.get_width() - 10
+            y_pos = start_y + i * line_height
+            self.window.blit(text_surface, (x_pos, y_pos))
+
+    def build_debug_lines(self, frame_times=None, fps=None) -> List[str]:
         mouse_pos = pygame.mouse.get_pos()
         world_x = (mouse_pos[0] - self.offset_x) / self.zoom
         world_y = (mouse_pos[1] - self.offset_y) / self.zoom
@@ -754,23 +799,22 @@ class GUI_Manager:
             f"Base BBox: {self.base_bounding_box}",
             f"Placed Decks: {len(self.placed_decks)}",
             f"Selected Cards: {len(self.selected_cards)}",
+            "Events: {} queued, {} handled".format(*self.event_counts),
+            "Surface Cache: {surfaces} surfaces, {mb:.1f} MB".format(**self.surface_cache.stats()),
+            "Tiles: {tiles} cached {mb:.0f} MB, {built} built, {dropped} dropped".format(**self.tile_cache.stats()),
+            "Text Cache: {texts} texts {mb:.1f} MB, {hits} hits, {misses} misses".format(**text_cache.stats()),
+            "Textures: {cards} cards {small_mb:.0f} MB ({atlas_pages} atlas pages), {large} large {large_mb:.0f}/{budget_mb:.0f} MB, {derived} derived, {evictions} evicted".format(**self.card_manager.textures.stats()),
+            "Images: {delivered} loaded, {outstanding} pending, fetch {fetch_per_s:.0f}/s, decode {decode_per_s:.0f}/s".format(**self.card_manager.image_pipeline.stats()),
             "Controls: Double-click=Duplicate, Delete=Remove deck cards",
             "Save/Load: Layout+Updated Decks"
         ]
+        for host, http_stats in Util_HTTP.stats().items():
+            debug_lines.append("HTTP {}: {requests} req, {errors} err, p50 {p50:.0f} ms, p95 {p95:.0f} ms".format(host, **http_stats))
         if frame_times is not None:
             debug_lines.append("=== Timings (ms) ===")
             for k, v in frame_times.items():
                 debug_lines.append(f"{k}: {v:.2f}")
-
-        # Draw debug info in bottom-right, right justified
-        line_height = 25
-        total_height = len(debug_lines) * line_height
-        start_y = self.HEIGHT - total_height - 10
-        for i, line in enumerate(debug_lines):
-            text_surface = self.font.render(line, True, (255, 255, 255))
-            x_pos = self.WIDTH - text_surface.get_width() - 10
-            y_pos = start_y + i * line_height
-            self.window.blit(text_surface, (x_pos, y_pos))
+        return debug_lines
     
     def toggle_fullscreen(self):
         """Toggle between fullscreen and windowed mode"""
@@ -850,12 +894,12 @@ class GUI_Manager:
                 self.last_click_time = current_time
                 self.last_click_pos = (mx, my)
 
-                # Check visible cards for clicks (much more efficient)
-                for visible_card in self.visible_cards:
+                # Check only the cards under the cursor (spatial index lookup)
+                for visible_card in self.query_screen_rect(pygame.Rect(mx, my, 1, 1)):
                     card = visible_card["card"]
                     position = visible_card["Position"]
                     group = visible_card["group"]
-                    idx = visible_card["idx"]
+                    entry_id = visible_card["entry_id"]
                     
                     # Calculate card bounds
                     screen_x = position[0] * self.zoom + self.offset_x
@@ -877,11 +921,9 @@ class GUI_Manager:
                             if group == "base":
                                 self.handle_card_double_click(card.name, position[0], position[1])
                             else:
-                                # Find deck info for deck cards
-                                for deck in self.deck_manager.decks:
-                                    if deck.id in self.placed_decks and group in deck.deck and card.name in deck.deck[group]:
-                                        self.handle_card_double_click(card.name, position[0], position[1], deck.id, group, idx)
-                                        break
+                                deck = self.deck_manager.decks.get(visible_card["deck_id"])
+                                if deck and group in deck.deck and card.name in deck.deck[group]:
+                                    self.handle_card_double_click(card.name, position[0], position[1], deck.id, group, entry_id)
                             return True
                         
                         # Create selection tuple - use actual data source positions
@@ -890,15 +932,12 @@ class GUI_Manager:
                             actual_position = self.card_manager.cards[card.name].position
                             selection_tuple = (card.name, None, None, None, actual_position)
                         else:
-                            # For deck cards, find the deck and use the actual position from deck entry
-                            for deck in self.deck_manager.decks:
-                                if deck.id in self.placed_decks and group in deck.deck and card.name in deck.deck[group]:
-                                    if idx < len(deck.deck[group][card.name]):
-                                        actual_position = deck.deck[group][card.name][idx]["position"]
-                                        selection_tuple = (card.name, deck.id, group, idx, actual_position)
-                                        break
-                            else:
+                            # For deck cards, use the actual position from the deck entry
+                            deck = self.deck_manager.decks.get(visible_card["deck_id"])
+                            if not deck or entry_id not in deck.entries:
                                 continue  # Skip if deck not found
+                            actual_position = deck.entries.position(entry_id)
+                            selection_tuple = (card.name, deck.id, group, entry_id, actual_position)
                         
                         # Handle selection logic
                         self.handle_card_selection(selection_tuple, mx, my, screen_x, screen_y)
@@ -907,11 +946,11 @@ class GUI_Manager:
                 if not clicked_card:
                     # Start selection box
                     if not self.shift_held and not self.alt_held:
-                        self.selected_cards = []
+                        self.selected_cards.clear()
                     self.selected_card_index = None
                     self.selected_deck = None
                     self.selected_board = None
-                    self.selected_entry_index = None
+                    self.selected_entry_id = None
                     self.selection_box = (mx, my, mx, my)
 
         elif event.type == pygame.MOUSEBUTTONUP:
@@ -923,12 +962,12 @@ class GUI_Manager:
                     box = pygame.Rect(min(x0, x1), min(y0, y1), abs(x1 - x0), abs(y1 - y0))
                     affected = []
 
-                    # Check visible cards in selection box (much more efficient)
-                    for visible_card in self.visible_cards:
+                    # Check only the cards under the selection box (spatial index lookup)
+                    for visible_card in self.query_screen_rect(box):
                         card = visible_card["card"]
                         position = visible_card["Position"]
                         group = visible_card["group"]
-                        idx = visible_card["idx"]
+                        entry_id = visible_card["entry_id"]
                         
                         # Calculate card bounds
                         screen_x = position[0] * self.zoom + self.offset_x
@@ -949,28 +988,21 @@ class GUI_Manager:
                                 actual_position = self.card_manager.cards[card.name].position
                                 selection_tuple = (card.name, None, None, None, actual_position)
                             else:
-                                # For deck cards, find the deck and use the actual position from deck entry
-                                for deck in self.deck_manager.decks:
-                                    if deck.id in self.placed_decks and group in deck.deck and card.name in deck.deck[group]:
-                                        if idx < len(deck.deck[group][card.name]):
-                                            actual_position = deck.deck[group][card.name][idx]["position"]
-                                            selection_tuple = (card.name, deck.id, group, idx, actual_position)
-                                            break
-                                else:
+                                # For deck cards, use the actual position from the deck entry
+                                deck = self.deck_manager.decks.get(visible_card["deck_id"])
+                                if not deck or entry_id not in deck.entries:
                                     continue  # Skip if deck not found
+                                actual_position = deck.entries.position(entry_id)
+                                selection_tuple = (card.name, deck.id, group, entry_id, actual_position)
                             
                             affected.append(selection_tuple)
 
                     if self.alt_held:
-                        for selection_tuple in affected:
-                            if selection_tuple in self.selected_cards:
-                                self.selected_cards.remove(selection_tuple)
+                        self.selected_cards.difference_update(affected)
                     elif self.shift_held:
-                        for selection_tuple in affected:
-                            if selection_tuple not in self.selected_cards:
-                                self.selected_cards.append(selection_tuple)
+                        self.selected_cards.update(affected)
                     else:
-                        self.selected_cards = affected
+                        self.selected_cards.replace(affected)
 
                     self.selection_box = None
                 self.dragging_card = False
@@ -981,20 +1013,7 @@ class GUI_Manager:
                 #     self.handle_card_drop_on_deck_regions()
                 
                 if not self.selection_box and self.selected_cards:
-                    for card_name, deck_id, board_name, entry_index, position in self.selected_cards:
-                        if card_name is None:
-                            print("[DEBUG] Skipping None key in selected_cards.")
-                            continue
-                        if card_name not in self.card_manager.cards:
-                            print(f"[DEBUG] Skipping unknown card name in selected_cards: {card_name}")
-                            continue
-                        
-                        x, y = position
-                        card = self.card_manager.cards[card_name]
-                        snapped_x, snapped_y = self.snap_card_to_grid(x, y, card)
-                        
-                        # Update the actual data structure based on card type
-                        self.update_card_position(card_name, deck_id, board_name, entry_index, (snapped_x, snapped_y))
+                    self.commit_drag()
 
         elif event.type == pygame.MOUSEMOTION:
             if self.is_panning:
@@ -1013,10 +1032,10 @@ class GUI_Manager:
                 # Calculate the new position for the dragged card
                 if self.selected_cards and self.drag_anchor_card:
                     # Use the anchor card (the one that was clicked) for drag calculations
-                    anchor_card_name, anchor_deck_id, anchor_board_name, anchor_entry_index, anchor_current_pos = self.drag_anchor_card
+                    anchor_card_name, anchor_deck_id, anchor_board_name, anchor_entry_id, anchor_current_pos = self.drag_anchor_card
                     
                     # Get the true original position for the anchor card
-                    anchor_original_pos_key = (anchor_card_name, anchor_deck_id, anchor_board_name, anchor_entry_index)
+                    anchor_original_pos_key = (anchor_card_name, anchor_deck_id, anchor_board_name, anchor_entry_id)
                     if anchor_original_pos_key in self.original_positions:
                         anchor_original_pos = self.original_positions[anchor_original_pos_key]
                         
@@ -1028,22 +1047,8 @@ class GUI_Manager:
                         dx = new_x - anchor_original_pos[0]
                         dy = new_y - anchor_original_pos[1]
 
-                        # Move all selected cards by the same offset
-                        for i, (sel_card_name, sel_deck_id, sel_board_name, sel_entry_index, sel_position) in enumerate(self.selected_cards):
-                            # Get the original position for this card
-                            original_pos_key = (sel_card_name, sel_deck_id, sel_board_name, sel_entry_index)
-                            if original_pos_key in self.original_positions:
-                                original_pos = self.original_positions[original_pos_key]
-                                # Calculate new position based on original position + movement
-                                new_card_x = original_pos[0] + dx
-                                new_card_y = original_pos[1] + dy
-                                new_position = (new_card_x, new_card_y)
-                                
-                                # Update the actual data structure based on card type
-                                self.update_card_position(sel_card_name, sel_deck_id, sel_board_name, sel_entry_index, new_position)
-                                
-                                # Update the position in selected_cards list so drawing reflects the new position
-                                self.selected_cards[i] = (sel_card_name, sel_deck_id, sel_board_name, sel_entry_index, new_position)
+                        # All selected cards move by the same offset, applied at render time until the drop
+                        self.drag_delta = (dx, dy)
 
             elif self.selection_box:
                 x0, y0, _, _ = self.selection_box
@@ -1051,7 +1056,8 @@ class GUI_Manager:
 
         elif event.type == pygame.MOUSEWHEEL:
             mx, my = pygame.mouse.get_pos()
-            scale = 1.1 if event.y > 0 else 0.9
+            # One step for the frame's wheel ticks, see GUI_Input.coalesce_events
+            scale = 1.1 ** event.zoom_in * 0.9 ** event.zoom_out
             old_zoom = self.zoom
             self.zoom *= scale
             self.offset_x = mx - (mx - self.offset_x) * (self.zoom / old_zoom)
@@ -1091,11 +1097,7 @@ class GUI_Manager:
     def handle_deck_button_click(self, deck_id):
         """Handle clicks on deck buttons - place deck on grid (single deck only)"""
         # Find the deck by ID
-        deck = None
-        for d in self.deck_manager.decks:
-            if d.id == deck_id:
-                deck = d
-                break
+        deck = self.deck_manager.decks.get(deck_id)
         
         if not deck:
             print(f"❌ Deck {deck_id} not found")
@@ -1120,7 +1122,11 @@ class GUI_Manager:
         # Store the deck IDs that were placed so we can restore their buttons
         placed_deck_ids = list(self.placed_decks)
         
-        # Clear placed decks set
+        # Clear placed decks set and drop their cards from the spatial index
+        for deck_id in self.placed_decks:
+            deck = self.deck_manager.decks.get(deck_id)
+            if deck:
+                deck.detach_index()
         self.placed_decks.clear()
         
         # Clear deck bounding boxes
@@ -1128,11 +1134,7 @@ class GUI_Manager:
         
         # Restore deck buttons so users can select a different deck
         for deck_id in placed_deck_ids:
-            deck = None
-            for d in self.deck_manager.decks:
-                if d.id == deck_id:
-                    deck = d
-                    break
+            deck = self.deck_manager.decks.get(deck_id)
             if deck:
                 self.sidebar.add_deck_button(deck.name, deck.id)
         
@@ -1180,7 +1182,7 @@ class GUI_Manager:
                                             "finish": entry.get("finish", "Unknown"),
                                             "product": entry.get("product", "Unknown")
                                         },
-                                        "position": entry["position"]
+                                        "position": deck.position(entry)
                                     }
                                     deck_data[board_name].append(card_entry)
                     
@@ -1237,16 +1239,13 @@ class GUI_Manager:
                 deck = Deck.from_json(name=deck_name, author=deck_author, id=deck_id, json_data=deck_data)
                 
                 # Add to deck manager if not already present
-                deck_exists = False
-                for existing_deck in self.deck_manager.decks:
-                    if existing_deck.id == deck_id:
-                        # Replace existing deck
-                        existing_deck.deck = deck.deck
-                        deck = existing_deck
-                        deck_exists = True
-                        break
-                
-                if not deck_exists:
+                existing_deck = self.deck_manager.decks.get(deck_id)
+                if existing_deck:
+                    # Replace existing deck, its old copies drop out of the selection
+                    existing_deck.replace_entries(deck)
+                    deck = existing_deck
+                    self.prune_selection()
+                else:
                     self.deck_manager.decks.append(deck)
                 
                 # Place the deck on the grid
@@ -1261,9 +1260,9 @@ class GUI_Manager:
         print(f"✅ Loaded {len(updated_files)} updated deck(s)")
 
     def handle_card_double_click(self, card_name: str, world_x: float, world_y: float, deck_id: Optional[str] = None, 
-                                 board_name: Optional[str] = None, entry_index: Optional[int] = None):
+                                 board_name: Optional[str] = None, entry_id: Optional[int] = None):
         """Handle double-click on a card - duplicate if in deck, add to deck if base card, ignore if no deck"""
-        if deck_id and board_name and entry_index is not None:
+        if deck_id and board_name and entry_id is not None:
             # Card is in a deck - duplicate it
             self.duplicate_card_in_deck(card_name, deck_id, board_name, world_x, world_y)
         else:
@@ -1276,11 +1275,7 @@ class GUI_Manager:
     def duplicate_card_in_deck(self, card_name: str, deck_id: str, board_name: str, world_x: float, world_y: float):
         """Duplicate a card within a deck by adding a new position offset by grid spacing"""
         # Find the deck
-        target_deck = None
-        for deck in self.deck_manager.decks:
-            if deck.id == deck_id and deck.id in self.placed_decks:
-                target_deck = deck
-                break
+        target_deck = self.deck_manager.decks.get(deck_id) if deck_id in self.placed_decks else None
         
         if not target_deck:
             print(f"❌ Deck '{deck_id}' not found or not placed")
@@ -1307,11 +1302,7 @@ class GUI_Manager:
         
         # Get the first (and only) placed deck
         deck_id = list(self.placed_decks)[0]
-        target_deck = None
-        for deck in self.deck_manager.decks:
-            if deck.id == deck_id:
-                target_deck = deck
-                break
+        target_deck = self.deck_manager.decks.get(deck_id)
         
         if not target_deck:
             print("❌ Placed deck not found")
@@ -1337,30 +1328,26 @@ class GUI_Manager:
         
         print(f"🗑️ Deleting {len(self.selected_cards)} selected cards from decks")
         
-        # Process each selected card for deletion
-        for card_name, deck_id, board_name, entry_index, position in self.selected_cards:
+        # Process each selected card for deletion, copies are keyed by instance id so removing one leaves the others' keys valid
+        for card_name, deck_id, board_name, entry_id, position in self.selected_cards:
             if card_name not in self.card_manager.cards:
                 continue
             
-            if deck_id and board_name and entry_index is not None:
+            if deck_id and board_name and entry_id is not None:
                 # Card is in a deck - remove it from the deck
-                self.delete_card_from_deck(card_name, deck_id, board_name, entry_index, position)
+                self.delete_card_from_deck(card_name, deck_id, board_name, entry_id, position)
             else:
                 # Card is not in a deck (base card or other) - cannot be deleted
                 print(f"ℹ️ Cannot delete {card_name} - not in a deck")
         
         # Clear selection after deletion
-        self.selected_cards = []
+        self.selected_cards.clear()
         print("✅ Card deletion completed")
 
-    def delete_card_from_deck(self, card_name: str, deck_id: str, board_name: str, entry_index: int, position: Tuple[int, int]):
-        """Delete a card from a deck by removing it by index"""
+    def delete_card_from_deck(self, card_name: str, deck_id: str, board_name: str, entry_id: int, position: Tuple[int, int]):
+        """Delete a card copy from a deck by its instance id"""
         # Find the deck
-        target_deck = None
-        for deck in self.deck_manager.decks:
-            if deck.id == deck_id and deck.id in self.placed_decks:
-                target_deck = deck
-                break
+        target_deck = self.deck_manager.decks.get(deck_id) if deck_id in self.placed_decks else None
         
         if not target_deck:
             print(f"❌ Deck '{deck_id}' not found or not placed")
@@ -1371,19 +1358,16 @@ class GUI_Manager:
             print(f"❌ Card '{card_name}' not found in {target_deck.name} - {board_name}")
             return
         
-        # Check if the entry_index is valid
-        entries = target_deck.deck[board_name][card_name]
-        if entry_index < 0 or entry_index >= len(entries):
-            print(f"❌ Invalid entry_index {entry_index} for {card_name} in {target_deck.name} - {board_name}")
+        # Check if the copy is still in the deck
+        entry_index = target_deck.get_entry_index(board_name, card_name, entry_id)
+        if entry_index < 0:
+            print(f"❌ Invalid entry_id {entry_id} for {card_name} in {target_deck.name} - {board_name}")
             return
         
         # Remove the card by index
         print(f"🗑️ Deleting {card_name} from {target_deck.name} - {board_name} at index {entry_index}")
-        del entries[entry_index]
-        
-        # If this was the last entry for this card, remove the card entirely
-        if len(entries) == 0:
-            del target_deck.deck[board_name][card_name]
+        # remove_entry also drops the card entirely if this was its last entry
+        target_deck.remove_entry(board_name, card_name, entry_index)
         
         print(f"✅ Deleted {card_name} from {target_deck.name} - {board_name}")
 
@@ -1393,7 +1377,8 @@ class GUI_Manager:
         position = self.calculate_deck_position(deck)
         print(f"Placing deck '{deck.name}' at position {position}")
         
-        # Place the deck using the deck manager
+        # Place the deck using the deck manager, keeping the spatial index in step
+        deck.attach_index(self.card_manager.spatial_index)
         self.deck_manager.place_deck(deck, position, self.card_manager)
         
         print(f"✅ Placed deck '{deck.name}' at position {position}")
@@ -1412,22 +1397,12 @@ class GUI_Manager:
         """Update bounding boxes for all placed decks"""
         self.deck_bounding_boxes = {}
         
-        for deck in self.deck_manager.decks:
-            if deck.id in self.placed_decks:
-                min_x, min_y, max_x, max_y = float('inf'), float('inf'), float('-inf'), float('-inf')
-                
-                for board_name, board_data in deck.deck.items():
-                    for card_name, entries in board_data.items():
-                        for entry in entries:
-                            x, y = entry["position"]
-                            min_x = min(min_x, x)
-                            min_y = min(min_y, y)
-                            max_x = max(max_x, x)
-                            max_y = max(max_y, y)
-                
-                if min_x != float('inf'):
-                    self.deck_bounding_boxes[deck.name] = (min_x, min_y, max_x, max_y)
-                    print(f"Deck bounding box for {deck.name}: {self.deck_bounding_boxes[deck.name]}")
+        for deck_id in self.placed_decks:
+            deck = self.deck_manager.decks.get(deck_id)
+            geometry = self.deck_manager.decks.geometry(deck) if deck else None
+            if geometry:
+                self.deck_bounding_boxes[deck.name] = geometry["bbox"]
+                print(f"Deck bounding box for {deck.name}: {self.deck_bounding_boxes[deck.name]}")
 
     def save_layout(self, filepath):
         try:
@@ -1480,7 +1455,7 @@ class GUI_Manager:
             # Restore positions to the correct Card objects by name
             for name, position in card_positions.items():
                 if name in self.card_manager.cards:
-                    self.card_manager.cards[name].position = position
+                    self.card_manager.set_card_position(self.card_manager.cards[name], tuple(position))
             
             print(f"✅ Layout loaded from {filepath}")
             if has_updated_decks:
@@ -1489,48 +1464,80 @@ class GUI_Manager:
         except Exception as e:
             print(f"❌ Failed to load layout: {e}")
 
+    def prune_selection(self):
+        """Drop selected deck copies that no longer exist, e.g. after their deck was reloaded"""
+        stale = []
+        for key in self.selected_cards.keys():
+            deck = self.deck_manager.decks.get(key[1]) if key[1] is not None else None
+            if key[1] is not None and (deck is None or key[3] not in deck.entries):
+                stale.append(key)
+        if stale:
+            self.selected_cards.difference_update(stale)
+
     def _store_original_positions(self):
         """Store original positions for all selected cards from their actual data sources"""
         self.original_positions = {}
-        for sel_card_name, sel_deck_id, sel_board_name, sel_entry_index, sel_position in self.selected_cards:
+        for sel_card_name, sel_deck_id, sel_board_name, sel_entry_id, sel_position in self.selected_cards:
+            key = (sel_card_name, sel_deck_id, sel_board_name, sel_entry_id)
             if sel_deck_id is None:
                 # Base card - get position from card_manager
                 if sel_card_name in self.card_manager.cards:
-                    key = (sel_card_name, sel_deck_id, sel_board_name, sel_entry_index)
                     self.original_positions[key] = self.card_manager.cards[sel_card_name].position
             else:
                 # Deck card - get position from deck entry
-                for deck in self.deck_manager.decks:
-                    if deck.id == sel_deck_id and sel_board_name and sel_entry_index is not None:
-                        deck_board = deck.deck.get(sel_board_name, {})
-                        if sel_card_name in deck_board and sel_entry_index < len(deck_board[sel_card_name]):
-                            key = (sel_card_name, sel_deck_id, sel_board_name, sel_entry_index)
-                            self.original_positions[key] = deck_board[sel_card_name][sel_entry_index]["position"]
-                        break
+                deck = self.deck_manager.decks.get(sel_deck_id)
+                if deck and sel_entry_id in deck.entries:
+                    self.original_positions[key] = deck.entries.position(sel_entry_id)
+
+    def commit_drag(self):
+        """Write the selection back at its dragged positions, snapped to the grid"""
+        dx, dy = self.drag_delta or (0, 0)
+        self.drag_delta = None
+        # Base cards one by one, deck copies moved and snapped per deck in one array operation
+        deck_moves: Dict[str, List[Tuple[str, str, int]]] = {}
+        for card_name, deck_id, board_name, entry_id, position in self.selected_cards:
+            if card_name not in self.card_manager.cards:
+                continue
+            if deck_id is None:
+                x, y = self.original_positions.get((card_name, None, None, None), position)
+                new_position = self.snap_card_to_grid(x + dx, y + dy, self.card_manager.cards[card_name])
+                self.update_card_position(card_name, None, None, None, new_position)
+                self.selected_cards.move((card_name, None, None, None), new_position)
+                continue
+            deck = self.deck_manager.decks.get(deck_id)
+            if deck and entry_id in deck.entries:
+                deck_moves.setdefault(deck_id, []).append((card_name, board_name, entry_id))
+        for deck_id, moved in deck_moves.items():
+            # The stored positions are still the drag origins, the drag only moved what is drawn
+            deck = self.deck_manager.decks.get(deck_id)
+            deck.move_entries([entry_id for _, _, entry_id in moved], dx, dy, LM.GRID_SPACING)
+            for card_name, board_name, entry_id in moved:
+                self.selected_cards.move((card_name, deck_id, board_name, entry_id), deck.entries.position(entry_id))
+        self.original_positions = {}
 
-    def update_card_position(self, card_name, deck_id, board_name, entry_index, new_position):
+    def update_card_position(self, card_name, deck_id, board_name, entry_id, new_position):
         """Update card position in the appropriate data structure based on card type"""
         if deck_id is None:
             # Base card - update card position in card_manager
             if card_name in self.card_manager.cards:
-                self.card_manager.cards[card_name].position = new_position
+                self.card_manager.set_card_position(self.card_manager.cards[card_name], new_position)
         else:
             # Deck card - update deck entry position
-            for deck in self.deck_manager.decks:
-                if (deck.id == deck_id and board_name and entry_index is not None):
-                    deck.update_position(board_name, card_name, new_position, entry_index)
-                    break
+            deck = self.deck_manager.decks.get(deck_id)
+            entry_index = deck.get_entry_index(board_name, card_name, entry_id) if deck and board_name else -1
+            if entry_index >= 0:
+                deck.update_position(board_name, card_name, new_position, entry_index)
 
     def handle_card_selection(self, selection_tuple, mx, my, screen_x, screen_y):
         """Handle card selection logic - much more concise than the old inline code"""
-        card_name, deck_id, board_name, entry_index, position = selection_tuple
+        card_name, deck_id, board_name, entry_id, position = selection_tuple
         
         # Don't change selection if clicking an already selected card without modifiers
         if selection_tuple in self.selected_cards:
             self.selected_card_index = card_name
             self.selected_deck = deck_id
             self.selected_board = board_name
-            self.selected_entry_index = entry_index
+            self.selected_entry_id = entry_id
             self.dragging_card = True
             self.drag_anchor_card = selection_tuple  # Store the clicked card
             self.drag_offset = (
@@ -1543,17 +1550,16 @@ class GUI_Manager:
         
         # Alt removes from selection
         if self.alt_held:
-            if selection_tuple in self.selected_cards:
-                self.selected_cards.remove(selection_tuple)
+            self.selected_cards.discard(selection_tuple)
             return
         
         # Shift adds to selection
         if self.shift_held:
-            self.selected_cards.append(selection_tuple)
+            self.selected_cards.add(selection_tuple)
             self.selected_card_index = card_name
             self.selected_deck = deck_id
             self.selected_board = board_name
-            self.selected_entry_index = entry_index
+            self.selected_entry_id = entry_id
             self.dragging_card = True
             self.drag_anchor_card = selection_tuple  # Store the clicked card
             self.drag_offset = (
@@ -1565,11 +1571,11 @@ class GUI_Manager:
             return
         
         # Default behavior: select this card only
-        self.selected_cards = [selection_tuple]
+        self.selected_cards.replace([selection_tuple])
         self.selected_card_index = card_name
         self.selected_deck = deck_id
         self.selected_board = board_name
-        self.selected_entry_index = entry_index
+        self.selected_entry_id = entry_id
         self.dragging_card = True
         self.drag_anchor_card = selection_tuple  # Store the clicked card
         self.drag_offset = (
@@ -1604,13 +1610,9 @@ class GUI_Manager:
         deck_name = pos_group.replace("_mainboard", "")
         
         # Find the deck by name
-        target_deck = None
-        for deck in self.deck_manager.decks:
-            if deck.name == deck_name and deck.id in self.placed_decks:
-                target_deck = deck
-                break
+        target_deck = self.deck_manager.decks.get_by_name(deck_name)
         
-        if not target_deck:
+        if not target_deck or target_deck.id not in self.placed_decks:
             return False
         
         # Count how many copies are in this deck's mainboard
@@ -1628,52 +1630,15 @@ class GUI_Manager:
 
     def get_deck_region_at_position(self, world_x: float, world_y: float):
         """Get the deck and board region at the given world position"""
-        import Layout_Manager as LM
-        
-        # Get board region dimensions from Deck_Manager
-        board_regions = self.deck_manager.get_board_regions()
-        
-        for deck in self.deck_manager.decks:
-            if deck.id not in self.placed_decks:
+        for deck_id in self.placed_decks:
+            deck = self.deck_manager.decks.get(deck_id)
+            geometry = self.deck_manager.decks.geometry(deck) if deck else None
+            # Regions hang off the avatar
+            if not geometry or not geometry["avatar"]:
                 continue
-            
-            # Get deck position from the avatar
-            deck_position = None
-            if "avatar" in deck.deck and deck.deck["avatar"]:
-                avatar_cards = list(deck.deck["avatar"].keys())
-                if avatar_cards:
-                    avatar_name = avatar_cards[0]
-                    avatar_entries = deck.deck["avatar"][avatar_name]
-                    if avatar_entries:
-                        deck_position = avatar_entries[0]["position"]
-            
-            if not deck_position:
-                continue
-            
-            # Calculate region boundaries
-            start_x = deck_position[0] - LM.REGION_PADDING
-            start_y = deck_position[1] - LM.REGION_PADDING
-            
-            # Check mainboard region
-            mainboard_width = board_regions["mainboard"]["width"]
-            mainboard_height = board_regions["mainboard"]["height"]
-            if (start_x <= world_x <= start_x + mainboard_width and 
-                start_y <= world_y <= start_y + mainboard_height):
-                return deck, "mainboard"
-            
-            # Check sideboard region
-            sideboard_y = start_y + mainboard_height
-            sideboard_height = board_regions["sideboard"]["height"]
-            if (start_x <= world_x <= start_x + mainboard_width and 
-                sideboard_y <= world_y <= sideboard_y + sideboard_height):
-                return deck, "sideboard"
-            
-            # Check maybeboard region
-            maybeboard_y = sideboard_y + sideboard_height
-            maybeboard_height = board_regions["maybeboard"]["height"]
-            if (start_x <= world_x <= start_x + mainboard_width and 
-                maybeboard_y <= world_y <= maybeboard_y + maybeboard_height):
-                return deck, "maybeboard"
+            for board_name, (min_x, min_y, max_x, max_y) in geometry["regions"].items():
+                if min_x <= world_x <= max_x and min_y <= world_y <= max_y:
+                    return deck, board_name
         
         return None, None
 
@@ -1855,74 +1820,36 @@ class GUI_Manager:
         hovered_card = None
         
         # Find which card the mouse is hovering over (check deck cards first, then base cards)
-        for deck in self.deck_manager.decks:
-            if deck.id not in self.placed_decks:
+        candidates = self.query_screen_rect(pygame.Rect(mouse_pos[0], mouse_pos[1], 1, 1))
+        candidates.sort(key=lambda visible_card: visible_card["deck_id"] is None)
+        for visible_card in candidates:
+            card = visible_card["card"]
+            if not self.card_manager.textures.has(card):
                 continue
-                
-            for board_name, board_data in deck.deck.items():
-                for card_name, entries in board_data.items():
-                    if card_name not in self.card_manager.cards:
-                        continue
-                        
-                    card = self.card_manager.cards[card_name]
-                    if card.image_thumbs is None or len(card.image_thumbs) == 0:
-                        continue
-                    
-                    for entry in entries:
-                        world_x, world_y = entry["position"]
-                        screen_x = world_x * self.zoom + self.offset_x
-                        screen_y = world_y * self.zoom + self.offset_y
-                        scaled_w = int(LM.CARD_DIMENSIONS[0] * self.zoom)
-                        scaled_h = int(LM.CARD_DIMENSIONS[1] * self.zoom)
+            
+            world_x, world_y = visible_card["Position"]
+            screen_x = world_x * self.zoom + self.offset_x
+            screen_y = world_y * self.zoom + self.offset_y
+            scaled_w = int(LM.CARD_DIMENSIONS[0] * self.zoom)
+            scaled_h = int(LM.CARD_DIMENSIONS[1] * self.zoom)
 
-                        # Adjust for rotated Site cards
-                        is_site = getattr(card, "type", "").lower() == "site"
-                        if is_site:
-                            scaled_w, scaled_h = scaled_h, scaled_w
+            # Adjust for rotated Site cards
+            is_site = getattr(card, "type", "").lower() == "site"
+            if is_site:
+                scaled_w, scaled_h = scaled_h, scaled_w
 
-                        rect = pygame.Rect(screen_x, screen_y, scaled_w, scaled_h)
-                        if rect.collidepoint(mouse_pos):
-                            hovered_card = card
-                            break
-                    if hovered_card:
-                        break
-                if hovered_card:
-                    break
-            if hovered_card:
+            rect = pygame.Rect(screen_x, screen_y, scaled_w, scaled_h)
+            if rect.collidepoint(mouse_pos):
+                hovered_card = card
                 break
         
-        # If no deck card was found, check base cards
-        if not hovered_card:
-            for card in self.card_manager.cards.values():
-                if card.image_thumbs is None or len(card.image_thumbs) == 0:
-                    continue
-                
-                world_x, world_y = card.position
-                screen_x = world_x * self.zoom + self.offset_x
-                screen_y = world_y * self.zoom + self.offset_y
-                scaled_w = int(LM.CARD_DIMENSIONS[0] * self.zoom)
-                scaled_h = int(LM.CARD_DIMENSIONS[1] * self.zoom)
-
-                # Adjust for rotated Site cards
-                is_site = getattr(card, "type", "").lower() == "site"
-                if is_site:
-                    scaled_w, scaled_h = scaled_h, scaled_w
-
-                rect = pygame.Rect(screen_x, screen_y, scaled_w, scaled_h)
-                if rect.collidepoint(mouse_pos):
-                    hovered_card = card
-                    break
-        
-        if hovered_card and hovered_card.image_thumbs and len(hovered_card.image_thumbs) > 0:
+        if hovered_card and self.card_manager.textures.has(hovered_card):
             # Check if this is a site card (horizontal cards)
             is_site = getattr(hovered_card, "type", "").lower() == "site"
             
             preview_height = 420
             preview_width = int(preview_height * (LM.CARD_DIMENSIONS[0] / LM.CARD_DIMENSIONS[1]))
-            preview_surface = pygame.transform.smoothscale(hovered_card.image_thumbs[-1], (preview_width, preview_height))
-            
-            if is_site:
-                preview_surface = pygame.transform.rotate(preview_surface, -90)
+            preview_surface = self.surface_cache.get(hovered_card, (preview_width, preview_height), is_site)
             
             # Position in top right corner with some padding
             padding = 20
@@ -1937,6 +1864,10 @@ class GUI_Manager:
             # Draw the card preview
             self.window.blit(preview_surface, (preview_x, preview_y))
 
+    def is_animating(self) -> bool:
+        """Something on screen moves without input: spinners, progress messages, tiles still being built"""
+        return self.card_manager.loading or self.background_operation_status != "idle" or self.tiles_pending
+
     def run(self):
         running = True
         frame_times = {}  # Store timings per frame
@@ -1947,30 +1878,69 @@ class GUI_Manager:
         while running:
             frame_start = time.perf_counter()
 
+            # --- Frame pacing: full rate while things change, otherwise sleep until input arrives ---
+            idle = config.RENDER_ON_CHANGE and not self.is_animating() and \
+                frame_start - self.last_change > config.IDLE_AFTER_S
+            if idle:
+                # Wakes as soon as an event arrives, or after one idle frame to poll the loaders
+                first_event = pygame.event.wait(int(1000 / config.IDLE_FPS))
+                events = [] if first_event.type == pygame.NOEVENT else [first_event]
+                time_delta = self.clock.tick() / 1000.0
+            else:
+                time_delta = self.clock.tick(config.ACTIVE_FPS) / 1000.0
+                events = []
+            events += pygame.event.get()
+            raw_event_count = len(events)
+            events = coalesce_events(events)
+
             # --- Timing: Event Handling ---
             t0 = time.perf_counter()
-            time_delta = self.clock.tick(60) / 1000.0
             mouse_pos = pygame.mouse.get_pos()
             self.update_culling()
             self.sidebar.update(mouse_pos, time_delta)
             
-            for event in pygame.event.get():
-                running = self.handle_event(event)
+            for event in events:
+                running = self.handle_event(event) and running
             frame_times['Event'] = (time.perf_counter() - t0) * 1000
+            self.event_counts = (raw_event_count, len(events))
 
             # --- Timing: UI Manager Update ---
             t0 = time.perf_counter()
             self.manager.update(time_delta)
             frame_times['UI Manager'] = (time.perf_counter() - t0) * 1000
 
+            # --- Timing: Check Background Operations ---
+            t0 = time.perf_counter()
+            self.check_background_operation_queue()
+            replaced = self.card_manager.apply_catalog_update()
+            for card in replaced:
+                self.surface_cache.invalidate(card)
+            if replaced:
+                self.render_list.refresh_cards(self.card_manager.cards)
+                self.tile_cache.clear()
+            frame_times['BackgroundOps'] = (time.perf_counter() - t0) * 1000
+
+            # --- Timing: Upload Decoded Images (budgeted) ---
+            t0 = time.perf_counter()
+            images_loaded = self.card_manager.process_loaded_images()
+            frame_times['ImageUpload'] = (time.perf_counter() - t0) * 1000
+
+            # --- Only redraw when something changed ---
+            if events or replaced or images_loaded:
+                self.last_change = time.perf_counter()
+            elif idle:
+                continue  # The last frame is still on screen
+
             # --- Timing: Window Fill ---
             t0 = time.perf_counter()
             self.window.fill(self.background_color)
             frame_times['Fill'] = (time.perf_counter() - t0) * 1000
 
-            # --- Timing: Draw Grid ---
+            # --- Timing: Draw Grid and base cards (tile cache) ---
             t0 = time.perf_counter()
-            self.draw_grid()
+            self.static_tiles_drawn = self.draw_static_tiles()
+            if not self.static_tiles_drawn:
+                self.draw_grid()
             frame_times['Grid'] = (time.perf_counter() - t0) * 1000
 
             # --- Timing: Draw Cards ---
@@ -1989,11 +1959,6 @@ class GUI_Manager:
                 self.draw_loading_ui()
             frame_times['LoadingUI'] = (time.perf_counter() - t0) * 1000
 
-            # --- Timing: Check Background Operations ---
-            t0 = time.perf_counter()
-            self.check_background_operation_queue()
-            frame_times['BackgroundOps'] = (time.perf_counter() - t0) * 1000
-
             # --- Timing: Draw Background Operation UI ---
             t0 = time.perf_counter()
             self.draw_background_operation_ui()
@@ -2037,24 +2002,3 @@ class GUI_Manager:
                 last_fps_update = now
 
         pygame.quit()
-
-    def _is_card_selected(self, card_name: str, deck_id: Optional[str], board_name: Optional[str], entry_index: Optional[int]) -> bool:
-        """Check if a specific card instance is selected"""
-        
-        for sel_card_name, sel_deck_id, sel_board_name, sel_entry_index, sel_position in self.selected_cards:           
-            # Handle base cards (deck_id is None) - entry_index should be None for base cards
-            # But visible_cards uses -1 for base cards, so we need to handle both cases
-            if deck_id is None and sel_deck_id is None:
-                if (sel_card_name == card_name and 
-                    sel_board_name == board_name and 
-                    (sel_entry_index == entry_index or 
-                     (sel_entry_index is None and entry_index == -1))):
-                    return True
-            # Handle deck cards (deck_id is not None)
-            elif deck_id is not None and sel_deck_id is not None:
-                if (sel_card_name == card_name and 
-                    sel_deck_id == deck_id and 
-                    sel_board_name == board_name and 
-                    sel_entry_index == entry_index):
-                    return True
-        return False
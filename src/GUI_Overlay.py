@@ -0,0 +1,42 @@
+'''
+Cheap drawing for the region overlays (base and element bounding boxes, deck board regions).
+Region fills are clipped to the screen and blitted from one reusable translucent surface per
+colour, so a region costs the same at zoom 3 as at zoom 0.1. Labels come from the shared
+text cache (Util_Text_Cache).
+'''
+from typing import Dict, Tuple
+import pygame
+from Util_Text_Cache import text_cache
+
+Colour = Tuple[int, ...]
+
+
+class Region_Overlay:
+    def __init__(self):
+        self._fills: Dict[Colour, pygame.Surface] = {}  # RGBA -> translucent surface, grown to the largest clipped region
+
+    def fill(self, target: pygame.Surface, rect: pygame.Rect, rgba: Colour):
+        """Translucent fill of the part of rect that is on target."""
+        clipped = rect.clip(target.get_clip())
+        if clipped.width <= 0 or clipped.height <= 0:
+            return
+        surface = self._fills.get(rgba)
+        if surface is None or surface.get_width() < clipped.width or surface.get_height() < clipped.height:
+            width = max(clipped.width, surface.get_width() if surface else 0)
+            height = max(clipped.height, surface.get_height() if surface else 0)
+            # Opaque pixels with a per-surface alpha blend faster than per-pixel alpha
+            surface = pygame.Surface((width, height)).convert()
+            surface.fill(rgba[:3])
+            surface.set_alpha(rgba[3])
+            self._fills[rgba] = surface
+        target.blit(surface, clipped.topleft, (0, 0, clipped.width, clipped.height))
+
+    def region(self, target: pygame.Surface, rect: pygame.Rect, rgba: Colour, border: Colour, width: int):
+        """Translucent fill plus a solid border, skipped entirely when off screen."""
+        if not rect.colliderect(target.get_clip()):
+            return
+        self.fill(target, rect, rgba)
+        pygame.draw.rect(target, border, rect, width)
+
+    def label(self, text: str, colour: Colour, size: int) -> pygame.Surface:
+        return text_cache.render(text, colour, size)
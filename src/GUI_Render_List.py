@@ -0,0 +1,219 @@
+'''
+Packed render list of every card instance on the canvas.
+One row per spatial index key, kept in NumPy columns (world position, site orientation, texture id,
+deck, selection, far zoom colour) and updated from the spatial index's change log rather than rebuilt each frame.
+Culling and the world -> screen transform are a few array operations over all rows, and the
+renderer turns the result into a single Surface.blits call. While the selection is dragged its
+rows are drawn translated by drag_offset, the positions themselves only change on drop.
+'''
+from typing import Collection, Dict, Hashable, List, Optional, Set, Tuple
+import numpy as np
+from Card import Card
+from Util_Spatial_Index import Spatial_Index
+import Layout_Manager as LM
+
+# Outline flags per visible row
+FLAG_SELECTED = 1
+FLAG_OWNED = 2
+FLAG_MISSING = 4  # A collection is loaded and the card is not in it
+
+
+def is_site(card: Optional[Card]) -> bool:
+    # Sites are drawn rotated to landscape
+    return card is not None and (card.type or "").lower() == "site"
+
+
+def lod_color(card: Optional[Card]) -> Tuple[int, int, int]:
+    """Flat colour a card is drawn with when zoomed far out: its element, shaded by rarity."""
+    if card is None:
+        return (90, 90, 90)
+    element = "None" if not card.elements else ("Multiple" if len(card.elements) > 1 else card.elements[0])
+    base = LM.ELEMENT_COLORS.get(element, LM.ELEMENT_COLORS["None"])
+    brightness = LM.RARITY_BRIGHTNESS.get(card.rareity or "Ordinary", LM.RARITY_BRIGHTNESS["Ordinary"])
+    return (int(base[0] * brightness), int(base[1] * brightness), int(base[2] * brightness))
+
+
+class Render_List:
+    def __init__(self, capacity: int = 1024):
+        self.keys: List[Hashable] = []            # Row -> spatial key (card_name, deck_id, board_name, entry_id)
+        self.rows: Dict[Hashable, int] = {}       # Spatial key -> row
+        self.world = np.zeros((capacity, 2), dtype=np.float64)
+        self.site = np.zeros(capacity, dtype=bool)
+        self.texture = np.zeros(capacity, dtype=np.int32)   # Index into texture_names
+        self.deck = np.full(capacity, -1, dtype=np.int32)   # Index into deck_ids, -1 for base cards
+        self.selected = np.zeros(capacity, dtype=bool)
+        self.color = np.zeros(capacity, dtype=np.int32)     # Index into palette, for far zoom-out
+        self.palette: List[Tuple[int, int, int]] = []
+        self._palette_ids: Dict[Tuple[int, int, int], int] = {}
+        self.texture_names: List[str] = []        # Texture id -> card name
+        self._texture_ids: Dict[str, int] = {}
+        self.deck_ids: List[str] = []
+        self._deck_index: Dict[str, int] = {}
+        self._owned = np.zeros(0, dtype=bool)     # Per texture id
+        self._owned_names: Optional[Collection[str]] = None
+        self._owned_version: Hashable = None
+        self._selection: Set[Hashable] = set()
+        self.drag_offset: Optional[Tuple[float, float]] = None  # World translation of the selected rows mid-drag
+
+    def __len__(self):
+        return len(self.keys)
+
+    # --- Maintenance ---
+    def sync(self, spatial_index: Spatial_Index, cards: Dict[str, Card]) -> List[Tuple[float, float]]:
+        """Apply the positions that changed in the spatial index since the last sync.
+        Returns the old and new positions of the base cards that changed, for the tile cache."""
+        moved = []
+        for key, position in spatial_index.drain_changes().items():
+            row = self.rows.get(key)
+            if key[1] is None:
+                if row is not None:
+                    moved.append(tuple(self.world[row].tolist()))
+                if position is not None:
+                    moved.append(position)
+            if position is None:
+                self._remove(key)
+            else:
+                self._upsert(key, position, cards.get(key[0]))
+        return moved
+
+    def position(self, key: Hashable) -> Optional[Tuple[float, float]]:
+        row = self.rows.get(key)
+        return None if row is None else tuple(self.world[row].tolist())
+
+    def refresh_cards(self, cards: Dict[str, Card]):
+        """Re-read per-card columns, e.g. after the card catalog was swapped."""
+        for row, key in enumerate(self.keys):
+            card = cards.get(key[0])
+            self.site[row] = is_site(card)
+            self.color[row] = self._color_id(lod_color(card))
+
+    def set_selection(self, keys: Set[Hashable]):
+        """Selected spatial keys, only the rows that changed are touched."""
+        if keys == self._selection:
+            return
+        for key in self._selection - keys:
+            row = self.rows.get(key)
+            if row is not None:
+                self.selected[row] = False
+        for key in keys - self._selection:
+            row = self.rows.get(key)
+            if row is not None:
+                self.selected[row] = True
+        self._selection = set(keys)
+
+    def set_owned(self, owned_names: Optional[Collection[str]], version: Hashable) -> bool:
+        """Card names in the loaded collection, None when there is no collection, and the collection's
+        version (rows are only re-flagged when it moved on). True if it changed."""
+        if version == self._owned_version:
+            return False
+        self._owned_names = owned_names
+        self._owned_version = version
+        self._owned = np.array([owned_names is not None and name in owned_names for name in self.texture_names], dtype=bool)
+        return True
+
+    # --- Per frame ---
+    def visible(self, min_x: float, min_y: float, max_x: float, max_y: float, extent: float,
+                placed_decks: Collection[str], static: bool = False) -> np.ndarray:
+        """Rows whose card may overlap the world rect, base cards first (draw order).
+        static leaves out the rows being dragged, for layers cached at rest."""
+        n = len(self.keys)
+        world = self.world_positions(slice(0, n))
+        x, y = world[:, 0], world[:, 1]
+        # A card can reach into the rect from up to extent to the left and above
+        mask = (x >= min_x - extent) & (x <= max_x) & (y >= min_y - extent) & (y <= max_y)
+        # Deck cards only while their deck is placed, slot 0 is the base cards
+        shown = np.array([True] + [deck_id in placed_decks for deck_id in self.deck_ids], dtype=bool)
+        mask &= shown[self.deck[:n] + 1]
+        if static and self.drag_offset is not None:
+            mask &= ~self.selected[:n]
+        rows = np.flatnonzero(mask)
+        return rows[np.argsort(self.deck[rows] >= 0, kind="stable")]
+
+    def world_positions(self, rows) -> np.ndarray:
+        """World top-left corners as drawn, the selection shifted by drag_offset."""
+        world = self.world[rows]
+        if self.drag_offset is not None:
+            world = world + self.selected[rows, None] * np.asarray(self.drag_offset)
+        return world
+
+    def dragged(self, rows: np.ndarray) -> np.ndarray:
+        """Per row, whether it is currently drawn away from its stored position."""
+        if self.drag_offset is None:
+            return np.zeros(len(rows), dtype=bool)
+        return self.selected[rows]
+
+    def screen_positions(self, rows: np.ndarray, zoom: float, offset: Tuple[float, float]) -> np.ndarray:
+        """(len(rows), 2) int screen top-left corners."""
+        return (self.world_positions(rows) * zoom + offset).astype(np.int32)
+
+    def flags(self, rows: np.ndarray) -> np.ndarray:
+        flags = np.where(self.selected[rows], FLAG_SELECTED, 0).astype(np.uint8)
+        if self._owned_names is not None:
+            owned = self._owned[self.texture[rows]]
+            flags |= np.where(owned, FLAG_OWNED, FLAG_MISSING).astype(np.uint8)
+        return flags
+
+    def names(self, rows: np.ndarray) -> Set[str]:
+        return {self.texture_names[texture_id] for texture_id in np.unique(self.texture[rows]).tolist()}
+
+    # --- Rows ---
+    def _upsert(self, key: Hashable, position: Tuple[float, float], card: Optional[Card]):
+        row = self.rows.get(key)
+        if row is None:
+            row = len(self.keys)
+            if row == len(self.site):
+                self._grow()
+            self.rows[key] = row
+            self.keys.append(key)
+            self.texture[row] = self._texture_id(key[0])
+            self.deck[row] = -1 if key[1] is None else self._deck_id(key[1])
+            self.selected[row] = key in self._selection
+        self.world[row] = position
+        self.site[row] = is_site(card)
+        self.color[row] = self._color_id(lod_color(card))
+
+    def _remove(self, key: Hashable):
+        row = self.rows.pop(key, None)
+        if row is None:
+            return
+        last = len(self.keys) - 1
+        if row != last:
+            # Swap the last row into the hole to keep the columns packed
+            moved = self.keys[last]
+            self.keys[row] = moved
+            self.rows[moved] = row
+            for column in (self.world, self.site, self.texture, self.deck, self.selected, self.color):
+                column[row] = column[last]
+        self.keys.pop()
+
+    def _grow(self):
+        capacity = len(self.site) * 2
+        self.world = np.resize(self.world, (capacity, 2))
+        self.site = np.resize(self.site, capacity)
+        self.texture = np.resize(self.texture, capacity)
+        self.deck = np.resize(self.deck, capacity)
+        self.selected = np.resize(self.selected, capacity)
+        self.color = np.resize(self.color, capacity)
+
+    def _texture_id(self, name: str) -> int:
+        texture_id = self._texture_ids.get(name)
+        if texture_id is None:
+            texture_id = self._texture_ids[name] = len(self.texture_names)
+            self.texture_names.append(name)
+            owned = self._owned_names is not None and name in self._owned_names
+            self._owned = np.append(self._owned, owned)
+        return texture_id
+
+    def _color_id(self, color: Tuple[int, int, int]) -> int:
+        color_id = self._palette_ids.get(color)
+        if color_id is None:
+            color_id = self._palette_ids[color] = len(self.palette)
+            self.palette.append(color)
+        return color_id
+
+    def _deck_id(self, deck_id: str) -> int:
+        index = self._deck_index.get(deck_id)
+        if index is None:
+            index = self._deck_index[deck_id] = len(self.deck_ids)
+            self.deck_ids.append(deck_id)
+        return index
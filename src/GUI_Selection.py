@@ -0,0 +1,74 @@
+'''
+Selection store for card instances on the canvas.
+Selected cards are kept in a dict keyed by the instance's spatial key (card_name, deck_id,
+board_name, entry_id), the same key the spatial index and render list use, so membership,
+add and remove are O(1) however many cards are selected. Iterating still yields the
+(card_name, deck_id, board_name, entry_id, position) tuples the GUI works with. entry_id is the
+copy's stable instance id in its deck, so keys stay valid when other copies are removed.
+'''
+from typing import Dict, Hashable, Iterable, Iterator, Optional, Tuple
+
+Selection_Tuple = Tuple[str, Optional[str], Optional[str], Optional[int], Tuple[float, float]]
+
+
+def selection_key(card_name: str, deck_id: Optional[str], board_name: Optional[str], entry_id: Optional[int]) -> Hashable:
+    """Spatial key of a card instance, base cards are (card_name, None, None, None) whatever id they came with."""
+    if deck_id is None:
+        return (card_name, None, None, None)
+    return (card_name, deck_id, board_name, entry_id)
+
+
+class Selection:
+    def __init__(self):
+        self._positions: Dict[Hashable, Tuple[float, float]] = {}  # Spatial key -> position when selected or last moved
+        self.version = 0  # Bumped on every change, so the renderer only re-flags when it moved on
+
+    def __len__(self):
+        return len(self._positions)
+
+    def __bool__(self):
+        return bool(self._positions)
+
+    def __contains__(self, item) -> bool:
+        """Accepts a spatial key or a selection tuple, the position is ignored."""
+        return selection_key(*item[:4]) in self._positions
+
+    def __iter__(self) -> Iterator[Selection_Tuple]:
+        for key, position in list(self._positions.items()):
+            yield (*key, position)
+
+    def keys(self):
+        return self._positions.keys()
+
+    def add(self, selection_tuple: Selection_Tuple):
+        self._positions[selection_key(*selection_tuple[:4])] = selection_tuple[4]
+        self.version += 1
+
+    def update(self, selection_tuples: Iterable[Selection_Tuple]):
+        for selection_tuple in selection_tuples:
+            self._positions[selection_key(*selection_tuple[:4])] = selection_tuple[4]
+        self.version += 1
+
+    def discard(self, item):
+        if self._positions.pop(selection_key(*item[:4]), None) is not None:
+            self.version += 1
+
+    def difference_update(self, items: Iterable):
+        for item in items:
+            self._positions.pop(selection_key(*item[:4]), None)
+        self.version += 1
+
+    def replace(self, selection_tuples: Iterable[Selection_Tuple]):
+        self._positions.clear()
+        self.update(selection_tuples)
+
+    def clear(self):
+        if self._positions:
+            self._positions.clear()
+            self.version += 1
+
+    def move(self, item, position: Tuple[float, float]):
+        """Record a selected card's new position, no-op if it is not selected."""
+        key = selection_key(*item[:4])
+        if key in self._positions:
+            self._positions[key] = position
@@ -0,0 +1,88 @@
+from collections import OrderedDict
+from typing import Dict, Tuple
+import pygame
+from Card import Card
+from Texture_Manager import Texture_Manager, surface_bytes
+
+
+class Surface_Cache:
+    """
+    LRU cache of ready-to-blit card surfaces.
+    Surfaces are keyed by (card slug, zoom bucket, orientation), the zoom bucket being the
+    on-screen pixel size so a bucket always maps to one exact scale.
+    Panning at a constant zoom only blits, zooming rebuilds only the cards that get drawn.
+    A surface is rebuilt when the Texture_Manager levels it was scaled from change.
+    Unsmoothed surfaces (nearest-neighbour scale, for the middle zoom tier) are cached separately.
+    """
+
+    def __init__(self, textures: Texture_Manager, max_bytes: int = 256 * 1024 * 1024):
+        self.textures = textures
+        self.max_bytes = max_bytes
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        # (slug, size, rotated, smooth) -> (surface, surface bytes, texture generation, upscaled), oldest first
+        self._entries: "OrderedDict[Tuple[str, Tuple[int, int], bool, bool], Tuple[pygame.Surface, int, int, bool]]" = OrderedDict()
+
+    def get(self, card: Card, size: Tuple[int, int], rotated: bool = False, smooth: bool = True) -> pygame.Surface | None:
+        """Return the card image scaled to size (before rotation), building it on a miss."""
+        size = (max(1, size[0]), max(1, size[1]))
+        entry_key = (Texture_Manager.key(card), size, rotated, smooth)
+        generation = self.textures.generation(card)
+
+        entry = self._entries.get(entry_key)
+        if entry is not None and entry[2] == generation:
+            self.hits += 1
+            self._entries.move_to_end(entry_key)
+            if entry[3]:
+                self.textures.source(card, size[0])  # Scaled up from a small level, keep asking for the larger ones
+            return entry[0]
+
+        source = self.textures.source(card, size[0])
+        if source is None:
+            return None
+
+        self.misses += 1
+        if source.get_size() == size:
+            surface = source
+        elif smooth:
+            surface = pygame.transform.smoothscale(source, size)
+        else:
+            surface = pygame.transform.scale(source, size)
+        if rotated:
+            surface = pygame.transform.rotate(surface, -90)
+
+        self._forget(entry_key)
+        nbytes = surface_bytes(surface)
+        self._entries[entry_key] = (surface, nbytes, generation, source.get_width() < size[0])
+        self.used_bytes += nbytes
+        self._evict()
+        return surface
+
+    def invalidate(self, card: Card):
+        """Drop every cached surface of a card, e.g. after its image was reloaded."""
+        key = Texture_Manager.key(card)
+        for entry_key in [k for k in self._entries if k[0] == key]:
+            self._forget(entry_key)
+
+    def clear(self):
+        self._entries.clear()
+        self.used_bytes = 0
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "surfaces": len(self._entries),
+            "mb": self.used_bytes / (1024 * 1024),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def _forget(self, entry_key):
+        entry = self._entries.pop(entry_key, None)
+        if entry is not None:
+            self.used_bytes -= entry[1]
+
+    def _evict(self):
+        # Keep the most recent entry even if it alone is over budget
+        while self.used_bytes > self.max_bytes and len(self._entries) > 1:
+            self._forget(next(iter(self._entries)))
@@ -0,0 +1,89 @@
+'''
+Tile cache for the static canvas layer: background, grid and base cards.
+The zoomed world is cut into fixed-size pixel tiles, tile (tx, ty) covering world pixels
+[tx * size, (tx + 1) * size) at the current zoom. Tiles are rendered once and then panning is a
+handful of tile blits. A tile is dropped when a card in it moves or its image changes, and every
+tile is dropped when the zoom or the layer's look (colours, grid offset, outlines) changes.
+'''
+import math
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, Optional, Tuple
+import pygame
+from Texture_Manager import surface_bytes
+
+TILE_SIZE = 512  # Screen pixels per tile edge
+
+
+class Tile_Cache:
+    def __init__(self, max_bytes: int, tile_size: int = TILE_SIZE):
+        self.tile_size = tile_size
+        self.max_bytes = max_bytes
+        self.used_bytes = 0
+        self.zoom: Optional[float] = None
+        self.style: Any = None
+        self.built = 0
+        self.dropped = 0
+        self._tiles: "OrderedDict[Tuple[int, int], pygame.Surface]" = OrderedDict()  # (tx, ty), oldest first
+
+    def configure(self, zoom: float, style: Any):
+        """Tiles only hold for one zoom and look, anything else starts over."""
+        if zoom != self.zoom or style != self.style:
+            self.zoom = zoom
+            self.style = style
+            self.clear()
+
+    def tile_range(self, offset: Tuple[int, int], screen_size: Tuple[int, int], margin: int = 0) -> Iterator[Tuple[int, int]]:
+        """Tiles covering the screen (plus margin tiles around it), row by row."""
+        size = self.tile_size
+        tx0 = math.floor(-offset[0] / size) - margin
+        ty0 = math.floor(-offset[1] / size) - margin
+        tx1 = math.floor((screen_size[0] - 1 - offset[0]) / size) + margin
+        ty1 = math.floor((screen_size[1] - 1 - offset[1]) / size) + margin
+        for ty in range(ty0, ty1 + 1):
+            for tx in range(tx0, tx1 + 1):
+                yield tx, ty
+
+    def get(self, tx: int, ty: int) -> Optional[pygame.Surface]:
+        surface = self._tiles.get((tx, ty))
+        if surface is not None:
+            self._tiles.move_to_end((tx, ty))
+        return surface
+
+    def __contains__(self, tile: Tuple[int, int]):
+        return tile in self._tiles
+
+    def put(self, tx: int, ty: int, surface: pygame.Surface):
+        self._forget((tx, ty))
+        self._tiles[(tx, ty)] = surface
+        self.used_bytes += surface_bytes(surface)
+        self.built += 1
+        while self.used_bytes > self.max_bytes and len(self._tiles) > 1:
+            self._forget(next(iter(self._tiles)))
+
+    def invalidate_world_rect(self, min_x: float, min_y: float, max_x: float, max_y: float):
+        """Drop the tiles overlapping a world rect, e.g. a card's old or new footprint."""
+        if self.zoom is None or not self._tiles:
+            return
+        size = self.tile_size
+        for ty in range(math.floor(min_y * self.zoom / size), math.floor(max_y * self.zoom / size) + 1):
+            for tx in range(math.floor(min_x * self.zoom / size), math.floor(max_x * self.zoom / size) + 1):
+                if (tx, ty) in self._tiles:
+                    self._forget((tx, ty))
+                    self.dropped += 1
+
+    def clear(self):
+        self._tiles.clear()
+        self.used_bytes = 0
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "tiles": len(self._tiles),
+            "mb": self.used_bytes / (1024 * 1024),
+            "built": self.built,
+            "dropped": self.dropped,
+        }
+
+    def _forget(self, tile: Tuple[int, int]):
+        surface = self._tiles.pop(tile, None)
+        if surface is not None:
+            self.used_bytes -= surface_bytes(surface)
@@ -0,0 +1,303 @@
+'''
+Staged card image loader.
+    fetch   - threads read the cached webp or download it (pooled HTTP), bounded by the fetched queue
+    decode  - a process pool decodes and resizes the requested thumb levels to raw RGBA, bounded by in-flight decodes
+    hand-off - the main thread polls ready results and turns them into surfaces
+Each stage blocks on a full queue downstream, so a slow main thread throttles decoding and a
+slow decode throttles fetching instead of piling images up in memory.
+Fetches are taken in priority order (see Load_Scheduler) and failures are retried with backoff.
+Fetch threads take turns on each cache file, so a card whose small and large levels are requested
+together is downloaded once, and downloads land under a temporary name first so no thread ever
+reads a half-written file.
+Decode workers are spawned, so they import this module (kept free of pygame) and re-run the top
+level of the main script, which keeps its GUI imports under the __main__ guard for that reason.
+A worker that dies (out of memory, a crash in a native decoder) breaks the pool: it is replaced
+and the decodes that were in flight go back through the retry path.
+'''
+import hashlib
+import heapq
+import itertools
+import multiprocessing
+import os
+import queue
+import random
+import threading
+import time
+from contextlib import contextmanager
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+from typing import Any, Callable, Dict, List, Tuple
+from PIL import Image
+from Util_HTTP import http_get
+
+Thumb_Levels = List[Tuple[Tuple[int, int], bytes]]  # ((width, height), raw RGBA) per thumb level
+Image_Key = Tuple[str, int, int, str]               # (image file name, size, mtime_ns, content hash)
+
+
+def decode_card_image(img_data: bytes, thumb_levels: List[float]) -> Thumb_Levels:
+    """Runs in a decode process: webp bytes -> raw RGBA for the requested thumb levels, in the order given."""
+    img = Image.open(BytesIO(img_data)).convert("RGBA")
+    levels = {}
+    current = img
+    # Largest first, each level is resampled from the previous (next larger) one rather than the full image
+    for scale in sorted(thumb_levels, reverse=True):
+        size = (int(img.width * scale), int(img.height * scale))
+        if current.size != size:
+            current = current.resize(size, Image.Resampling.LANCZOS)
+        levels[scale] = (size, current.tobytes("raw", "RGBA"))
+    return [levels[scale] for scale in thumb_levels]
+
+
+def default_priority(card, scales: List[float]) -> Tuple:
+    # Popular cards first until the GUI says what is on screen
+    return (0, 0, -(card.hotscore or 0), 0.0)
+
+
+class Load_Scheduler:
+    """
+    Priority queue of (card, scales, attempt) load requests.
+    The priority function can be swapped at any time (e.g. when the view pans), which re-ranks
+    everything still waiting. Retries wait out their backoff before competing again.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._heap: List[Tuple[Tuple, int, Tuple]] = []     # (priority, seq, item)
+        self._delayed: List[Tuple[float, int, Tuple]] = []  # (due time, seq, item)
+        self._seq = itertools.count()
+        self.priority: Callable[[Any, List[float]], Tuple] = default_priority
+
+    def __len__(self):
+        with self._cond:
+            return len(self._heap) + len(self._delayed)
+
+    def put(self, item: Tuple[Any, List[float], int], delay: float = 0.0):
+        with self._cond:
+            if delay > 0:
+                heapq.heappush(self._delayed, (time.monotonic() + delay, next(self._seq), item))
+            else:
+                heapq.heappush(self._heap, (self.priority(item[0], item[1]), next(self._seq), item))
+            self._cond.notify()
+
+    def get(self) -> Tuple[Any, List[float], int]:
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                while self._delayed and self._delayed[0][0] <= now:
+                    _, seq, item = heapq.heappop(self._delayed)
+                    heapq.heappush(self._heap, (self.priority(item[0], item[1]), seq, item))
+                if self._heap:
+                    return heapq.heappop(self._heap)[2]
+                self._cond.wait(timeout=self._delayed[0][0] - now if self._delayed else None)
+
+    def reprioritize(self, priority: Callable[[Any, List[float]], Tuple]):
+        with self._cond:
+            self.priority = priority
+            self._heap = [(priority(item[0], item[1]), seq, item) for _, seq, item in self._heap]
+            heapq.heapify(self._heap)
+
+
+class Image_Pipeline:
+    def __init__(self, assets_path: str, fetch_workers: int, decode_workers: int,
+                 fetch_queue_size: int, ready_queue_size: int, max_retries: int = 4):
+        self.assets_path = assets_path
+        self.fetch_workers = fetch_workers
+        self.decode_workers = decode_workers
+        self.max_retries = max_retries
+        self.pending = Load_Scheduler()                         # (card, scales, attempt) waiting to be fetched
+        self.fetched = queue.Queue(maxsize=fetch_queue_size)    # (card, scales, attempt, webp bytes, image key) waiting to be decoded
+        self.ready = queue.Queue(maxsize=ready_queue_size)      # (card, scales, thumb levels or None if it failed, image key)
+        self.lock = threading.Lock()
+        self._file_locks: Dict[str, List] = {}  # Cache file -> [lock, threads using it], see _file_lock
+        self.outstanding = 0  # Submitted cards not yet handed off or failed
+        self.started = False
+        self.counts = {"fetched": 0, "downloaded": 0, "decoded": 0, "delivered": 0, "retried": 0, "failed": 0}
+        self.downloaded_bytes = 0
+        self.batch_start = time.perf_counter()
+
+    def submit(self, cards: List[Tuple[Any, List[float]]]):
+        """Queue (card, thumb scales to decode) pairs."""
+        with self.lock:
+            if self.outstanding == 0:
+                # New batch, restart the throughput clock
+                self.batch_start = time.perf_counter()
+                self.counts = dict.fromkeys(self.counts, 0)
+                self.downloaded_bytes = 0
+            self.outstanding += len(cards)
+        for card, scales in cards:
+            self.pending.put((card, scales, 0))
+        self._start()
+
+    def set_priority(self, priority: Callable[[Any, List[float]], Tuple]):
+        """Re-rank waiting loads, lower tuples load first."""
+        self.pending.reprioritize(priority)
+
+    def idle(self) -> bool:
+        with self.lock:
+            return self.outstanding == 0
+
+    def poll(self, max_items: int) -> List[Tuple[Any, List[float], Thumb_Levels | None, Image_Key | None]]:
+        """Main thread: take up to max_items finished cards, failed ones come back with no levels."""
+        results = []
+        while len(results) < max_items:
+            try:
+                results.append(self.ready.get_nowait())
+            except queue.Empty:
+                break
+        if results:
+            with self.lock:
+                self.outstanding -= len(results)
+                self.counts["delivered"] += sum(1 for result in results if result[2] is not None)
+        return results
+
+    def stats(self) -> Dict[str, float]:
+        with self.lock:
+            elapsed = max(time.perf_counter() - self.batch_start, 1e-6)
+            return {
+                **self.counts,
+                "outstanding": self.outstanding,
+                "fetch_per_s": self.counts["fetched"] / elapsed,
+                "decode_per_s": self.counts["decoded"] / elapsed,
+                "deliver_per_s": self.counts["delivered"] / elapsed,
+                "download_mb": self.downloaded_bytes / (1024 * 1024),
+                "elapsed": elapsed,
+            }
+
+    def _start(self):
+        with self.lock:
+            if self.started:
+                return
+            self.started = True
+        for i in range(self.fetch_workers):
+            threading.Thread(target=self._fetch_worker, name=f"image-fetch-{i}", daemon=True).start()
+        threading.Thread(target=self._decode_dispatcher, name="image-decode", daemon=True).start()
+
+    def _failed(self, card, scales: List[float], attempt: int, e: Exception):
+        if attempt < self.max_retries:
+            delay = min(2 ** attempt, 30) + random.random()
+            print(f"Error loading card {getattr(card, 'name', 'unknown')}: {e}, retrying in {delay:.1f}s")
+            with self.lock:
+                self.counts["retried"] += 1
+            self.pending.put((card, scales, attempt + 1), delay=delay)
+            return
+        print(f"Error loading card {getattr(card, 'name', 'unknown')}: {e}, giving up after {attempt + 1} attempts")
+        with self.lock:
+            self.counts["failed"] += 1
+        self.ready.put((card, scales, None, None))  # Let the main thread know, it may want to ask again later
+
+    def _cached_path(self, card) -> str:
+        return os.path.join(self.assets_path, os.path.basename(card.image_url))
+
+    @contextmanager
+    def _file_lock(self, filename: str):
+        """Held while reading, downloading or deleting a cache file, one thread per file at a time."""
+        with self.lock:
+            entry = self._file_locks.setdefault(filename, [threading.Lock(), 0])
+            entry[1] += 1
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self.lock:
+                entry[1] -= 1
+                if not entry[1]:
+                    del self._file_locks[filename]
+
+    def _remove_cached(self, card, image_key: Image_Key):
+        # Only the file that failed to decode, not one another thread has fetched again since
+        filename = self._cached_path(card)
+        with self._file_lock(filename):
+            try:
+                stat = os.stat(filename)
+                if (stat.st_size, stat.st_mtime_ns) == image_key[1:3]:
+                    os.remove(filename)
+            except OSError:
+                pass
+
+    def _fetch_worker(self):
+        while True:
+            card, scales, attempt = self.pending.get()
+            try:
+                filename = self._cached_path(card)
+                with self._file_lock(filename):
+                    if os.path.exists(filename):
+                        with open(filename, "rb") as f:
+                            img_data = f.read()
+                    else:
+                        response = http_get(card.image_url, timeout=5)
+                        response.raise_for_status()
+                        img_data = response.content
+                        with open(filename + ".tmp", "wb") as f:
+                            f.write(img_data)
+                        os.replace(filename + ".tmp", filename)
+                        with self.lock:
+                            self.counts["downloaded"] += 1
+                            self.downloaded_bytes += len(img_data)
+                    stat = os.stat(filename)
+                image_key = (os.path.basename(filename), stat.st_size, stat.st_mtime_ns,
+                             hashlib.blake2b(img_data, digest_size=16).hexdigest())
+            except Exception as e:
+                self._failed(card, scales, attempt, e)
+                continue
+            with self.lock:
+                self.counts["fetched"] += 1
+            self.fetched.put((card, scales, attempt, img_data, image_key))  # Blocks while the decode stage is behind
+
+    def _new_decode_pool(self) -> ProcessPoolExecutor:
+        # Spawned rather than forked, the fetch threads may hold locks at fork time
+        return ProcessPoolExecutor(max_workers=self.decode_workers, mp_context=multiprocessing.get_context("spawn"))
+
+    def _decode_dispatcher(self):
+        pool = self._new_decode_pool()
+        in_flight = {}
+        max_in_flight = self.decode_workers * 2
+        while True:
+            # --- Feed the pool, blocking only when there is nothing else to wait on ---
+            broken = None
+            while len(in_flight) < max_in_flight:
+                try:
+                    card, scales, attempt, img_data, image_key = self.fetched.get(block=not in_flight)
+                except queue.Empty:
+                    break
+                try:
+                    in_flight[pool.submit(decode_card_image, img_data, scales)] = (card, scales, attempt, image_key)
+                except BrokenProcessPool as e:
+                    self._failed(card, scales, attempt, e)
+                    broken = e
+                    break
+
+            if broken is None:
+                done, _ = wait(in_flight, timeout=0.05, return_when=FIRST_COMPLETED)
+            else:
+                done = set()
+            for future in done:
+                card, scales, attempt, image_key = in_flight.pop(future)
+                try:
+                    levels = future.result()
+                except BrokenProcessPool as e:
+                    self._failed(card, scales, attempt, e)
+                    broken = e
+                    continue
+                except OSError as e:
+                    # PIL could not read it (UnidentifiedImageError, truncated file): the cached file is
+                    # bad, fetch it again on the retry
+                    self._remove_cached(card, image_key)
+                    self._failed(card, scales, attempt, e)
+                    continue
+                except Exception as e:
+                    # Cancelled, or something unrelated to the file, keep the cache
+                    self._failed(card, scales, attempt, e)
+                    continue
+                with self.lock:
+                    self.counts["decoded"] += 1
+                self.ready.put((card, scales, levels, image_key))  # Blocks while the main thread is behind
+
+            if broken is not None:
+                # A worker died and took the pool with it, start a fresh one and retry what was in flight
+                print(f"⚠️ Decode pool broke ({broken}), restarting it and retrying {len(in_flight)} in-flight images")
+                for card, scales, attempt, image_key in in_flight.values():
+                    self._failed(card, scales, attempt, broken)
+                in_flight.clear()
+                pool.shutdown(wait=False, cancel_futures=True)
+                pool = self._new_decode_pool()
@@ -13,6 +13,17 @@ BOARD_PADDING = 4  # 220
 REGION_PADDING = 2  # 110
 SMALL_PADDING = 1  # 55
 
+# Element colours for region boxes and far zoom-out cards, rarer cards are drawn brighter
+ELEMENT_COLORS = {
+    "Air": (120, 200, 255),
+    "Fire": (255, 100, 60),
+    "Earth": (180, 140, 80),
+    "Water": (80, 180, 255),
+    "None": (180, 180, 180),
+    "Multiple": (200, 100, 200),
+}
+RARITY_BRIGHTNESS = {"Ordinary": 0.55, "Exceptional": 0.7, "Elite": 0.85, "Unique": 1.0}
+
 
 
 
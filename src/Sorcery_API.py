@@ -3,9 +3,11 @@ import os
 from Curiosa_API import CuriosaAPI
 from Util_Debug import DebugDisplay
 import requests
+from Util_HTTP import http_get
 from typing import Dict, Any, Optional, Generator, List, Tuple
-from Util_IO import _save_json
+from Util_IO import _save_json, _content_hash
 import time
+import threading
 from Card import Card
 from Util_IO import SORCERY_DATA_PATH, DATA_PATH
 
@@ -13,6 +15,7 @@ from Util_IO import SORCERY_DATA_PATH, DATA_PATH
 class SorceryAPI:
     all_cards: List[Dict[str, Any]] = []
     have_loaded_cards = False
+    loaded = threading.Event()  # Set once check_card_list has finished, whether or not it succeeded
     online_card_count = -1 
     
     @staticmethod
@@ -23,7 +26,7 @@ class SorceryAPI:
         }
 
         try:
-            response = requests.get(url, headers=headers)
+            response = http_get(url, headers=headers)
             response.raise_for_status()  # Raise error for bad status codes
             if response.ok:
                 try:
@@ -56,7 +59,12 @@ class SorceryAPI:
         
         print("✅ Local Sorcery card list is up to date.")
         SorceryAPI.have_loaded_cards = True
+        SorceryAPI.loaded.set()
         
+    @staticmethod
+    def card_hashes(cards: List[Dict[str, Any]]) -> Dict[str, str]:
+        return {card.get("name"): _content_hash(card) for card in cards}
+
     @staticmethod  
     def check_card_list():
         os.makedirs(DATA_PATH, exist_ok=True)
@@ -74,17 +82,25 @@ class SorceryAPI:
             print(f"🌐 Online card count: {len(online_cards)}")
         except Exception as e:
             print(f"❌ Failed to fetch online cards: {e}")
+            SorceryAPI.loaded.set()
+            return
+
+        if not online_cards:
+            print("❌ No cards returned from sorceryAPI, keeping local card list.")
+            SorceryAPI.loaded.set()
             return
 
-        if len(SorceryAPI.all_cards) != len(online_cards):
-            print(f"🔄 Card count mismatch. Got {len(SorceryAPI.all_cards)} cards, expected {len(online_cards)}.")
+        local_hashes = SorceryAPI.card_hashes(SorceryAPI.all_cards)
+        online_hashes = SorceryAPI.card_hashes(online_cards)
+        if local_hashes != online_hashes:
+            changed = sum(1 for name, h in online_hashes.items() if local_hashes.get(name) != h)
+            removed = len(local_hashes.keys() - online_hashes.keys())
+            print(f"🔄 Card list changed: {changed} new or updated, {removed} removed.")
             SorceryAPI.rebuild_card_list(online_cards)
         else:
             print("✅ Local Sorcery card list is up to date.")
             SorceryAPI.have_loaded_cards = True
+            SorceryAPI.loaded.set()
     
     def __init__(self):
         return
-      
-      
-SorceryAPI.check_card_list()
\ No newline at end of file
@@ -0,0 +1,203 @@
+'''
+Owner of every card image surface, looked up by card slug.
+The small thumb levels (the ones kept in the mip pack) stay resident for every card so the
+canvas can always draw something. Each larger level is made the first time a card is drawn
+big enough to need it: derived from a resident larger level when there is one, otherwise
+decoded in the background while the card shows the best level it already has.
+Small levels up to atlas_max_scale live in shared texture atlases, one per level size.
+Large levels are kept in an LRU bounded by a memory budget.
+'''
+from collections import OrderedDict, deque
+from itertools import islice
+from typing import Callable, Dict, List, Optional, Tuple
+import pygame
+from Card import Card
+import Layout_Manager as LM
+from Util_Texture_Atlas import Texture_Atlas
+
+
+def surface_bytes(surface: pygame.Surface) -> int:
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+def surfaces_from_levels(levels: List[Tuple[Tuple[int, int], bytes]]) -> List[pygame.Surface]:
+    """Raw RGBA levels from Image_Pipeline -> display-format surfaces, main thread only."""
+    return [pygame.image.frombytes(raw, size, "RGBA").convert_alpha() for size, raw in levels]
+
+
+def level_width(scale: float) -> int:
+    return int(LM.CARD_PIXEL_DIMENSIONS[0] * scale)
+
+
+class Texture_Manager:
+    def __init__(self, small_scales: List[float], budget_bytes: int, atlas_max_scale: float = 0.0):
+        self.small_scales = list(small_scales)
+        self.atlas_scales = [scale for scale in self.small_scales if scale <= atlas_max_scale]
+        self.atlases: Dict[Tuple[int, int], Texture_Atlas] = {}         # Level size -> atlas of that size
+        self.large_scales = sorted(scale for scale in Card.thumb_levels if scale not in self.small_scales)
+        self.budget_bytes = budget_bytes
+        self.loader: Optional[Callable[[Card, List[float]], None]] = None  # Queues a decode, set by Card_Manager
+        self._small: Dict[str, List[pygame.Surface]] = {}                # slug -> small levels, smallest first
+        self._large: "OrderedDict[Tuple[str, float], pygame.Surface]" = OrderedDict()  # (slug, scale), oldest first
+        self._pending: set = set()                                      # (slug, scale) with a decode queued
+        self._generation: Dict[str, int] = {}                           # Bumped whenever a slug's levels change
+        self.changes: "deque[str]" = deque()                            # Slugs in the order their levels changed, see changes_since
+        self.changes_base = 0                                           # Cursor of changes[0], entries before it were dropped
+        self.small_bytes = 0
+        self.large_bytes = 0
+        self.evictions = 0
+        self.derived = 0
+
+    @staticmethod
+    def key(card: Card) -> str:
+        return card.slug or card.name
+
+    def has(self, card: Card) -> bool:
+        """True once the card's small levels are resident, i.e. it can be drawn."""
+        return self.key(card) in self._small
+
+    def generation(self, card: Card) -> int:
+        return self._generation.get(self.key(card), 0)
+
+    def changes_since(self, cursor: int) -> Tuple[List[str], int]:
+        """Slugs whose levels changed after cursor, and the cursor to pass next time.
+        The entries before cursor have been seen by the (single) consumer and are dropped."""
+        while self.changes and self.changes_base < cursor:
+            self.changes.popleft()
+            self.changes_base += 1
+        return list(islice(self.changes, max(0, cursor - self.changes_base), None)), self.changes_base + len(self.changes)
+
+    def set_small(self, card: Card, surfaces: List[pygame.Surface]):
+        """Small levels ordered like small_scales, the atlas levels are copied into their atlases."""
+        key = self.key(card)
+        self._drop_small(key)
+        levels = []
+        for scale, surface in zip(self.small_scales, surfaces):
+            if scale in self.atlas_scales:
+                size = surface.get_size()
+                atlas = self.atlases.get(size)
+                if atlas is None:
+                    atlas = self.atlases[size] = Texture_Atlas(size)
+                surface = atlas.add(key, surface)
+            levels.append(surface)
+        self._small[key] = sorted(levels, key=lambda s: s.get_width())
+        self.small_bytes += sum(surface_bytes(s) for s in self._small[key])
+        self._bump(key)
+
+    def add_large(self, card: Card, scale: float, surface: pygame.Surface):
+        key = self.key(card)
+        self._pending.discard((key, scale))
+        self._drop_large((key, scale))
+        self._large[(key, scale)] = surface
+        self.large_bytes += surface_bytes(surface)
+        self._bump(key)
+        self._evict()
+
+    def request_failed(self, card: Card, scales: List[float]):
+        key = self.key(card)
+        for scale in scales:
+            self._pending.discard((key, scale))
+
+    def source(self, card: Card, target_width: int) -> Optional[pygame.Surface]:
+        """Smallest resident level at least target_width wide. If there is none, the level that
+        would be is requested and the largest resident level is returned meanwhile."""
+        key = self.key(card)
+        small = self._small.get(key)
+        if not small:
+            return None
+        for surface in small:
+            if surface.get_width() >= target_width:
+                return surface
+
+        resident = []
+        for scale in self.large_scales:
+            surface = self._large.get((key, scale))
+            if surface is not None:
+                self._large.move_to_end((key, scale))
+                resident.append((scale, surface))
+
+        needed = self._needed_scale(target_width)
+        for scale, surface in resident:
+            if scale == needed:
+                return surface
+            if needed is not None and scale > needed:
+                # Derive the needed level from the next larger one instead of decoding again
+                derived = pygame.transform.smoothscale(surface, (level_width(needed), int(LM.CARD_PIXEL_DIMENSIONS[1] * needed)))
+                self.derived += 1
+                self.add_large(card, needed, derived)
+                return derived
+
+        if needed is not None:
+            self.request_level(card, needed)
+        return resident[-1][1] if resident else small[-1]
+
+    def needs_large(self, target_width: int) -> bool:
+        """True when cards drawn target_width wide are bigger than every small level."""
+        return bool(self.small_scales) and bool(self.large_scales) and level_width(max(self.small_scales)) < target_width
+
+    def prefetch(self, card: Card, target_width: int):
+        """Queue the large level source() would ask for at target_width, for a card about to be drawn
+        (e.g. in the cull margin), unless a level it can be made from is already resident."""
+        key = self.key(card)
+        if key not in self._small or not self.needs_large(target_width):
+            return
+        needed = self._needed_scale(target_width)
+        if any((key, scale) in self._large for scale in self.large_scales if scale >= needed):
+            return
+        self.request_level(card, needed)
+
+    def request_level(self, card: Card, scale: float):
+        key = self.key(card)
+        if (key, scale) in self._large or (key, scale) in self._pending or self.loader is None:
+            return
+        self._pending.add((key, scale))
+        self.loader(card, [scale])
+
+    def invalidate(self, card: Card):
+        """Forget every level of a card, e.g. after its image changed."""
+        key = self.key(card)
+        self._drop_small(key)
+        for scale in self.large_scales:
+            self._drop_large((key, scale))
+            self._pending.discard((key, scale))
+        self._bump(key)
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "cards": len(self._small),
+            "atlas_pages": sum(len(atlas.pages) for atlas in self.atlases.values()),
+            "atlas_mb": sum(atlas.page_bytes() for atlas in self.atlases.values()) / (1024 * 1024),
+            "large": len(self._large),
+            "small_mb": self.small_bytes / (1024 * 1024),
+            "large_mb": self.large_bytes / (1024 * 1024),
+            "budget_mb": self.budget_bytes / (1024 * 1024),
+            "evictions": self.evictions,
+            "derived": self.derived,
+        }
+
+    def _needed_scale(self, target_width: int) -> Optional[float]:
+        if not self.large_scales:
+            return None
+        return next((scale for scale in self.large_scales if level_width(scale) >= target_width), self.large_scales[-1])
+
+    def _bump(self, key: str):
+        self._generation[key] = self._generation.get(key, 0) + 1
+        self.changes.append(key)
+
+    def _drop_small(self, key: str):
+        self.small_bytes -= sum(surface_bytes(s) for s in self._small.pop(key, []))
+        for atlas in self.atlases.values():
+            atlas.remove(key)
+
+    def _drop_large(self, level_key: Tuple[str, float]):
+        surface = self._large.pop(level_key, None)
+        if surface is not None:
+            self.large_bytes -= surface_bytes(surface)
+
+    def _evict(self):
+        # Keep the most recent level even if it alone is over budget
+        while self.large_bytes > self.budget_bytes and len(self._large) > 1:
+            level_key = next(iter(self._large))
+            self._drop_large(level_key)
+            self._bump(level_key[0])
+            self.evictions += 1
@@ -0,0 +1,316 @@
+'''
+Binary snapshot of the card catalog.
+The snapshot file holds the card_data fields the UI and layout use as fixed-schema columns
+over a shared string table. The raw sorcery_data/curiosa_data payloads live in a side file
+that is memory-mapped and only decoded for the card that asks for them.
+Every write gets a new payload file name, recorded in the snapshot header, because the live
+lookup keeps the previous payload mapped (Windows cannot replace a mapped file). Payload files
+the snapshot no longer points at are removed once nothing maps them.
+'''
+import json
+import math
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+from collections.abc import Mapping
+from typing import Any, Dict, List, Optional, Tuple
+
+SNAPSHOT_MAGIC = b"SCAT"
+SNAPSHOT_VERSION = 3
+
+_HEADER = struct.Struct("<4sIII")  # magic, version, card count, string count
+_NAME = struct.Struct("<H")        # Length of the payload file name that follows the header
+_NONE = 0xFFFFFFFF                # Missing string in a string column
+_INT_NONE = -2 ** 31              # Missing value in an int column
+
+# --- Column schema, in file order ---
+STR_COLUMNS = ["name", "slug", "img_url", "rarity", "type", "rulesText"]
+INT_COLUMNS = ["cost", "attack", "defence", "life", "elements_count"]
+FLOAT_COLUMNS = ["hotscore"]
+LIST_COLUMNS = ["subTypes", "elements", "sets", "flavorText", "typeText", "artist"]
+THRESHOLD_KEYS = ["air", "earth", "fire", "water"]
+HASH_BYTES = 16                   # Per-card content hash of the raw payloads, see Util_IO._content_hash
+
+
+def _to_le(arr: array) -> array:
+    if sys.byteorder != "little":
+        arr = array(arr.typecode, arr)
+        arr.byteswap()
+    return arr
+
+
+def _read_array(typecode: str, buf, offset: int, count: int) -> Tuple[array, int]:
+    arr = array(typecode)
+    end = offset + count * arr.itemsize
+    arr.frombytes(buf[offset:end])
+    if sys.byteorder != "little":
+        arr.byteswap()
+    return arr, end
+
+
+def _fits_schema(card_data: Dict[str, Any]) -> bool:
+    """Check a card_data dict can round-trip through the fixed columns."""
+    known = set(STR_COLUMNS + INT_COLUMNS + FLOAT_COLUMNS + LIST_COLUMNS) | {"thresholds"}
+    if set(card_data) - known:
+        return False
+    for col in STR_COLUMNS:
+        if not isinstance(card_data.get(col), (str, type(None))):
+            return False
+    for col in INT_COLUMNS:
+        value = card_data.get(col)
+        if value is not None and (not isinstance(value, int) or isinstance(value, bool) or not -2 ** 31 < value < 2 ** 31):
+            return False
+    hotscore = card_data.get("hotscore")
+    if hotscore is not None and (not isinstance(hotscore, (int, float)) or isinstance(hotscore, bool)):
+        return False
+    for col in LIST_COLUMNS:
+        values = card_data.get(col, [])
+        if not isinstance(values, list) or not all(isinstance(v, str) for v in values):
+            return False
+    thresholds = card_data.get("thresholds") or {}
+    if not isinstance(thresholds, dict) or set(thresholds) - set(THRESHOLD_KEYS):
+        return False
+    return all(isinstance(v, int) and not isinstance(v, bool) and 0 <= v < 2 ** 31 for v in thresholds.values())
+
+
+def _remove_old_payloads(payload_path: str, keep: str):
+    # A payload still mapped by a running lookup cannot be removed on Windows, it goes on a later call
+    folder, prefix = os.path.split(payload_path)
+    for name in os.listdir(folder or "."):
+        if name != keep and (name == prefix or name.startswith(prefix + ".")):
+            try:
+                os.remove(os.path.join(folder, name))
+            except OSError:
+                pass
+
+
+def write_snapshot(card_data_list: List[Dict[str, Any]], card_data_lookup: Mapping, card_hashes: Dict[str, str],
+                   snapshot_path: str, payload_path: str) -> bool:
+    """Write the catalog snapshot and a new payload side file named after payload_path,
+    returns False if it could not be written."""
+    if not all(_fits_schema(cd) for cd in card_data_list):
+        print("⚠️ Card data does not fit the snapshot schema, skipping snapshot")
+        return False
+
+    strings: Dict[str, int] = {}
+
+    def intern(value: Optional[str]) -> int:
+        if value is None:
+            return _NONE
+        if value not in strings:
+            strings[value] = len(strings)
+        return strings[value]
+
+    str_cols = {col: array("I") for col in STR_COLUMNS}
+    int_cols = {col: array("i") for col in INT_COLUMNS}
+    float_cols = {col: array("d") for col in FLOAT_COLUMNS}
+    list_offsets = {col: array("I", [0]) for col in LIST_COLUMNS}
+    list_items = {col: array("I") for col in LIST_COLUMNS}
+    thresholds = array("i")    # 4 per card, -1 when the key is absent
+    payload_index = array("Q")  # offset, length per card
+    hashes = bytearray()
+
+    payload_name = f"{os.path.basename(payload_path)}.{time.time_ns():x}"
+    payload_tmp = os.path.join(os.path.dirname(payload_path), payload_name + ".tmp")
+    snapshot_tmp = snapshot_path + ".tmp"
+    try:
+        os.makedirs(os.path.dirname(payload_path), exist_ok=True)
+        with open(payload_tmp, "wb") as payload_file:
+            for cd in card_data_list:
+                for col in STR_COLUMNS:
+                    str_cols[col].append(intern(cd.get(col)))
+                for col in INT_COLUMNS:
+                    value = cd.get(col)
+                    int_cols[col].append(_INT_NONE if value is None else value)
+                for col in FLOAT_COLUMNS:
+                    value = cd.get(col)
+                    float_cols[col].append(math.nan if value is None else float(value))
+                for col in LIST_COLUMNS:
+                    list_items[col].extend(intern(v) for v in cd.get(col, []))
+                    list_offsets[col].append(len(list_items[col]))
+                card_thresholds = cd.get("thresholds") or {}
+                thresholds.extend(card_thresholds.get(key, -1) for key in THRESHOLD_KEYS)
+
+                hashes += bytes.fromhex(card_hashes[cd["name"]])
+                entry = card_data_lookup.get(cd["name"], {})
+                raw = json.dumps({"sorcery_data": entry.get("sorcery_data"),
+                                  "curiosa_data": entry.get("curiosa_data")},
+                                 ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+                payload_index.extend((payload_file.tell(), len(raw)))
+                payload_file.write(raw)
+
+        blob = bytearray()
+        string_offsets = array("I", [0])
+        for value in strings:  # dicts keep insertion order, matching the interned ids
+            blob += value.encode("utf-8")
+            string_offsets.append(len(blob))
+
+        with open(snapshot_tmp, "wb") as f:
+            f.write(_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(card_data_list), len(strings)))
+            f.write(_NAME.pack(len(payload_name.encode("utf-8"))))
+            f.write(payload_name.encode("utf-8"))
+            f.write(_to_le(string_offsets).tobytes())
+            f.write(blob)
+            for col in STR_COLUMNS:
+                f.write(_to_le(str_cols[col]).tobytes())
+            for col in INT_COLUMNS:
+                f.write(_to_le(int_cols[col]).tobytes())
+            for col in FLOAT_COLUMNS:
+                f.write(_to_le(float_cols[col]).tobytes())
+            for col in LIST_COLUMNS:
+                f.write(_to_le(list_offsets[col]).tobytes())
+                f.write(_to_le(list_items[col]).tobytes())
+            f.write(_to_le(thresholds).tobytes())
+            f.write(_to_le(payload_index).tobytes())
+            f.write(hashes)
+
+        os.replace(payload_tmp, os.path.join(os.path.dirname(payload_path), payload_name))
+        os.replace(snapshot_tmp, snapshot_path)
+    except (OSError, KeyError, ValueError) as e:
+        print(f"❌ Failed to write card snapshot: {e}")
+        for tmp in (payload_tmp, snapshot_tmp):
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        return False
+
+    _remove_old_payloads(payload_path, payload_name)
+    print(f"💾 Saved {os.path.basename(snapshot_path)} ({len(card_data_list)} cards) to {os.path.dirname(snapshot_path)}")
+    return True
+
+
+def load_snapshot(snapshot_path: str, payload_path: str) -> Optional[Tuple[List[Dict[str, Any]], "Card_Data_Lookup", Dict[str, str]]]:
+    """Read a snapshot into card_data dicts, a lazy lookup and content hashes, None if missing, stale or unreadable.
+    payload_path is the name the payload files were written under, the snapshot names the current one."""
+    if not os.path.exists(snapshot_path):
+        return None
+    try:
+        with open(snapshot_path, "rb") as f:
+            buf = f.read()
+        magic, version, n_cards, n_strings = _HEADER.unpack_from(buf, 0)
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            print(f"⚠️ Card snapshot version {version} does not match {SNAPSHOT_VERSION}, rebuilding")
+            return None
+
+        offset = _HEADER.size
+        (name_length,) = _NAME.unpack_from(buf, offset)
+        offset += _NAME.size
+        payload_name = buf[offset:offset + name_length].decode("utf-8")
+        offset += name_length
+        string_offsets, offset = _read_array("I", buf, offset, n_strings + 1)
+        blob = buf[offset:offset + string_offsets[-1]]
+        offset += string_offsets[-1]
+        strings = [blob[string_offsets[i]:string_offsets[i + 1]].decode("utf-8") for i in range(n_strings)]
+
+        str_cols, int_cols, float_cols, list_cols = {}, {}, {}, {}
+        for col in STR_COLUMNS:
+            str_cols[col], offset = _read_array("I", buf, offset, n_cards)
+        for col in INT_COLUMNS:
+            int_cols[col], offset = _read_array("i", buf, offset, n_cards)
+        for col in FLOAT_COLUMNS:
+            float_cols[col], offset = _read_array("d", buf, offset, n_cards)
+        for col in LIST_COLUMNS:
+            offsets, offset = _read_array("I", buf, offset, n_cards + 1)
+            items, offset = _read_array("I", buf, offset, offsets[-1])
+            list_cols[col] = (offsets, items)
+        thresholds, offset = _read_array("i", buf, offset, n_cards * len(THRESHOLD_KEYS))
+        payload_index, offset = _read_array("Q", buf, offset, n_cards * 2)
+        hashes = buf[offset:offset + n_cards * HASH_BYTES]
+        offset += n_cards * HASH_BYTES
+        if offset != len(buf):
+            raise ValueError("trailing or missing bytes")
+    except (OSError, struct.error, ValueError, UnicodeDecodeError) as e:
+        print(f"❌ Failed to read card snapshot: {e}")
+        return None
+
+    card_data_list = []
+    for i in range(n_cards):
+        cd: Dict[str, Any] = {}
+        for col in STR_COLUMNS:
+            cd[col] = None if str_cols[col][i] == _NONE else strings[str_cols[col][i]]
+        for col in INT_COLUMNS:
+            cd[col] = None if int_cols[col][i] == _INT_NONE else int_cols[col][i]
+        for col in FLOAT_COLUMNS:
+            value = float_cols[col][i]
+            # Integral scores were written as ints in the JSON, keep them that way
+            cd[col] = None if math.isnan(value) else (int(value) if value.is_integer() else value)
+        for col in LIST_COLUMNS:
+            offsets, items = list_cols[col]
+            cd[col] = [strings[items[j]] for j in range(offsets[i], offsets[i + 1])]
+        card_thresholds = thresholds[i * len(THRESHOLD_KEYS):(i + 1) * len(THRESHOLD_KEYS)]
+        cd["thresholds"] = {key: value for key, value in zip(THRESHOLD_KEYS, card_thresholds) if value >= 0}
+        card_data_list.append(cd)
+
+    try:
+        lookup = Card_Data_Lookup(card_data_list, payload_index, os.path.join(os.path.dirname(payload_path), payload_name))
+    except (OSError, ValueError) as e:
+        print(f"❌ Failed to map card payloads: {e}")
+        return None
+    _remove_old_payloads(payload_path, payload_name)
+    card_hashes = {cd["name"]: hashes[i * HASH_BYTES:(i + 1) * HASH_BYTES].hex() for i, cd in enumerate(card_data_list)}
+    return card_data_list, lookup, card_hashes
+
+
+class Card_Entry(Mapping):
+    """One card_data_lookup entry: card_data is in memory, the raw API payloads are decoded on first access."""
+
+    def __init__(self, lookup: "Card_Data_Lookup", index: int, card_data: Dict[str, Any]):
+        self._lookup = lookup
+        self._index = index
+        self._card_data = card_data
+        self._payload: Optional[Dict[str, Any]] = None
+
+    def __getitem__(self, key: str):
+        if key == "card_data":
+            return self._card_data
+        if key in ("sorcery_data", "curiosa_data"):
+            if self._payload is None:
+                self._payload = self._lookup._read_payload(self._index)
+            return self._payload[key]
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(("sorcery_data", "curiosa_data", "card_data"))
+
+    def __len__(self):
+        return 3
+
+
+class Card_Data_Lookup(Mapping):
+    """Read-only name -> entry mapping with the same shape as the All_CardData.json dict."""
+
+    def __init__(self, card_data_list: List[Dict[str, Any]], payload_index: array, payload_path: str):
+        self._payload_index = payload_index
+        self._file = open(payload_path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        # mmap refuses empty files, an empty catalog has nothing to decode anyway
+        expected = payload_index[-2] + payload_index[-1] if payload_index else 0
+        if size != expected:
+            self._file.close()
+            raise ValueError(f"payload file is {size} bytes, snapshot expects {expected}")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        self._entries = {cd["name"]: Card_Entry(self, i, cd) for i, cd in enumerate(card_data_list)}
+
+    def __getitem__(self, name: str) -> Card_Entry:
+        return self._entries[name]
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, name):
+        return name in self._entries
+
+    def _read_payload(self, index: int) -> Dict[str, Any]:
+        start, length = self._payload_index[2 * index], self._payload_index[2 * index + 1]
+        return json.loads(self._mm[start:start + length].decode("utf-8"))
+
+    def close(self):
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        self._file.close()
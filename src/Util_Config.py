@@ -1,9 +1,11 @@
 """
 Configuration settings for the Deck Builder application.
 """
+import os
 
 # Debug mode - set to True to enable debug messages
 IN_DEBUG_MODE = True
+DEBUG_REFRESH_S = 0.25  # Seconds between debug overlay refreshes
 
 # Asset paths
 BACKGROUND_ASSET_DIR = "assets/Backgrounds"
@@ -19,6 +21,35 @@ MIN_ZOOM = 0.1
 MAX_ZOOM = 3.0
 DEFAULT_ZOOM = 1.0
 
+# Level of detail when zoomed out
+LOD_FAR_ZOOM = 0.2   # Below this, cards are flat colour rects by element and rarity
+LOD_MID_ZOOM = 0.5   # Below this, thumbnails are scaled without smoothing and the grid shows major lines only
+GRID_MAJOR_EVERY = 5  # Grid cells per major line
+
+# Frame pacing
+RENDER_ON_CHANGE = True  # Only redraw on input, loaded images or animation, otherwise idle
+ACTIVE_FPS = 60          # Frame rate while something changes
+IDLE_FPS = 4             # Polling rate once nothing has changed for IDLE_AFTER_S
+IDLE_AFTER_S = 0.5       # Keep the full rate this long after the last change (UI transitions, hover)
+
+# Startup
+LAZY_STARTUP = True  # Open with the local card data and check the card APIs in the background
+
+# Image loading
+IMAGE_FETCH_WORKERS = 8                                   # Threads reading or downloading card images
+IMAGE_DECODE_WORKERS = max(1, (os.cpu_count() or 2) - 1)  # Processes decoding and resizing thumb levels
+IMAGE_FETCH_QUEUE_SIZE = 32                               # Fetched images waiting for a decode process
+IMAGE_READY_QUEUE_SIZE = 16                               # Decoded images waiting for the main thread
+IMAGE_HANDOFF_BUDGET_MS = 2.0                             # Main thread time per frame for turning decoded images into surfaces
+MIP_PACK_MAX_SCALE = 1/4                                  # Thumb levels up to this scale are kept in the mip pack
+ATLAS_MAX_SCALE = 1/8                                     # Thumb levels up to this scale share texture atlases
+
+# Render caches
+SURFACE_CACHE_MAX_MB = 256  # Scaled card surfaces kept ready to blit
+TEXTURE_BUDGET_MB = 512     # Large card image levels loaded on demand, small levels are always resident
+TILE_CACHE_MAX_MB = 128     # Pre-rendered tiles of the grid and base cards
+TILE_BUILD_BUDGET_MS = 4.0  # Main thread time per frame for rendering missing tiles
+
 # Colors
 BACKGROUND_COLOR = (40, 40, 40)
 GRID_COLOR = (60, 60, 60)
@@ -2,6 +2,7 @@ import pygame
 import time
 import Util_Config as config
 from typing import List, Optional
+from Util_Text_Cache import text_cache
 
 
 class DebugDisplay:
@@ -30,11 +31,12 @@ class DebugDisplay:
         """Initialize the debug display."""
         self.screen = screen
         self.clock = clock
-        self.font = pygame.font.Font(None, 24)
+        self.font_size = 24  # pygame's default font, rendered through the shared text cache
         self.padding = 10
         self.line_height = 25
         self.background_color = (0, 0, 0, 128)  # Semi-transparent black
         self.text_color = (255, 255, 255)  # White text
+        self.background: Optional[pygame.Surface] = None  # Reused while the panel size stays the same
     
     @classmethod
     def add_message(cls, message: str) -> None:
@@ -79,11 +81,9 @@ class DebugDisplay:
         if not cls._messages:
             return
             
-        # Calculate display dimensions
-        max_width = 0
-        for message in cls._messages:
-            text_surface = instance.font.render(message, True, instance.text_color)
-            max_width = max(max_width, text_surface.get_width())
+        # Calculate display dimensions, each message is rendered once and reused to draw
+        text_surfaces = [text_cache.render(message, instance.text_color, instance.font_size, None) for message in cls._messages]
+        max_width = max(text_surface.get_width() for text_surface in text_surfaces)
         
         total_height = len(cls._messages) * instance.line_height
         display_rect = pygame.Rect(
@@ -94,14 +94,14 @@ class DebugDisplay:
         )
         
         # Draw background
-        background = pygame.Surface(display_rect.size, pygame.SRCALPHA)
-        background.fill(instance.background_color)
-        instance.screen.blit(background, display_rect)
+        if instance.background is None or instance.background.get_size() != display_rect.size:
+            instance.background = pygame.Surface(display_rect.size, pygame.SRCALPHA)
+            instance.background.fill(instance.background_color)
+        instance.screen.blit(instance.background, display_rect)
         
         # Draw messages
         y = display_rect.top + instance.padding
-        for message in cls._messages:
-            text_surface = instance.font.render(message, True, instance.text_color)
+        for text_surface in text_surfaces:
             instance.screen.blit(text_surface, (display_rect.left + instance.padding, y))
             y += instance.line_height 
             
\ No newline at end of file
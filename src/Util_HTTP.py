@@ -0,0 +1,102 @@
+'''
+Shared HTTP client for the card APIs and image downloads.
+One requests.Session per host keeps connections alive between calls, so bulk image and
+deck downloads reuse a handful of TLS connections instead of handshaking per request.
+Every request gets the same default timeout and connection-error retry policy, and its
+latency is recorded per host for the debug overlay.
+'''
+import threading
+import time
+from collections import defaultdict, deque
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any, Deque, Dict
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+HTTP_TIMEOUT = (5, 20)       # (connect, read) seconds, used when a caller does not pass its own
+HTTP_POOL_MAXSIZE = 16       # Connections per host (a hard cap), matches the busiest worker pools
+HTTP_RETRIES = 2             # Connection errors and 502/503/504, 429 is left to the caller
+LATENCY_WINDOW = 200         # Recent requests per host kept for the percentiles
+
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+_latencies: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=LATENCY_WINDOW))
+_counts: Dict[str, Dict[str, int]] = defaultdict(lambda: {"requests": 0, "errors": 0})
+_stats_lock = threading.Lock()
+
+
+def _new_session() -> requests.Session:
+    session = requests.Session()
+    # Calls were stateless before the pool, keep it that way: auth cookies are passed explicitly in headers
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    retry = Retry(total=HTTP_RETRIES, connect=HTTP_RETRIES, read=HTTP_RETRIES, status=HTTP_RETRIES,
+                  backoff_factor=0.5, status_forcelist=(502, 503, 504),
+                  allowed_methods=frozenset({"GET", "HEAD"}), raise_on_status=False)
+    # pool_block: past pool_maxsize callers wait for a free connection instead of urllib3 opening
+    # (and then discarding) extra ones, so the per-host connection cap holds
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_MAXSIZE, pool_block=True, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def session_for(url: str) -> requests.Session:
+    host = urlsplit(url).netloc
+    with _sessions_lock:
+        session = _sessions.get(host)
+        if session is None:
+            session = _sessions[host] = _new_session()
+        return session
+
+
+def http_get(url: str, **kwargs: Any) -> requests.Response:
+    """requests.get through the pooled session for the url's host."""
+    kwargs.setdefault("timeout", HTTP_TIMEOUT)
+    host = urlsplit(url).netloc
+    start = time.perf_counter()
+    try:
+        response = session_for(url).get(url, **kwargs)
+    except requests.RequestException:
+        _record(host, time.perf_counter() - start, error=True)
+        raise
+    _record(host, time.perf_counter() - start, error=not response.ok)
+    return response
+
+
+def _record(host: str, seconds: float, error: bool):
+    with _stats_lock:
+        _latencies[host].append(seconds * 1000)
+        _counts[host]["requests"] += 1
+        if error:
+            _counts[host]["errors"] += 1
+
+
+def _percentile(values, pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def stats() -> Dict[str, Dict[str, float]]:
+    """Per-host request counts and latency (ms) over the recent window."""
+    with _stats_lock:
+        return {
+            host: {
+                "requests": _counts[host]["requests"],
+                "errors": _counts[host]["errors"],
+                "p50": _percentile(latencies, 0.5),
+                "p95": _percentile(latencies, 0.95),
+                "max": max(latencies, default=0.0),
+            }
+            for host, latencies in _latencies.items()
+        }
+
+
+def close():
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
@@ -1,5 +1,6 @@
 import os
 import json
+import hashlib
 from typing import Dict, Any, Optional, Generator, List, Tuple, Callable
 import tkinter.filedialog
 from multiprocessing import Process, Queue
@@ -12,8 +13,14 @@ SORCERY_DATA_PATH = os.path.join(DATA_PATH, "Sorcery_CardData.json")
 CURIOSA_DATA_PATH = os.path.join(DATA_PATH, "Curiosa_CardData.json")
 BASE_DATA_PATH = os.path.join(DATA_PATH, "Base_CardData.json")
 ALL_CARD_DATA_PATH = os.path.join(DATA_PATH, "All_CardData.json")
+CARD_SNAPSHOT_PATH = os.path.join(DATA_PATH, "CardData.snapshot")
+CARD_PAYLOAD_PATH = os.path.join(DATA_PATH, "CardData.payload")
+
+CURIOSA_FETCH_PROGRESS_PATH = os.path.join(TMP_PATH, "Curiosa_Fetch_Progress.json")
 
 CARD_ASSETS_PATH = "assets/Cards"
+MIP_PACK_PATH = os.path.join(CARD_ASSETS_PATH, "Card_Mips.pack")
+MIP_INDEX_PATH = os.path.join(CARD_ASSETS_PATH, "Card_Mips.json")
 DECK_PATH = "data/Decks"
 COLLECTION_PATH = "data/Collection"
 
@@ -25,6 +32,12 @@ def _save_json(data: Any, filename: str):
     print(f"💾 Saved {os.path.basename(filename)} to {os.path.dirname(filename)}")
 
 
+def _content_hash(*payloads: Any) -> str:
+    # Key order does not matter, so a re-ordered API response hashes the same
+    data = json.dumps(payloads, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.blake2b(data.encode("utf-8"), digest_size=16).hexdigest()
+
+
 def _save_text(data: str, filename: str):
     os.makedirs(os.path.dirname(filename), exist_ok=True)
     with open(filename, "w", encoding="utf-8") as f:
@@ -0,0 +1,110 @@
+'''
+Persistent pack of pre-resized card thumbnails.
+The pack file is an append-only run of raw RGBA pixels for the small thumb levels of every card
+image. The JSON index maps each image file (by name, size and mtime) to the blake2b hash of its
+bytes, and each hash to where its levels sit in the pack. At startup the pack is memory-mapped
+and surfaces are built straight on the mapped pages, nothing is decoded or resampled.
+'''
+import json
+import mmap
+import os
+from typing import Any, Dict, List, Optional, Tuple
+import pygame
+
+MIP_PACK_VERSION = 1
+
+Image_Key = Tuple[str, int, int, str]  # (image file name, size, mtime_ns, content hash)
+
+
+class Mip_Pack:
+    def __init__(self, pack_path: str, index_path: str, thumb_levels: List[float], max_scale: float):
+        self.pack_path = pack_path
+        self.index_path = index_path
+        self.thumb_levels = list(thumb_levels)
+        self.packed_levels = [scale for scale in thumb_levels if scale <= max_scale]
+        self.files: Dict[str, Dict[str, Any]] = {}    # file name -> {"size", "mtime_ns", "hash"}
+        self.entries: Dict[str, Dict[str, Any]] = {}  # content hash -> {"offset", "sizes"}
+        self.dirty = False
+        self._mm: Optional[mmap.mmap] = None
+        self._view: Optional[memoryview] = None
+        self._mapped_size = 0
+        self.load()
+
+    def load(self):
+        if not (os.path.exists(self.index_path) and os.path.exists(self.pack_path)):
+            return
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Ignoring unreadable mip pack index: {e}")
+            return
+        if index.get("version") != MIP_PACK_VERSION or index.get("levels") != self.packed_levels:
+            print("⚠️ Mip pack was built for other thumb levels, rebuilding it")
+            os.remove(self.pack_path)
+            return
+
+        size = os.path.getsize(self.pack_path)
+        self.files = index.get("files", {})
+        # Entries past the end belong to a pack that was cut short, drop them
+        self.entries = {content_hash: entry for content_hash, entry in index.get("entries", {}).items()
+                        if entry["offset"] + sum(w * h * 4 for w, h in entry["sizes"]) <= size}
+        if size:
+            with open(self.pack_path, "rb") as f:
+                # Copy-on-write so pygame can wrap the pages as (writable) surface pixels
+                self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+            self._view = memoryview(self._mm)
+            self._mapped_size = size
+        print(f"📁 Mapped mip pack with {len(self.entries)} card images ({size / (1024 * 1024):.0f} MB)")
+
+    def lookup(self, filename: str) -> Optional[str]:
+        """Content hash of an image file if its thumbnails are in the mapped pack."""
+        record = self.files.get(os.path.basename(filename))
+        if record is None:
+            return None
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            return None
+        if stat.st_size != record["size"] or stat.st_mtime_ns != record["mtime_ns"]:
+            return None
+        entry = self.entries.get(record["hash"])
+        if entry is None or entry["offset"] >= self._mapped_size:
+            return None  # Added this session, only mapped on the next launch
+        return record["hash"]
+
+    def surfaces(self, content_hash: str) -> List[pygame.Surface]:
+        """Surfaces for the packed levels, sharing memory with the mapped pack."""
+        entry = self.entries[content_hash]
+        offset = entry["offset"]
+        surfaces = []
+        for w, h in entry["sizes"]:
+            nbytes = w * h * 4
+            surfaces.append(pygame.image.frombuffer(self._view[offset:offset + nbytes], (w, h), "RGBA"))
+            offset += nbytes
+        return surfaces
+
+    def add(self, image_key: Image_Key, levels: List[Tuple[Tuple[int, int], bytes]]):
+        """Append the packed levels of a freshly decoded image, levels ordered like packed_levels (smallest first)."""
+        name, size, mtime_ns, content_hash = image_key
+        self.files[name] = {"size": size, "mtime_ns": mtime_ns, "hash": content_hash}
+        self.dirty = True
+        if content_hash in self.entries:
+            return
+        os.makedirs(os.path.dirname(self.pack_path), exist_ok=True)
+        with open(self.pack_path, "ab") as f:
+            offset = f.tell()
+            for _, raw in levels:
+                f.write(raw)
+        self.entries[content_hash] = {"offset": offset, "sizes": [list(level_size) for level_size, _ in levels]}
+
+    def flush(self):
+        if not self.dirty:
+            return
+        os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": MIP_PACK_VERSION, "levels": self.packed_levels,
+                       "files": self.files, "entries": self.entries}, f)
+        os.replace(tmp_path, self.index_path)
+        self.dirty = False
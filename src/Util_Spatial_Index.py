@@ -0,0 +1,113 @@
+import math
+import threading
+from collections import defaultdict
+from typing import Dict, Hashable, List, Set, Tuple
+import Layout_Manager as LM
+
+
+class Spatial_Index:
+    """
+    Uniform grid over world space mapping card instances to their top-left position.
+    Keys follow the selection key format: (card_name, deck_id, board_name, entry_id),
+    with deck_id, board_name and entry_id set to None for base cards.
+    Queries cost time proportional to the cells they touch and the cards they return,
+    not to the total number of cards on the canvas.
+    Keys inserted, moved or removed are logged until drain_changes(), so a consumer such as
+    the render list can follow the index incrementally.
+    """
+
+    def __init__(self, cell_size: int = LM.GRID_SPACING * LM.LONG_EDGE_SNAP_RATIO,
+                 max_extent: int = max(LM.CARD_DIMENSIONS)):
+        self.cell_size = cell_size
+        self.max_extent = max_extent  # Largest card edge in world units (sites are rotated)
+        self._cells: Dict[Tuple[int, int], Set[Hashable]] = defaultdict(set)
+        self._positions: Dict[Hashable, Tuple[float, float]] = {}
+        self._changed: Set[Hashable] = set()
+        self._lock = threading.RLock()  # Layout runs on the loader thread while the GUI queries
+
+    def __len__(self):
+        return len(self._positions)
+
+    def __contains__(self, key: Hashable):
+        return key in self._positions
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+
+    def insert(self, key: Hashable, position: Tuple[float, float]):
+        """Add a card instance or move it to a new position."""
+        with self._lock:
+            self._changed.add(key)
+            old = self._positions.get(key)
+            if old is not None:
+                old_cell = self._cell(*old)
+                if old_cell == self._cell(*position):
+                    self._positions[key] = position
+                    return
+                self._discard_from_cell(old_cell, key)
+            self._positions[key] = position
+            self._cells[self._cell(*position)].add(key)
+
+    def remove(self, key: Hashable):
+        with self._lock:
+            old = self._positions.pop(key, None)
+            if old is not None:
+                self._changed.add(key)
+                self._discard_from_cell(self._cell(*old), key)
+
+    def remove_where(self, predicate):
+        """Remove every key matching predicate, e.g. all entries of one deck."""
+        with self._lock:
+            for key in [k for k in self._positions if predicate(k)]:
+                self.remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._changed.update(self._positions)
+            self._cells.clear()
+            self._positions.clear()
+
+    def drain_changes(self) -> Dict[Hashable, Tuple[float, float] | None]:
+        """Keys changed since the last call, mapped to their position now (None once removed)."""
+        with self._lock:
+            changes = {key: self._positions.get(key) for key in self._changed}
+            self._changed.clear()
+            return changes
+
+    def position(self, key: Hashable) -> Tuple[float, float] | None:
+        return self._positions.get(key)
+
+    def query_rect(self, min_x: float, min_y: float, max_x: float, max_y: float) -> List[Tuple[Hashable, Tuple[float, float]]]:
+        """Return (key, position) for every card whose footprint may overlap the world rect."""
+        # A card can reach into the rect from up to max_extent to the left and above
+        min_x -= self.max_extent
+        min_y -= self.max_extent
+        cx0, cy0 = self._cell(min_x, min_y)
+        cx1, cy1 = self._cell(max_x, max_y)
+
+        results = []
+        with self._lock:
+            if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > len(self._cells):
+                # Zoomed far out: more cells in range than occupied, walk the occupied ones
+                cells = [keys for (cx, cy), keys in self._cells.items()
+                         if cx0 <= cx <= cx1 and cy0 <= cy <= cy1]
+            else:
+                cells = [self._cells[cell] for cell in
+                         ((cx, cy) for cx in range(cx0, cx1 + 1) for cy in range(cy0, cy1 + 1))
+                         if cell in self._cells]
+            for keys in cells:
+                for key in keys:
+                    x, y = self._positions[key]
+                    if min_x <= x <= max_x and min_y <= y <= max_y:
+                        results.append((key, (x, y)))
+        return results
+
+    def query_point(self, x: float, y: float) -> List[Tuple[Hashable, Tuple[float, float]]]:
+        return self.query_rect(x, y, x, y)
+
+    def _discard_from_cell(self, cell: Tuple[int, int], key: Hashable):
+        keys = self._cells.get(cell)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._cells[cell]
@@ -0,0 +1,58 @@
+'''
+Shared cache of rendered text surfaces.
+Overlays redraw the same strings every frame (debug lines, region labels, progress text), so
+renders are kept per (font, size, text, colour) and reused until they fall out of an LRU
+bounded by bytes. Fonts are loaded once per (font, size) and kept in a small LRU of their own,
+zoom-scaled labels ask for a new size at nearly every zoom level.
+'''
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+import pygame
+from Texture_Manager import surface_bytes
+
+Colour = Tuple[int, ...]
+
+
+class Text_Cache:
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024, max_fonts: int = 32):
+        self.max_bytes = max_bytes
+        self.max_fonts = max_fonts
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._fonts: "OrderedDict[Tuple[Optional[str], int], pygame.font.Font]" = OrderedDict()
+        self._texts: "OrderedDict[Tuple[Optional[str], int, str, Colour], pygame.Surface]" = OrderedDict()
+
+    def font(self, font_name: Optional[str], size: int) -> pygame.font.Font:
+        """A system font by name, or pygame's default font for None."""
+        key = (font_name, size)
+        font = self._fonts.get(key)
+        if font is not None:
+            self._fonts.move_to_end(key)
+            return font
+        font = pygame.font.Font(None, size) if font_name is None else pygame.font.SysFont(font_name, size)
+        self._fonts[key] = font
+        while len(self._fonts) > self.max_fonts:
+            self._fonts.popitem(last=False)
+        return font
+
+    def render(self, text: str, colour: Colour, size: int = 24, font_name: Optional[str] = "Arial") -> pygame.Surface:
+        key = (font_name, max(1, size), text, tuple(colour))
+        surface = self._texts.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._texts.move_to_end(key)
+            return surface
+        self.misses += 1
+        surface = self.font(font_name, key[1]).render(text, True, colour)
+        self._texts[key] = surface
+        self.used_bytes += surface_bytes(surface)
+        while self.used_bytes > self.max_bytes and len(self._texts) > 1:
+            self.used_bytes -= surface_bytes(self._texts.popitem(last=False)[1])
+        return surface
+
+    def stats(self) -> Dict[str, float]:
+        return {"texts": len(self._texts), "fonts": len(self._fonts), "mb": self.used_bytes / (1024 * 1024), "hits": self.hits, "misses": self.misses}
+
+
+text_cache = Text_Cache()  # Shared by every overlay
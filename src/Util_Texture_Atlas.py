@@ -0,0 +1,56 @@
+'''
+Texture atlas for same-sized card thumbnails.
+Every card image level of one size gets a cell on a shared page surface, pages are added as
+cells run out and freed cells are reused. Cards hand out subsurfaces of their cell, which share
+the page's pixels, so a thousand thumbnails are a handful of allocations rather than a thousand.
+'''
+from typing import Dict, List, Tuple
+import pygame
+
+ATLAS_CELLS_PER_PAGE = 256  # 16 x 16 cells, ~12 MB per page at 1/8 scale
+
+
+class Texture_Atlas:
+    def __init__(self, cell_size: Tuple[int, int], cells_per_page: int = ATLAS_CELLS_PER_PAGE):
+        self.cell_size = cell_size
+        self.columns = max(1, int(cells_per_page ** 0.5))
+        self.rows = max(1, cells_per_page // self.columns)
+        self.pages: List[pygame.Surface] = []
+        self._free: List[Tuple[int, int]] = []          # (page, cell) ready for reuse
+        self._slots: Dict[str, Tuple[int, int]] = {}    # key -> (page, cell)
+
+    def __len__(self):
+        return len(self._slots)
+
+    def add(self, key: str, surface: pygame.Surface) -> pygame.Surface:
+        """Copy surface into the key's cell and return the cell as a subsurface of its page."""
+        page, rect = self._allocate(key)
+        # Zero the cell then take the max per channel, an exact copy of the pixels and their
+        # alpha (a normal blit would blend the card's transparent corners with the cell)
+        page.fill((0, 0, 0, 0), rect)
+        page.blit(surface, rect.topleft, special_flags=pygame.BLEND_RGBA_MAX)
+        return page.subsurface(rect)
+
+    def remove(self, key: str):
+        slot = self._slots.pop(key, None)
+        if slot is not None:
+            self._free.append(slot)
+
+    def page_bytes(self) -> int:
+        return sum(page.get_width() * page.get_height() * page.get_bytesize() for page in self.pages)
+
+    def _allocate(self, key: str) -> Tuple[pygame.Surface, pygame.Rect]:
+        slot = self._slots.get(key)
+        if slot is None:
+            if not self._free:
+                width, height = self.cell_size
+                # SRCALPHA rather than convert_alpha, the display may not exist yet when the mip pack loads
+                self.pages.append(pygame.Surface((width * self.columns, height * self.rows), pygame.SRCALPHA))
+                page_index = len(self.pages) - 1
+                self._free = [(page_index, cell) for cell in reversed(range(self.columns * self.rows))]
+            slot = self._slots[key] = self._free.pop()
+        return self.pages[slot[0]], self._rect(slot[1])
+
+    def _rect(self, cell: int) -> pygame.Rect:
+        width, height = self.cell_size
+        return pygame.Rect((cell % self.columns) * width, (cell // self.columns) * height, width, height)
@@ -1,9 +1,11 @@
-from Card_Manager import Card_Manager
-from Deck_Manager import Deck_Manager
-from Collection_Manager import Collection_Manager
-from GUI_Manager import GUI_Manager
-
 if __name__ == "__main__":
+    # Imported here rather than at the top: spawned decode workers re-run this module's
+    # top level, and should not pull in pygame, the GUI or playwright
+    from Card_Manager import Card_Manager
+    from Deck_Manager import Deck_Manager
+    from Collection_Manager import Collection_Manager
+    from GUI_Manager import GUI_Manager
+
     card_manager = Card_Manager()
     deck_manager = Deck_Manager()
     collection_manager = Collection_Manager(card_manager, deck_manager)